@@ -0,0 +1,240 @@
+"""
+Performance benchmarks for the CoinsAndDices engines.
+
+Usage:
+    python benchmark.py              # run every benchmark
+    python benchmark.py coin_engines # run selected benchmarks by name
+"""
+import io
+import sys
+import time
+from typing import Any, Callable, Dict, List
+import numpy as np
+import torch
+from coins_and_dices.coin_buffer import CoinBuffer
+from coins_and_dices.coin_engine import COIN_ENGINES, BiasedCoinEngine, BinomialCoinEngine, PackedCoinEngine
+from coins_and_dices.constants import ITEMS_PER_LINE, MAX_ROLLS_PER_LINE, RENDER_TICK_BUDGET
+from coins_and_dices.dice_distribution import keep_distribution, plan_distribution, sum_distribution
+from coins_and_dices.dice_engine import DiceEngine
+from coins_and_dices.dice_expression import compile_dice_expression, roll_plans
+from coins_and_dices.progressive_renderer import iter_line_blocks
+from coins_and_dices.roll_formatter import format_numbers
+
+DEVICE: torch.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+
+def time_call(func: Callable[..., Any], *args: Any, repeat: int = 3) -> float:
+    """
+    Time a call, keeping the best of several runs
+    Parameters:
+        func (callable): Function to benchmark
+        args: Positional arguments for the function
+        repeat (int): Number of runs
+    Returns:
+        float: Best wall time in seconds
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        if DEVICE.type == 'cuda':
+            torch.cuda.synchronize()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_coin_engines(sizes: List[int] = [1_000_000, 10_000_000], biased_p: float = 0.3) -> None:
+    """
+    Compare flips per second of every coin engine against the packed one;
+    the biased engine also runs at an unround p, which needs every binary digit
+    """
+    print(f"{'engine':<12} {'flips':>12} {'time':>12} {'flips/s':>16} {'vs packed':>10}")
+    for size in sizes:
+        engines = [(name, engine_class(DEVICE)) for name, engine_class in COIN_ENGINES.items()]
+        engines.append((f"biased {biased_p}", BiasedCoinEngine(DEVICE, biased_p)))
+        timings = [(name, time_call(engine.flip, size)) for name, engine in engines]
+        packed = dict(timings)[PackedCoinEngine.name]
+        for name, elapsed in timings:
+            print(
+                f"{name:<12} {size:>12,} {elapsed * 1000:>9.1f} ms {size / elapsed:>16,.0f} "
+                f"{packed / elapsed:>9.2f}x"
+            )
+
+def bench_coin_counts(sizes: List[int] = [10_000_000, 10**9, 10**12]) -> None:
+    """
+    Time counts-only runs of the binomial engine
+    """
+    engine = BinomialCoinEngine(DEVICE)
+    print(f"{'flips':>18} {'time':>12}")
+    for size in sizes:
+        elapsed = time_call(engine.count, size)
+        print(f"{size:>18,} {elapsed * 1000:>9.3f} ms")
+
+def legacy_sequence_display(results: CoinBuffer) -> str:
+    """
+    Replay the former cell update loop without wx: every line of 12 flips
+    re-read the cell, rebuilt the whole text and slept 1 ms
+    Parameters:
+        results (CoinBuffer): Flips to display
+    Returns:
+        str: Final cell text
+    """
+    cell = ""
+    buffer = []
+    for result in results:
+        buffer.append(result)
+        if len(buffer) >= ITEMS_PER_LINE:
+            formatted = ' → '.join(buffer)
+            cell = f"{cell}\n{formatted}" if cell else formatted
+            buffer.clear()
+            time.sleep(0.001)
+    if buffer:
+        formatted = ' → '.join(buffer)
+        cell = f"{cell}\n{formatted}" if cell else formatted
+    return cell
+
+def progressive_sequence_display(results: CoinBuffer) -> str:
+    """
+    Replay the progressive renderer without wx: blocks are appended to a
+    buffer and, at the end of a render frame, the cell text is produced once
+    the production since the last redraw outweighs that redraw
+    Parameters:
+        results (CoinBuffer): Flips to display
+    Returns:
+        str: Final cell text
+    """
+    buffer = io.StringIO()
+    cell = ""
+    draw_cost = undrawn = 0.0
+    start = time.perf_counter()
+    deadline = start + RENDER_TICK_BUDGET
+    for block in iter_line_blocks(results.format_lines, len(results), ITEMS_PER_LINE):
+        if buffer.tell():
+            buffer.write("\n")
+        buffer.write(block)
+        if time.perf_counter() >= deadline:
+            drawn = time.perf_counter()
+            undrawn += drawn - start
+            if undrawn >= draw_cost:
+                cell = buffer.getvalue()  # Frame redraw
+                draw_cost, undrawn = time.perf_counter() - drawn, 0.0
+            start = time.perf_counter()
+            deadline = start + RENDER_TICK_BUDGET
+    return buffer.getvalue()
+
+def bench_sequence_display(
+    legacy_sizes: List[int] = [10_000, 100_000],
+    sizes: List[int] = [10_000, 100_000, 1_000_000]
+) -> None:
+    """
+    Compare the former quadratic Full-mode display with the progressive renderer
+    """
+    engine = PackedCoinEngine(DEVICE)
+    print(f"{'renderer':<12} {'flips':>12} {'time':>12}")
+    for size in legacy_sizes:
+        elapsed = time_call(legacy_sequence_display, engine.flip(size), repeat=1)
+        print(f"{'legacy':<12} {size:>12,} {elapsed * 1000:>9.1f} ms")
+    for size in sizes:
+        elapsed = time_call(progressive_sequence_display, engine.flip(size))
+        print(f"{'progressive':<12} {size:>12,} {elapsed * 1000:>9.1f} ms")
+
+def exact_distribution(notation: str) -> None:
+    """
+    Build the exact distribution of an expression from an empty cache
+    """
+    sum_distribution.cache_clear()
+    keep_distribution.cache_clear()
+    plan_distribution.cache_clear()
+    plan_distribution(compile_dice_expression(notation))
+
+def bench_dice_distribution(notations: List[str] = ['3d6', '1000d20', '10000d20', '100000d6', '2d6+1d8-1d4+3']) -> None:
+    """
+    Time exact sum distributions built by FFT convolution and squaring
+    """
+    print(f"{'notation':<16} {'totals':>12} {'time':>12}")
+    for notation in notations:
+        elapsed = time_call(exact_distribution, notation)
+        totals = len(plan_distribution(compile_dice_expression(notation)))
+        print(f"{notation:<16} {totals:>12,} {elapsed * 1000:>9.2f} ms")
+
+def bench_dice_fused(counts: List[int] = [1, 10, 100, 500]) -> None:
+    """
+    Time rolling many small notations one by one versus in one fused draw
+    """
+    engine = DiceEngine(torch.device(DEVICE))
+    print(f"{'notations':>10} {'one by one':>12} {'fused':>12} {'speedup':>8}")
+    for count in counts:
+        plans = [compile_dice_expression(f"{i % 9 + 1}d{i % 97 + 2}") for i in range(count)]
+        separate = time_call(lambda: [plan.roll(engine) for plan in plans])
+        fused = time_call(roll_plans, plans, engine)
+        print(f"{count:>10} {separate * 1000:>9.2f} ms {fused * 1000:>9.2f} ms {separate / fused:>7.1f}x")
+
+def bench_dice_keep(notations: List[str] = ['4d6kh3', '2d20kh1', '2d20kl1', '10d10kh3'], trials: int = 1_000_000) -> None:
+    """
+    Time batched keep-highest/lowest trials and compare them with the exact odds
+    """
+    engine = DiceEngine(torch.device(DEVICE))
+    print(f"{'notation':<12} {'trials':>12} {'exact':>12} {'mean':>10} {'exact mean':>11}")
+    for notation in notations:
+        plan = compile_dice_expression(notation)
+        elapsed = time_call(plan.roll_totals, engine, trials)
+        exact = time_call(exact_distribution, notation)
+        totals = plan.roll_totals(engine, trials)
+        print(
+            f"{notation:<12} {elapsed * 1000:>9.2f} ms {exact * 1000:>9.2f} ms "
+            f"{totals.mean():>10.4f} {plan_distribution(plan).mean:>11.4f}"
+        )
+
+def legacy_roll_format(rolls: np.ndarray, items_per_line: int) -> str:
+    """
+    Replay the former display formatting: one str() or f-string per value
+    Parameters:
+        rolls (np.ndarray): Values to format
+        items_per_line (int): Values per line
+    Returns:
+        str: Formatted lines
+    """
+    values = rolls.tolist()
+    lines = []
+    for i in range(0, len(values), items_per_line):
+        chunk = values[i:i + items_per_line]
+        if isinstance(chunk[0], float):
+            lines.append(' → '.join(f"{x:.2f}" for x in chunk))
+        else:
+            lines.append(' → '.join(str(x) for x in chunk))
+    return "\n".join(lines)
+
+def bench_roll_format(size: int = 1_000_000) -> None:
+    """
+    Compare per-value formatting with the vectorized formatter on dice and coins
+    """
+    engine = DiceEngine(torch.device(DEVICE))
+    coins = PackedCoinEngine(DEVICE).flip(size)
+    print(f"{'values':<10} {'legacy':>12} {'vectorized':>12} {'speedup':>8}")
+    for name, sides in [('d6', 6), ('d100', 100), ('d1e9', 10**9), ('d6.5', 6.5)]:
+        rolls = engine.roll(size, sides)
+        legacy = time_call(legacy_roll_format, rolls, MAX_ROLLS_PER_LINE)
+        vectorized = time_call(format_numbers, rolls, MAX_ROLLS_PER_LINE)
+        print(f"{name:<10} {legacy * 1000:>9.1f} ms {vectorized * 1000:>9.1f} ms {legacy / vectorized:>7.1f}x")
+    legacy = time_call(lambda: "\n".join(
+        ' → '.join(coins.decode(i, i + ITEMS_PER_LINE)) for i in range(0, size, ITEMS_PER_LINE)
+    ))
+    vectorized = time_call(coins.format_lines, 0, size, ITEMS_PER_LINE)
+    print(f"{'coins':<10} {legacy * 1000:>9.1f} ms {vectorized * 1000:>9.1f} ms {legacy / vectorized:>7.1f}x")
+
+BENCHMARKS: Dict[str, Callable[[], None]] = {
+    'coin_engines': bench_coin_engines,
+    'coin_counts': bench_coin_counts,
+    'sequence_display': bench_sequence_display,
+    'dice_distribution': bench_dice_distribution,
+    'dice_fused': bench_dice_fused,
+    'dice_keep': bench_dice_keep,
+    'roll_format': bench_roll_format
+}
+
+def main(names: List[str]) -> None:
+    for name in names or BENCHMARKS:
+        print(f"=== {name} ({DEVICE}) ===")
+        BENCHMARKS[name]()
+        print()
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,133 @@
+from typing import Dict, Optional
+import math
+import numpy as np
+from .coin_buffer import CoinBuffer
+from .constants import COIN_ANALYSIS_CHUNK
+
+class RunStatistics:
+    """Run-length statistics of a coin sequence.
+
+    A run is a maximal block of identical consecutive results. Run lengths
+    are kept as histograms per side, indexed by run length.
+
+    Attributes:
+        total (int): Number of flips analysed
+        piles (int): Number of 'Pile' results
+        faces (int): Number of 'Face' results
+        histograms (Dict[str, np.ndarray]): Run count by length, per side
+    """
+
+    def __init__(self, total: int, piles: int, histograms: Dict[str, np.ndarray]) -> None:
+        self.total: int = total
+        self.piles: int = piles
+        self.faces: int = total - piles
+        self.histograms: Dict[str, np.ndarray] = histograms
+
+    @property
+    def runs(self) -> int:
+        """Total number of runs, both sides included."""
+        return int(sum(histogram.sum() for histogram in self.histograms.values()))
+
+    def longest(self, side: str) -> int:
+        """Length of the longest run of a side ('Pile' or 'Face')."""
+        nonzero = np.flatnonzero(self.histograms[side])
+        return int(nonzero[-1]) if len(nonzero) else 0
+
+    @property
+    def expected_runs(self) -> float:
+        """Expected number of runs given the Pile/Face counts (Wald–Wolfowitz)."""
+        if not self.total:
+            return 0.0
+        return 2 * self.piles * self.faces / self.total + 1
+
+    @property
+    def runs_std(self) -> float:
+        """Standard deviation of the number of runs under randomness."""
+        if self.total < 2:
+            return 0.0
+        mean = self.expected_runs
+        return math.sqrt(max((mean - 1) * (mean - 2) / (self.total - 1), 0.0))
+
+    @property
+    def z_score(self) -> float:
+        """Wald–Wolfowitz z statistic of the observed number of runs."""
+        std = self.runs_std
+        return (self.runs - self.expected_runs) / std if std else 0.0
+
+class RunLengthAccumulator:
+    """Streaming run-length analysis over consecutive chunks of flips.
+
+    Runs inside a chunk are found with vectorized comparisons; the run still
+    open at the end of a chunk is carried over, so runs crossing chunk
+    boundaries are counted once with their full length.
+    """
+
+    SIDES = ('Face', 'Pile')
+
+    def __init__(self) -> None:
+        self.total: int = 0
+        self.piles: int = 0
+        self._histograms: Dict[str, np.ndarray] = {side: np.zeros(1, dtype=np.int64) for side in self.SIDES}
+        self._open_value: int = 0
+        self._open_length: int = 0
+
+    def _record(self, side: str, lengths: np.ndarray) -> None:
+        counts = np.bincount(lengths)
+        histogram = self._histograms[side]
+        if len(counts) > len(histogram):
+            histogram = np.pad(histogram, (0, len(counts) - len(histogram)))
+            self._histograms[side] = histogram
+        histogram[:len(counts)] += counts
+
+    def update(self, bits: np.ndarray) -> None:
+        """Add the next chunk of flips.
+
+        Args:
+            bits: uint8 array of 0/1 values (1 = 'Pile')
+        """
+        size: int = len(bits)
+        if not size:
+            return
+        self.total += size
+        self.piles += int(np.count_nonzero(bits))
+
+        starts = np.concatenate(([0], np.flatnonzero(bits[1:] != bits[:-1]) + 1))
+        lengths = np.diff(np.append(starts, size))
+        values = bits[starts]
+
+        if self._open_length:
+            if values[0] == self._open_value:
+                lengths[0] += self._open_length
+            else:
+                self._record(self.SIDES[self._open_value], np.array([self._open_length]))
+
+        closed_lengths, closed_values = lengths[:-1], values[:-1]
+        for value, side in enumerate(self.SIDES):
+            self._record(side, closed_lengths[closed_values == value])
+        self._open_value = int(values[-1])
+        self._open_length = int(lengths[-1])
+
+    def result(self) -> RunStatistics:
+        """Return statistics for everything seen so far, open run included."""
+        histograms = {side: histogram.copy() for side, histogram in self._histograms.items()}
+        if self._open_length:
+            side = self.SIDES[self._open_value]
+            if self._open_length >= len(histograms[side]):
+                histograms[side] = np.pad(histograms[side], (0, self._open_length + 1 - len(histograms[side])))
+            histograms[side][self._open_length] += 1
+        return RunStatistics(self.total, self.piles, histograms)
+
+def analyze_runs(results: CoinBuffer, chunk_size: int = COIN_ANALYSIS_CHUNK) -> RunStatistics:
+    """Compute run-length statistics of a coin sequence, chunk by chunk.
+
+    Args:
+        results: Bit-packed coin flip results
+        chunk_size: Number of flips unpacked at a time
+
+    Returns:
+        Run-length statistics of the whole sequence
+    """
+    accumulator = RunLengthAccumulator()
+    for bits in results.iter_bits(chunk_size):
+        accumulator.update(bits)
+    return accumulator.result()
@@ -0,0 +1,217 @@
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from .constants import COIN_DECODE_CHUNK
+from .roll_formatter import format_labels
+
+class CoinBuffer:
+    """Bit-packed, read-only sequence of coin flip results.
+
+    Each flip is stored as a single bit (1 = 'Pile', 0 = 'Face'), so a 10M-flip
+    run takes about 1.2 MB instead of a list of 10M string pointers. The buffer
+    behaves like a list of 'Pile'/'Face' strings (len, iteration, indexing,
+    slicing, count), but labels are only decoded for the range that is read.
+
+    Attributes:
+        LABELS (Tuple[str, str]): Result labels indexed by bit value
+    """
+
+    LABELS: Tuple[str, str] = ('Face', 'Pile')
+
+    def __init__(self, packed: np.ndarray, length: int, piles: Optional[int] = None) -> None:
+        """Wrap an array of packed bits (big-endian bit order, as np.packbits).
+
+        Args:
+            packed: Packed flip bits, at least ceil(length / 8) bytes
+            length: Number of flips stored in the buffer
+            piles: Number of 'Pile' results, if already known
+        """
+        packed = np.ascontiguousarray(packed, dtype=np.uint8)[:(length + 7) // 8]
+        tail_bits: int = length % 8
+        if tail_bits and packed[-1] & (0xFF >> tail_bits):
+            # Padding bits must stay cleared for popcount-based counting
+            packed = packed.copy()
+            packed[-1] &= (0xFF << (8 - tail_bits)) & 0xFF
+        self._packed: np.ndarray = packed
+        self._length: int = length
+        self._piles: Optional[int] = piles
+
+    @classmethod
+    def from_bits(cls, bits: Union[np.ndarray, Sequence[int]]) -> 'CoinBuffer':
+        """Build a buffer from an unpacked array of 0/1 (or bool) flips.
+
+        Args:
+            bits: One value per flip, non-zero meaning 'Pile'
+
+        Returns:
+            Packed coin buffer
+        """
+        bits = np.asarray(bits).astype(bool, copy=False)
+        return cls(np.packbits(bits), len(bits))
+
+    @classmethod
+    def from_sequence(cls, results: Sequence[str]) -> 'CoinBuffer':
+        """Build a buffer from a sequence of 'Pile'/'Face' strings.
+
+        Args:
+            results: List of coin flip results
+
+        Returns:
+            Packed coin buffer
+        """
+        bits = np.fromiter((result == 'Pile' for result in results), dtype=bool, count=len(results))
+        return cls.from_bits(bits)
+
+    @classmethod
+    def coerce(cls, results: Union['CoinBuffer', Sequence[str]]) -> 'CoinBuffer':
+        """Return results as a CoinBuffer, packing plain string sequences.
+
+        Args:
+            results: Coin buffer or list of 'Pile'/'Face' strings
+
+        Returns:
+            Packed coin buffer
+        """
+        if isinstance(results, cls):
+            return results
+        return cls.from_sequence(results)
+
+    @classmethod
+    def concatenate(cls, buffers: Sequence['CoinBuffer']) -> 'CoinBuffer':
+        """Join several buffers into a single one.
+
+        Args:
+            buffers: Buffers to join, in order
+
+        Returns:
+            Packed coin buffer holding every flip
+        """
+        if all(len(buffer) % 8 == 0 for buffer in buffers[:-1]):
+            packed = np.concatenate([buffer.packed for buffer in buffers] or [np.empty(0, np.uint8)])
+            return cls(packed, sum(len(buffer) for buffer in buffers))
+        return cls.from_bits(np.concatenate([buffer.bits() for buffer in buffers]))
+
+    @property
+    def packed(self) -> np.ndarray:
+        """Packed flip bits (read-only view)."""
+        view = self._packed.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the packed flips, in bytes."""
+        return self._packed.nbytes
+
+    @property
+    def piles(self) -> int:
+        """Number of 'Pile' results, computed once by popcount."""
+        if self._piles is None:
+            self._piles = int(np.bitwise_count(self._packed).sum(dtype=np.int64))
+        return self._piles
+
+    @property
+    def faces(self) -> int:
+        """Number of 'Face' results."""
+        return self._length - self.piles
+
+    def count(self, value: str) -> int:
+        """Count occurrences of a result label, like list.count.
+
+        Args:
+            value: 'Pile' or 'Face'
+
+        Returns:
+            Number of matching flips
+        """
+        if value == 'Pile':
+            return self.piles
+        if value == 'Face':
+            return self.faces
+        return 0
+
+    def bits(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Unpack a range of flips into a uint8 array of 0/1 values.
+
+        Args:
+            start: Index of the first flip
+            stop: Index after the last flip (defaults to the end)
+
+        Returns:
+            Array with one value per flip (1 = 'Pile')
+        """
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if stop <= start:
+            return np.empty(0, dtype=np.uint8)
+        first_byte, last_byte = start // 8, (stop + 7) // 8
+        unpacked = np.unpackbits(self._packed[first_byte:last_byte])
+        offset: int = start - first_byte * 8
+        return unpacked[offset:offset + stop - start]
+
+    def iter_bits(self, chunk_size: int = COIN_DECODE_CHUNK) -> Iterator[np.ndarray]:
+        """Iterate over the flips as consecutive unpacked chunks.
+
+        Args:
+            chunk_size: Number of flips per chunk
+
+        Yields:
+            uint8 arrays of 0/1 values
+        """
+        for start in range(0, self._length, chunk_size):
+            yield self.bits(start, start + chunk_size)
+
+    def decode(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Decode a range of flips into 'Pile'/'Face' labels.
+
+        Args:
+            start: Index of the first flip
+            stop: Index after the last flip (defaults to the end)
+
+        Returns:
+            List of coin flip results
+        """
+        labels = self.LABELS
+        return [labels[bit] for bit in self.bits(start, stop).tolist()]
+
+    def format_lines(self, start: int, stop: int, items_per_line: int) -> str:
+        """Format a range of flips as lines of 'Pile'/'Face' labels.
+
+        Args:
+            start: Index of the first flip
+            stop: Index after the last flip
+            items_per_line: Number of flips per line
+
+        Returns:
+            Newline-joined lines of flips
+        """
+        return format_labels(self.bits(start, stop), self.LABELS, items_per_line)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[str]:
+        for start in range(0, self._length, COIN_DECODE_CHUNK):
+            yield from self.decode(start, start + COIN_DECODE_CHUNK)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, 'CoinBuffer']:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step == 1 and start % 8 == 0 and stop > start:
+                return CoinBuffer(self._packed[start // 8:(stop + 7) // 8], stop - start)
+            if step == 1:
+                return CoinBuffer.from_bits(self.bits(start, stop))
+            return CoinBuffer.from_bits(self.bits()[index])
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("CoinBuffer index out of range")
+        return self.LABELS[(self._packed[index // 8] >> (7 - index % 8)) & 1]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CoinBuffer):
+            return self._length == other._length and np.array_equal(self._packed, other._packed)
+        if isinstance(other, (list, tuple)):
+            return len(other) == self._length and self.decode() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CoinBuffer(length={self._length:,}, piles={self.piles:,}, faces={self.faces:,})"
@@ -0,0 +1,142 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from .coin_buffer import CoinBuffer
+from .constants import COIN_ANALYSIS_CHUNK, COIN_CONVERGENCE_POINTS
+
+class ConvergenceSeries:
+    """Running 'Pile' proportion of a coin run, downsampled into buckets.
+
+    Each bucket covers a fixed number of consecutive flips and keeps the
+    running proportion at its last flip together with the lowest and highest
+    values reached inside it, so early spikes stay visible after downsampling.
+
+    Attributes:
+        steps (np.ndarray): Flip index ending each bucket (1-based)
+        proportion (np.ndarray): Running proportion at the end of each bucket
+        low (np.ndarray): Lowest running proportion inside each bucket
+        high (np.ndarray): Highest running proportion inside each bucket
+        total (int): Number of flips
+        piles (int): Number of 'Pile' results
+    """
+
+    def __init__(
+        self,
+        steps: np.ndarray,
+        proportion: np.ndarray,
+        low: np.ndarray,
+        high: np.ndarray,
+        total: int,
+        piles: int
+    ) -> None:
+        self.steps: np.ndarray = steps
+        self.proportion: np.ndarray = proportion
+        self.low: np.ndarray = low
+        self.high: np.ndarray = high
+        self.total: int = total
+        self.piles: int = piles
+
+    def envelope(self, p: float, z: float = 1.96) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the p ± z·sqrt(p(1-p)/n) band at each bucket end."""
+        half_width = z * np.sqrt(p * (1 - p) / self.steps)
+        return p - half_width, p + half_width
+
+class ConvergenceAccumulator:
+    """Streaming running-proportion series over consecutive chunks of flips.
+
+    The running 'Pile' count of a chunk is a cumulative sum offset by the
+    count carried from the previous chunks; bucket extremes come from
+    segmented reductions, and the bucket still open at the end of a chunk is
+    carried over. Memory stays bounded by the chunk size and the number of
+    points, never by the run length.
+    """
+
+    def __init__(self, total_steps: int, points: int = COIN_CONVERGENCE_POINTS) -> None:
+        self.bucket_size: int = max(1, -(-total_steps // points))
+        self.total: int = 0
+        self.piles: int = 0
+        self._steps: List[np.ndarray] = []
+        self._proportion: List[np.ndarray] = []
+        self._low: List[np.ndarray] = []
+        self._high: List[np.ndarray] = []
+        self._open: Optional[Tuple[int, float, float, float]] = None  # bucket, last, low, high
+
+    def update(self, bits: np.ndarray) -> None:
+        """Add the next chunk of flips.
+
+        Args:
+            bits: uint8 array of 0/1 values (1 = 'Pile')
+        """
+        size: int = len(bits)
+        if not size:
+            return
+        steps = np.arange(self.total + 1, self.total + size + 1, dtype=np.int64)
+        proportion = np.cumsum(bits, dtype=np.int64)
+        proportion += self.piles
+        self.piles = int(proportion[-1])
+        proportion = proportion / steps
+
+        buckets = (steps - 1) // self.bucket_size
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+        ends = np.append(starts[1:], size) - 1
+        last = proportion[ends]
+        low = np.minimum.reduceat(proportion, starts)
+        high = np.maximum.reduceat(proportion, starts)
+
+        if self._open is not None and self._open[0] == buckets[0]:
+            low[0] = min(low[0], self._open[2])
+            high[0] = max(high[0], self._open[3])
+        elif self._open is not None:
+            self._close(*self._open)
+
+        # Every segment but the last is a complete bucket
+        self._steps.append(steps[ends[:-1]])
+        self._proportion.append(last[:-1])
+        self._low.append(low[:-1])
+        self._high.append(high[:-1])
+        self._open = (int(buckets[-1]), float(last[-1]), float(low[-1]), float(high[-1]))
+        self.total += size
+
+    def _close(self, bucket: int, last: float, low: float, high: float) -> None:
+        self._steps.append(np.array([self.total], dtype=np.int64))
+        self._proportion.append(np.array([last]))
+        self._low.append(np.array([low]))
+        self._high.append(np.array([high]))
+
+    def result(self) -> ConvergenceSeries:
+        """Return the series for every flip seen so far, open bucket included."""
+        steps, proportion = list(self._steps), list(self._proportion)
+        low, high = list(self._low), list(self._high)
+        if self._open is not None:
+            _, open_last, open_low, open_high = self._open
+            steps.append(np.array([self.total], dtype=np.int64))
+            proportion.append(np.array([open_last]))
+            low.append(np.array([open_low]))
+            high.append(np.array([open_high]))
+        if not steps:
+            empty = np.empty(0)
+            return ConvergenceSeries(np.empty(0, dtype=np.int64), empty, empty, empty, 0, 0)
+        return ConvergenceSeries(
+            np.concatenate(steps), np.concatenate(proportion),
+            np.concatenate(low), np.concatenate(high),
+            self.total, self.piles
+        )
+
+def analyze_convergence(
+    results: CoinBuffer,
+    points: int = COIN_CONVERGENCE_POINTS,
+    chunk_size: int = COIN_ANALYSIS_CHUNK
+) -> ConvergenceSeries:
+    """Compute the downsampled running 'Pile' proportion of a coin sequence.
+
+    Args:
+        results: Bit-packed coin flip results
+        points: Number of buckets in the series
+        chunk_size: Number of flips unpacked at a time
+
+    Returns:
+        Running-proportion series of the whole sequence
+    """
+    accumulator = ConvergenceAccumulator(len(results), points)
+    for bits in results.iter_bits(chunk_size):
+        accumulator.update(bits)
+    return accumulator.result()
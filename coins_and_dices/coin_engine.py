@@ -0,0 +1,291 @@
+from typing import Dict, Iterator, Tuple, Type
+import numpy as np
+import torch
+from .coin_buffer import CoinBuffer
+from .constants import COIN_BIAS_BITS, COIN_ENGINE_BATCH_SIZE, COIN_BINOMIAL_CHUNK
+
+def popcount64(words: torch.Tensor) -> torch.Tensor:
+    """Count set bits in each 64-bit word with a branch-free SWAR reduction.
+
+    Args:
+        words: int64 tensor on any device
+
+    Returns:
+        int64 tensor with the number of set bits per word
+    """
+    words = words - ((words >> 1) & 0x5555555555555555)
+    words = (words & 0x3333333333333333) + ((words >> 2) & 0x3333333333333333)
+    words = (words + (words >> 4)) & 0x0F0F0F0F0F0F0F0F
+    return (words * 0x0101010101010101) >> 56
+
+def random_words(shape: Tuple[int, ...], device: torch.device) -> torch.Tensor:
+    """Draw random 64-bit words whose bits are fair flips.
+
+    Args:
+        shape: Shape of the word tensor
+        device: Device used for random generation
+
+    Returns:
+        int64 tensor of random words
+    """
+    words: torch.Tensor = torch.empty(shape, dtype=torch.int64, device=device)
+    return words.random_(-2**63, None)  # Full 64-bit range, every bit fair
+
+def biased_words(shape: Tuple[int, ...], p: float, device: torch.device) -> torch.Tensor:
+    """Draw random 64-bit words whose bits are 1 with probability p.
+
+    p is rounded to COIN_BIAS_BITS binary digits 0.b1b2...bm. Starting from
+    zero words and reading the digits from bm up to b1, each digit combines a
+    fresh fair word into the result: OR for a 1, AND for a 0. A bit ends up
+    set with probability (b + P(set before)) / 2 at each step, which unrolls
+    to exactly 0.b1b2...bm. Every word holds 64 flips for at most
+    COIN_BIAS_BITS fair words, and trailing zero digits cost nothing, so
+    p = 0.5 is a single fair word.
+
+    Args:
+        shape: Shape of the word tensor
+        p: Probability of a set bit
+        device: Device used for random generation
+
+    Returns:
+        int64 tensor of biased words
+    """
+    scaled: int = round(min(max(p, 0.0), 1.0) * (1 << COIN_BIAS_BITS))
+    if scaled == 1 << COIN_BIAS_BITS:
+        return torch.full(shape, -1, dtype=torch.int64, device=device)
+    words: torch.Tensor = torch.zeros(shape, dtype=torch.int64, device=device)
+    if not scaled:
+        return words
+    fair: torch.Tensor = torch.empty_like(words)
+    lowest: int = (scaled & -scaled).bit_length() - 1
+    for digit in range(lowest, COIN_BIAS_BITS):
+        fair.random_(-2**63, None)
+        if scaled >> digit & 1:
+            words |= fair
+        else:
+            words &= fair
+    return words
+
+class CoinCounts:
+    """Pile/Face totals of a run whose individual flips were not kept.
+
+    Exposes the same counting interface as CoinBuffer (len, piles, faces,
+    count), so summaries and history metadata work on either.
+
+    Attributes:
+        total (int): Number of flips
+        piles (int): Number of 'Pile' results
+    """
+
+    def __init__(self, total: int, piles: int) -> None:
+        self.total: int = total
+        self.piles: int = piles
+
+    @property
+    def faces(self) -> int:
+        """Number of 'Face' results."""
+        return self.total - self.piles
+
+    def count(self, value: str) -> int:
+        """Count occurrences of a result label, like list.count."""
+        if value == 'Pile':
+            return self.piles
+        if value == 'Face':
+            return self.faces
+        return 0
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __repr__(self) -> str:
+        return f"CoinCounts(total={self.total:,}, piles={self.piles:,}, faces={self.faces:,})"
+
+class CoinEngine:
+    """Base class for coin flip generators.
+
+    Engines produce flips as bit-packed batches together with their 'Pile'
+    count, so callers never have to build or scan per-flip Python objects.
+
+    Attributes:
+        name (str): Identifier used to select the engine
+        p (float): Probability of 'Pile'
+        device (torch.device): Device used for random generation
+    """
+
+    name: str = ""
+    p: float = 0.5
+
+    def __init__(self, device: torch.device) -> None:
+        self.device: torch.device = device
+
+    def generate_batch(self, batch_size: int) -> Tuple[np.ndarray, int]:
+        """Generate one batch of flips.
+
+        Args:
+            batch_size: Number of flips in the batch
+
+        Returns:
+            Tuple of (packed flip bits, number of 'Pile' results)
+        """
+        raise NotImplementedError
+
+    def iter_batches(
+        self,
+        num_coins: int,
+        batch_size: int = COIN_ENGINE_BATCH_SIZE
+    ) -> Iterator[Tuple[np.ndarray, int, int]]:
+        """Generate flips batch by batch.
+
+        Args:
+            num_coins: Total number of flips
+            batch_size: Flips per batch, rounded down to a multiple of 64
+
+        Yields:
+            Tuples of (packed flip bits, batch length, number of 'Pile' results)
+        """
+        batch_size = max(64, batch_size - batch_size % 64)
+        remaining: int = num_coins
+        while remaining > 0:
+            current: int = min(batch_size, remaining)
+            packed, piles = self.generate_batch(current)
+            yield packed, current, piles
+            remaining -= current
+
+    def flip(self, num_coins: int) -> CoinBuffer:
+        """Flip a number of coins into a single packed buffer.
+
+        Args:
+            num_coins: Number of coins to flip
+
+        Returns:
+            Bit-packed coin flip results
+        """
+        packed: np.ndarray = np.empty((num_coins + 7) // 8, dtype=np.uint8)
+        offset: int = 0
+        piles: int = 0
+        for batch, length, batch_piles in self.iter_batches(num_coins):
+            packed[offset:offset + len(batch)] = batch
+            offset += len(batch)
+            piles += batch_piles
+        return CoinBuffer(packed, num_coins, piles=piles)
+
+    def count(self, num_coins: int) -> CoinCounts:
+        """Flip a number of coins, keeping only the totals.
+
+        Args:
+            num_coins: Number of coins to flip
+
+        Returns:
+            Pile/Face totals of the run
+        """
+        piles: int = sum(batch_piles for _, _, batch_piles in self.iter_batches(num_coins))
+        return CoinCounts(num_coins, piles)
+
+class FloatCoinEngine(CoinEngine):
+    """Legacy engine drawing one float32 per flip and comparing it to 0.5."""
+
+    name = "float"
+
+    def generate_batch(self, batch_size: int) -> Tuple[np.ndarray, int]:
+        flips: torch.Tensor = torch.rand(batch_size, device=self.device) < 0.5
+        piles: int = int(flips.sum())
+        return np.packbits(flips.cpu().numpy()), piles
+
+class PackedCoinEngine(CoinEngine):
+    """Engine drawing random 64-bit words, each one holding 64 fair flips.
+
+    The words are used as the packed bit buffer directly: no per-flip
+    comparison or packing step is needed, and the 'Pile' count of a batch is
+    a popcount over the words on the generating device.
+    """
+
+    name = "packed"
+
+    def generate_words(self, num_words: int) -> torch.Tensor:
+        """Draw the words of a batch, one flip per bit.
+
+        Args:
+            num_words: Number of 64-bit words
+
+        Returns:
+            int64 tensor of flip words on the engine's device
+        """
+        return random_words((num_words,), self.device)
+
+    def generate_batch(self, batch_size: int) -> Tuple[np.ndarray, int]:
+        num_words: int = (batch_size + 63) // 64
+        words: torch.Tensor = self.generate_words(num_words)
+
+        num_bytes: int = (batch_size + 7) // 8
+        flip_bytes: torch.Tensor = words.view(torch.uint8)
+        flip_bytes[num_bytes:] = 0
+        tail_bits: int = batch_size % 8
+        if tail_bits:
+            flip_bytes[num_bytes - 1] &= (0xFF << (8 - tail_bits)) & 0xFF
+
+        piles: int = int(popcount64(words).sum())
+        return flip_bytes[:num_bytes].cpu().numpy(), piles
+
+class BiasedCoinEngine(PackedCoinEngine):
+    """Engine flipping coins that land 'Pile' with any probability p.
+
+    Packed words are built with p-biased bits by combining fair random words
+    (see biased_words), so batches are packed and counted on the device like
+    fair ones. A flip costs at most COIN_BIAS_BITS / 64 random words instead
+    of a float draw, comparison and host-side packing.
+
+    Attributes:
+        p (float): Probability of 'Pile', used to COIN_BIAS_BITS binary digits
+    """
+
+    name = "biased"
+
+    def __init__(self, device: torch.device, p: float = 0.5) -> None:
+        super().__init__(device)
+        self.p: float = p
+
+    def generate_words(self, num_words: int) -> torch.Tensor:
+        return biased_words((num_words,), self.p, self.device)
+
+class BinomialCoinEngine:
+    """Counts-only generator sampling the 'Pile' total from a binomial distribution.
+
+    The number of heads among n flips is Binomial(n, p), so the totals of a
+    run of any size cost one draw per COIN_BINOMIAL_CHUNK flips, in constant
+    memory. Individual flips are never generated, so this is not a
+    CoinEngine: it only offers count().
+
+    Attributes:
+        name (str): Identifier recorded in the game history
+        device (torch.device): Device of the frame, kept for the history metadata
+        p (float): Probability of 'Pile'
+        rng (np.random.Generator): Generator of the binomial draws
+    """
+
+    name: str = "binomial"
+
+    def __init__(self, device: torch.device, p: float = 0.5) -> None:
+        self.device: torch.device = device
+        self.p: float = p
+        self.rng: np.random.Generator = np.random.default_rng()
+
+    def count(self, num_coins: int) -> CoinCounts:
+        """Draw the totals of a run without generating its flips.
+
+        Args:
+            num_coins: Number of coins to flip
+
+        Returns:
+            Pile/Face totals of the run
+        """
+        piles: int = 0
+        for start in range(0, num_coins, COIN_BINOMIAL_CHUNK):
+            chunk: int = min(COIN_BINOMIAL_CHUNK, num_coins - start)
+            piles += int(self.rng.binomial(chunk, self.p))
+        return CoinCounts(num_coins, piles)
+
+COIN_ENGINES: Dict[str, Type[CoinEngine]] = {
+    PackedCoinEngine.name: PackedCoinEngine,
+    FloatCoinEngine.name: FloatCoinEngine,
+    BiasedCoinEngine.name: BiasedCoinEngine
+}
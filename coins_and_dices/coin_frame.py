@@ -4,7 +4,20 @@ import threading
 import queue
 import wx
 import wx.grid
+import numpy as np
 import torch
+from .coin_buffer import CoinBuffer
+from .coin_engine import BiasedCoinEngine, BinomialCoinEngine, CoinCounts, CoinEngine, PackedCoinEngine
+from .coin_analysis import RunStatistics, analyze_runs
+from .coin_walk import WalkStatistics, analyze_walk
+from .coin_convergence import ConvergenceSeries, analyze_convergence
+from .coin_patterns import PatternMatches, find_pattern, parse_pattern
+from .coin_trials import CoinTrialsEngine, TrialCounts
+from .plot_panel import PlotPanel
+from .coin_worker import CoinFlipWorker, FlipCollector, TrialsCollector, WeightedCollector
+from .coin_sequence_table import CoinSequenceTable
+from .progressive_renderer import ProgressiveRenderer, iter_line_blocks
+from .weighted_sampler import WeightedOutcomeEngine, WeightedOutcomes, parse_weights
 from .game_history import GameHistory
 from .constants import *
 from enum import Enum
@@ -14,6 +27,8 @@ class ViewMode(Enum):
     FULL = "Full"
     SAMPLE = "Sample" 
     STATISTICS = "Statistics"
+    RANDOM_WALK = "Random Walk"
+    CONVERGENCE = "Convergence"
 
 class CoinFrame(wx.Frame):
     """Enhanced hardware-adaptive coin flipping simulation with GPU optimization.
@@ -26,20 +41,44 @@ class CoinFrame(wx.Frame):
     
     Attributes:
         device (torch.device): GPU device if available, otherwise CPU
+        engine (CoinEngine): Flip generator, 64 flips per random word for fair coins
+        counts_engine (BinomialCoinEngine): Counts-only generator for statistics runs
+        probability_input (wx.SpinCtrlDouble): Probability of 'Pile'
+        weights_input (wx.TextCtrl): Weighted outcomes replacing the coin when filled
+        pattern_input (wx.TextCtrl): Coin pattern to search, e.g. 'PPFPF' or 'P{10}'
+        pattern_result (wx.TextCtrl): Outcome of the last pattern search
+        trials_input (wx.SpinCtrl): Number of trials; above 1, the coins are flipped as repeated trials
+        plot_panel (PlotPanel): Histogram of trial results or running-proportion plot
         result_queue (queue.Queue): Queue for async result processing
-        worker_thread (Optional[threading.Thread]): Background processing thread
+        worker_thread (Optional[CoinFlipWorker]): Background flip generation thread
+        collector (Optional[Union[FlipCollector, TrialsCollector, WeightedCollector]]): Collector of the running worker, None when idle
+        worker_result (Optional[Tuple]): Results and analyses posted by the worker before it finishes
+        worker_error (Optional[Exception]): Error posted by the worker before it finishes
         grid (Optional[wx.grid.Grid]): Grid for displaying results
-        current_results (List[str]): Current flip results
+        sequence_grid (wx.grid.Grid): Virtual grid browsing the full flip sequence
+        sequence_renderer (ProgressiveRenderer): Frame-rate limited renderer of the details cell
+        current_results (Optional[Union[CoinBuffer, CoinCounts, WeightedOutcomes, TrialCounts]]): Current results
+        current_runs (Optional[RunStatistics]): Run analysis of a counts-only statistics run
+        current_walk (Optional[WalkStatistics]): Random-walk analysis of a counts-only walk run
+        current_convergence (Optional[ConvergenceSeries]): Running proportion of a counts-only convergence run
         view_mode (Optional[wx.Choice]): Display mode selector
     """
     
     def __init__(self) -> None:
         super().__init__(parent=None, title='Lanceur de Pièces', size=WINDOW_SIZE)
         self.device: torch.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-        self.result_queue: queue.Queue = queue.Queue()
-        self.worker_thread: Optional[threading.Thread] = None
+        self.engine: CoinEngine = PackedCoinEngine(self.device)
+        self.counts_engine: BinomialCoinEngine = BinomialCoinEngine(self.device)
+        self.result_queue: queue.Queue = queue.Queue(maxsize=COIN_WORKER_QUEUE_SIZE)
+        self.worker_thread: Optional[CoinFlipWorker] = None
+        self.collector: Optional[Union[FlipCollector, TrialsCollector, WeightedCollector]] = None
+        self.worker_result: Optional[Tuple] = None
+        self.worker_error: Optional[Exception] = None
         self.grid: Optional[wx.grid.Grid] = None
-        self.current_results: List[str] = []
+        self.current_results: Optional[Union[CoinBuffer, CoinCounts, WeightedOutcomes, TrialCounts]] = None
+        self.current_runs: Optional[RunStatistics] = None
+        self.current_walk: Optional[WalkStatistics] = None
+        self.current_convergence: Optional[ConvergenceSeries] = None
         self.view_mode: Optional[wx.Choice] = None
         self.init_ui()
 
@@ -64,8 +103,52 @@ class CoinFrame(wx.Frame):
             5
         )
         input_sizer.Add(self.coin_input, 1, wx.ALL, 5)
+        
+        self.coin_scale = wx.Choice(
+            self.panel,
+            choices=[f"× {scale:,}".replace(',', ' ') for scale in COIN_SCALES]
+        )
+        self.coin_scale.SetSelection(0)
+        input_sizer.Add(self.coin_scale, 0, wx.ALL, 5)
+        
+        self.trials_input = wx.SpinCtrl(
+            self.panel,
+            min=1,
+            max=COIN_TRIALS_MAX,
+            initial=1
+        )
+        input_sizer.Add(
+            wx.StaticText(self.panel, label="Répétitions:"),
+            0, wx.ALL|wx.CENTER, 5
+        )
+        input_sizer.Add(self.trials_input, 0, wx.ALL, 5)
         main_sizer.Add(input_sizer, 0, wx.EXPAND)
         
+        # Coin bias and weighted outcomes
+        weight_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.probability_input = wx.SpinCtrlDouble(
+            self.panel,
+            min=0.0,
+            max=1.0,
+            initial=COIN_DEFAULT_PROBABILITY,
+            inc=COIN_PROBABILITY_INCREMENT
+        )
+        self.probability_input.SetDigits(2)
+        self.weights_input = wx.TextCtrl(self.panel)
+        self.weights_input.SetHint("Rouge:1, Vert:2, Bleu:3")
+        
+        weight_sizer.Add(
+            wx.StaticText(self.panel, label="Probabilité Pile:"),
+            0, wx.ALL|wx.CENTER, 5
+        )
+        weight_sizer.Add(self.probability_input, 0, wx.ALL, 5)
+        weight_sizer.Add(
+            wx.StaticText(self.panel, label="Issues pondérées:"),
+            0, wx.ALL|wx.CENTER, 5
+        )
+        weight_sizer.Add(self.weights_input, 1, wx.ALL, 5)
+        main_sizer.Add(weight_sizer, 0, wx.EXPAND)
+        
         # View mode selector
         view_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self.view_mode = wx.Choice(
@@ -80,12 +163,59 @@ class CoinFrame(wx.Frame):
             0, wx.ALL|wx.CENTER, 5
         )
         view_sizer.Add(self.view_mode, 0, wx.ALL, 5)
+        
+        self.walk_levels_input = wx.TextCtrl(
+            self.panel,
+            value=", ".join(str(level) for level in COIN_WALK_LEVELS)
+        )
+        view_sizer.Add(
+            wx.StaticText(self.panel, label="Niveaux de la marche:"),
+            0, wx.ALL|wx.CENTER, 5
+        )
+        view_sizer.Add(self.walk_levels_input, 1, wx.ALL, 5)
         main_sizer.Add(view_sizer, 0, wx.EXPAND|wx.ALL, 5)
         
-        # Flip button
-        flip_btn = wx.Button(self.panel, label="Lancer les pièces")
-        flip_btn.Bind(wx.EVT_BUTTON, self.handle_flip_coins)
-        main_sizer.Add(flip_btn, 0, wx.ALL|wx.CENTER, 5)
+        # Flip and cancel buttons
+        button_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.flip_btn = wx.Button(self.panel, label="Lancer les pièces")
+        self.flip_btn.Bind(wx.EVT_BUTTON, self.handle_flip_coins)
+        self.cancel_btn = wx.Button(self.panel, label="Annuler")
+        self.cancel_btn.Bind(wx.EVT_BUTTON, self.on_cancel)
+        self.cancel_btn.Disable()
+        button_sizer.Add(self.flip_btn, 0, wx.ALL, 5)
+        button_sizer.Add(self.cancel_btn, 0, wx.ALL, 5)
+        main_sizer.Add(button_sizer, 0, wx.CENTER)
+        
+        # Progress of background runs
+        self.progress_gauge = wx.Gauge(self.panel, range=COIN_PROGRESS_RANGE)
+        main_sizer.Add(self.progress_gauge, 0, wx.EXPAND|wx.ALL, 5)
+        self.drain_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_drain_timer, self.drain_timer)
+        self.sequence_renderer = ProgressiveRenderer(self)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        
+        # Pattern search over the current flips
+        pattern_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.pattern_input = wx.TextCtrl(self.panel)
+        self.pattern_input.SetHint("PPFPF ou P{10}")
+        self.pattern_overlap = wx.CheckBox(self.panel, label="Chevauchements")
+        self.pattern_overlap.SetValue(True)
+        self.pattern_btn = wx.Button(self.panel, label="Rechercher")
+        self.pattern_btn.Bind(wx.EVT_BUTTON, self.on_search_pattern)
+        pattern_sizer.Add(
+            wx.StaticText(self.panel, label="Motif:"),
+            0, wx.ALL|wx.CENTER, 5
+        )
+        pattern_sizer.Add(self.pattern_input, 1, wx.ALL, 5)
+        pattern_sizer.Add(self.pattern_overlap, 0, wx.ALL|wx.CENTER, 5)
+        pattern_sizer.Add(self.pattern_btn, 0, wx.ALL, 5)
+        main_sizer.Add(pattern_sizer, 0, wx.EXPAND)
+        self.pattern_result = wx.TextCtrl(
+            self.panel,
+            style=wx.TE_MULTILINE|wx.TE_READONLY,
+            size=(-1, COIN_PATTERN_RESULT_HEIGHT)
+        )
+        main_sizer.Add(self.pattern_result, 0, wx.EXPAND|wx.ALL, 5)
         
         # Setup grid with proper columns
         self.grid = wx.grid.Grid(self.panel)
@@ -107,194 +237,900 @@ class CoinFrame(wx.Frame):
         
         main_sizer.Add(self.grid, 1, wx.EXPAND|wx.ALL, 5)
         
+        # Histogram of trials runs
+        self.plot_panel = PlotPanel(self.panel)
+        self.plot_panel.Hide()
+        main_sizer.Add(self.plot_panel, 0, wx.EXPAND|wx.ALL, 5)
+        
+        # Virtual view of the whole sequence, rows formatted on demand
+        self.sequence_table = CoinSequenceTable()
+        self.sequence_grid = wx.grid.Grid(self.panel)
+        self.sequence_grid.SetTable(self.sequence_table, True)
+        self.sequence_grid.EnableEditing(False)
+        self.sequence_grid.DisableDragRowSize()
+        self.sequence_grid.SetRowLabelSize(wx.grid.GRID_AUTOSIZE)
+        self.sequence_grid.SetColSize(0, COIN_SEQUENCE_COLUMN_WIDTH)
+        self.sequence_grid.Hide()
+        main_sizer.Add(self.sequence_grid, 1, wx.EXPAND|wx.ALL, 5)
+        
         self.panel.SetSizer(main_sizer)
         self.Center()
         self.Show()
 
-    def flip_coins_gpu(self, num_coins: int) -> List[str]:
-        """Generate random coin flips using GPU acceleration with batch processing.
+    def get_coin_count(self) -> int:
+        """Return the requested number of coins, scale multiplier included.
+        
+        Returns:
+            Number of coins to flip
+        """
+        return self.coin_input.GetValue() * COIN_SCALES[self.coin_scale.GetSelection()]
+
+    def is_counts_only(self, num_coins: int) -> bool:
+        """Tell whether a run should keep only its totals instead of every flip.
+        
+        Individual flips are skipped when the statistics, random-walk or
+        convergence view is selected, since nobody looks at them, or when there are too many to keep
+        in memory.
         
         Args:
             num_coins: Number of coins to flip
             
         Returns:
-            List of coin flip results ('Pile' or 'Face')
+            True if the counts-only engine should be used
+        """
+        selected_mode = self.view_mode.GetString(self.view_mode.GetSelection())
+        return (
+            selected_mode in (ViewMode.STATISTICS.value, ViewMode.RANDOM_WALK.value, ViewMode.CONVERGENCE.value)
+            or num_coins > COIN_COUNTS_ONLY_THRESHOLD
+        )
+
+    def get_walk_levels(self) -> List[int]:
+        """Return the first-passage levels typed in the walk levels field.
+        
+        Returns:
+            Levels whose first-passage step is reported
+            
+        Raises:
+            ValueError: If a level is not an integer
+        """
+        levels: List[int] = []
+        for entry in self.walk_levels_input.GetValue().split(','):
+            if entry.strip():
+                try:
+                    levels.append(int(entry))
+                except ValueError:
+                    raise ValueError(f"Invalid walk level: {entry.strip()}") from None
+        return levels
+
+    def select_coin_engines(self) -> None:
+        """Match the flip engines to the selected 'Pile' probability.
+        
+        Fair coins keep the packed engine (64 flips per random word); biased
+        coins build packed words from several fair ones.
+        """
+        p: float = self.probability_input.GetValue()
+        if p == self.counts_engine.p:
+            return
+        if p == COIN_DEFAULT_PROBABILITY:
+            self.engine = PackedCoinEngine(self.device)
+        else:
+            self.engine = BiasedCoinEngine(self.device, p)
+        self.counts_engine = BinomialCoinEngine(self.device, p)
+
+    def draw_weighted_outcomes(self, num_draws: int, weights_text: str) -> None:
+        """Draw weighted outcomes described as 'label:weight' entries.
+        
+        Kept draws above COIN_WORKER_THRESHOLD are handed to the background
+        worker; smaller runs and counts-only runs are shown directly.
+        
+        Args:
+            num_draws: Number of draws
+            weights_text: Content of the weighted outcomes field
+        """
+        engine = WeightedOutcomeEngine(*parse_weights(weights_text), self.device)
+        if self.is_counts_only(num_draws):
+            self.show_results(num_draws, engine, engine.count(num_draws))
+        elif num_draws > COIN_WORKER_THRESHOLD:
+            self.start_worker(engine, WeightedCollector(num_draws))
+        else:
+            self.show_results(num_draws, engine, engine.sample(num_draws))
+
+    def run_coin_trials(self, num_coins: int, trials: int) -> None:
+        """Flip a number of coins repeatedly, keeping the histogram of 'Pile' counts.
+        
+        Runs above COIN_WORKER_THRESHOLD flips in total are handed to the
+        background worker; smaller ones are shown directly.
+        
+        Args:
+            num_coins: Number of coins per trial
+            trials: Number of trials
         """
-        results: List[str] = []
-        remaining: int = num_coins
+        if num_coins > COIN_TRIALS_MAX_COINS:
+            raise ValueError(f"Trials are limited to {COIN_TRIALS_MAX_COINS:,} coins")
+        
+        engine = CoinTrialsEngine(self.device, self.probability_input.GetValue())
+        if num_coins * trials > COIN_WORKER_THRESHOLD:
+            self.start_worker(engine, TrialsCollector(num_coins, trials), COIN_TRIALS_BATCH_FLIPS)
+            return
+        self.show_results(num_coins, engine, engine.run(num_coins, trials))
+
+    def flip_coins_gpu(self, num_coins: int) -> CoinBuffer:
+        """Generate random coin flips using GPU acceleration with batch processing.
+        
+        Flips are produced by the frame's engine as packed batches, together
+        with their 'Pile' count.
         
-        while remaining > 0:
-            batch_size: int = min(DICE_BATCH_SIZE, remaining)
-            random_tensor: torch.Tensor = torch.rand(batch_size, device=self.device)
-            results.extend(['Pile' if x < 0.5 else 'Face' for x in random_tensor.cpu()])
-            remaining -= batch_size
+        Args:
+            num_coins: Number of coins to flip
             
-        return results
+        Returns:
+            Bit-packed coin flip results ('Pile' or 'Face')
+        """
+        return self.engine.flip(num_coins)
+
+    def collect_flips(self, collector: FlipCollector) -> None:
+        """Stream a run's flips through a collector on the calling thread.
+        
+        Args:
+            collector: Consumer keeping or analysing the flips
+        """
+        for _ in collector.consume(self.engine):
+            pass
+
     def display_results_progressively(
         self,
-        results: List[str],
+        results: Union[CoinBuffer, WeightedOutcomes, List[str]],
         row: int,
         batch_size: int = BATCH_SIZE,
-        virtual_threshold: int = COIN_VIRTUAL_THRESHOLD,
+        virtual_threshold: int = COIN_INLINE_THRESHOLD,
         values_per_line: int = ITEMS_PER_LINE
     ) -> None:
-        def create_virtual_display(data: List[str], sample_size: int = 1000) -> str:
+        def create_virtual_display(data: CoinBuffer, sample_size: int = 1000) -> str:
             # Format first chunk
-            first_chunk = [' → '.join(data[i:i+values_per_line]) 
-                                for i in range(0, min(sample_size, len(data)), values_per_line)]
+            first_chunk = data.format_lines(0, min(sample_size, len(data)), values_per_line)
             # Format last chunk
-            last_chunk = [' → '.join(data[i:i+values_per_line]) 
-                                for i in range(max(len(data)-sample_size, 0), len(data), values_per_line)]
+            last_chunk = data.format_lines(max(len(data) - sample_size, 0), len(data), values_per_line)
             
             return (
-                f"Total flips: {len(data):,}\n\n"
+                f"Total flips: {len(data):,} (full sequence in the table below)\n\n"
                 f"First {sample_size} results:\n"
-                f"\n".join(first_chunk) + "\n\n"
+                + first_chunk + "\n\n"
                 f"[... {len(data) - 2*sample_size:,} flips ...]\n\n"
                 f"Last {sample_size} results:\n"
-                f"\n".join(last_chunk)
+                + last_chunk
             )
 
+        results = self.as_sequence(results)
+
         # Virtual mode check
         if len(results) > virtual_threshold:
+            self.sequence_renderer.cancel()
             virtual_display = create_virtual_display(results)
             wx.CallAfter(self.grid.SetCellValue, row, 1, virtual_display)
             return
 
         self.handle_sequence_display(results, row)
 
-    def handle_sequence_display(self, results: List[str], row: int) -> None:
-        """Efficiently handle large sequence displays with buffering and chunking.
+    def handle_sequence_display(self, results: Union[CoinBuffer, WeightedOutcomes, List[str]], row: int) -> None:
+        """Render the full sequence into the details cell, one block of lines at a time.
+        
+        Formatted blocks are appended to the renderer's buffer on timer ticks
+        and the cell is redrawn at spaced-out frames; small sequences are
+        rendered at once.
         
         Args:
-            results: List of coin flip results
+            results: Coin flip results
             row: Grid row to update
         """
-        buffer = []
-        last_update = time.time()
+        results = self.as_sequence(results)
         
-        def flush_buffer():
-            if buffer:
-                formatted = ' → '.join(buffer)
-                current = self.grid.GetCellValue(row, GRID_COLUMNS['DETAILS'])
-                new_value = f"{current}\n{formatted}" if current else formatted
-                wx.CallAfter(self.grid.SetCellValue, row, GRID_COLUMNS['DETAILS'], new_value)
-                wx.CallAfter(self.grid.AutoSizeRow, row)
-                buffer.clear()
+        def draw(text: str) -> None:
+            self.grid.SetCellValue(row, GRID_COLUMNS['DETAILS'], text)
         
-        for i, result in enumerate(results):
-            buffer.append(result)
-            
-            # Flush buffer when full or enough time has passed
-            if (len(buffer) >= ITEMS_PER_LINE or 
-                time.time() - last_update >= SEQUENCE_UPDATE_INTERVAL):
-                flush_buffer()
-                last_update = time.time()
-                
-                # Allow UI to process events
-                wx.YieldIfNeeded()
-                time.sleep(0.001)  # Prevent UI freezing
-                
-        # Flush any remaining results
-        flush_buffer()
-        
-    def generate_statistical_summary(self, results: List[str]) -> str:
+        self.sequence_renderer.start(
+            iter_line_blocks(results.format_lines, len(results), ITEMS_PER_LINE),
+            draw,
+            on_done=lambda: self.grid.AutoSizeRow(row),
+            synchronous=len(results) <= RENDER_SYNC_LIMIT
+        )
+        
+    def generate_statistical_summary(
+        self,
+        results: Union[CoinBuffer, CoinCounts, List[str]],
+        runs: Optional[RunStatistics] = None
+    ) -> str:
         """Generate a comprehensive statistical summary of flip results.
         
         Args:
-            results: List of coin flip results
+            results: Coin flip results, or the totals of a counts-only run
+            runs: Precomputed run analysis, computed from the flips when omitted
             
         Returns:
             Formatted string containing statistical summary
         """
+        if isinstance(results, WeightedOutcomes):
+            return self.generate_outcome_summary(results)
+        if not isinstance(results, CoinCounts):
+            results = CoinBuffer.coerce(results)
+            if runs is None:
+                runs = analyze_runs(results)
         total = len(results)
-        piles = results.count('Pile')
-        faces = results.count('Face')
+        piles = results.piles
+        faces = results.faces
         
-        return (
+        summary = (
             f"Total Flips: {total:,}\n"
             f"Pile: {piles:,} ({(piles/total)*100:.2f}%)\n"
             f"Face: {faces:,} ({(faces/total)*100:.2f}%)\n"
-            f"Ratio Pile/Face: {piles/faces:.3f}"
+            f"Ratio Pile/Face: {self.format_ratio(piles, faces)}"
         )
+        if runs is not None:
+            summary += "\n\n" + self.generate_run_summary(runs)
+        return summary
 
-    def update_display(self, results: List[str], row: int) -> None:
+    def generate_outcome_summary(self, results: WeightedOutcomes) -> str:
+        """Format the statistics view of a weighted run against its expected odds.
+        
+        Args:
+            results: Weighted outcomes of the run
+            
+        Returns:
+            Formatted string with observed and expected frequencies and a
+            chi-square goodness-of-fit statistic
+        """
+        total: int = len(results)
+        expected = results.probabilities * total
+        observed = results.counts
+        nonzero = expected > 0
+        chi_square: float = float((((observed - expected) ** 2)[nonzero] / expected[nonzero]).sum())
+        
+        lines: List[str] = [f"Total Draws: {total:,}"]
+        for label, count, probability in zip(results.labels, observed.tolist(), results.probabilities.tolist()):
+            lines.append(f"{label}: {count:,} ({count/max(total, 1)*100:.2f}%, expected {probability*100:.2f}%)")
+        lines.append(f"Chi-square: {chi_square:.3f} ({int(nonzero.sum()) - 1} degrees of freedom)")
+        return "\n".join(lines)
+
+    def generate_trials_summary(self, results: TrialCounts) -> str:
+        """Format a trials run against the exact binomial distribution.
+        
+        Args:
+            results: Histogram of 'Pile' counts per trial
+            
+        Returns:
+            Formatted string with moments and the most likely 'Pile' counts
+        """
+        expected = results.expected
+        lines: List[str] = [
+            f"Trials: {results.trials:,} × {results.coins:,} coins",
+            f"Mean Piles per trial: {results.mean:.4f} (expected {results.coins * results.p:.4f})",
+            f"Variance: {results.variance:.4f} (expected {results.coins * results.p * (1 - results.p):.4f})",
+            "Piles per trial: observed / expected"
+        ]
+        shown = np.sort(np.argsort(expected)[-COIN_TRIALS_SUMMARY_LINES:])
+        for piles in shown.tolist():
+            lines.append(f"  {piles}: {int(results.histogram[piles]):,} / {expected[piles]:,.1f}")
+        return "\n".join(lines)
+
+    def generate_run_summary(self, runs: RunStatistics) -> str:
+        """Format the run-length section of the statistics view.
+        
+        Args:
+            runs: Run-length statistics of the sequence
+            
+        Returns:
+            Formatted string with run counts, longest runs and histogram
+        """
+        lines: List[str] = [
+            "--- Runs ---",
+            f"Total runs: {runs.runs:,}",
+            f"Expected runs: {runs.expected_runs:,.1f} ± {runs.runs_std:,.1f} (z = {runs.z_score:+.2f})",
+            f"Longest Pile run: {runs.longest('Pile')}",
+            f"Longest Face run: {runs.longest('Face')}",
+            "Run lengths (Pile / Face):"
+        ]
+        piles_histogram, faces_histogram = runs.histograms['Pile'], runs.histograms['Face']
+        longest: int = max(len(piles_histogram), len(faces_histogram)) - 1
+        for length in range(1, min(longest, COIN_RUN_HISTOGRAM_LINES) + 1):
+            piles_count = piles_histogram[length] if length < len(piles_histogram) else 0
+            faces_count = faces_histogram[length] if length < len(faces_histogram) else 0
+            lines.append(f"  {length}: {piles_count:,} / {faces_count:,}")
+        if longest > COIN_RUN_HISTOGRAM_LINES:
+            tail = COIN_RUN_HISTOGRAM_LINES + 1
+            lines.append(
+                f"  ≥{tail}: {piles_histogram[tail:].sum():,} / {faces_histogram[tail:].sum():,}"
+            )
+        return "\n".join(lines)
+
+    def generate_walk_display(self, results: Union[CoinBuffer, CoinCounts, WeightedOutcomes, List[str]]) -> str:
+        """Format the random-walk view, analysing kept flips on demand.
+        
+        Args:
+            results: Coin flip results, the totals of a counts-only run, or weighted outcomes
+            
+        Returns:
+            Formatted random-walk summary
+        """
+        if isinstance(results, WeightedOutcomes):
+            return "Random walk is only available for coin flips"
+        if isinstance(results, CoinCounts):
+            if self.current_walk is None:
+                return (
+                    f"Final position: {results.piles - results.faces:+,}\n\n"
+                    "Individual flips not kept (counts-only run)"
+                )
+            return self.generate_walk_summary(self.current_walk)
+        return self.generate_walk_summary(analyze_walk(CoinBuffer.coerce(results), self.get_walk_levels()))
+
+    def generate_walk_summary(self, walk: WalkStatistics) -> str:
+        """Format random-walk statistics ('Pile' = +1, 'Face' = -1).
+        
+        Args:
+            walk: Random-walk statistics of the sequence
+            
+        Returns:
+            Formatted string with positions, returns to zero and first passages
+        """
+        lines: List[str] = [
+            "--- Random Walk (Pile = +1, Face = -1) ---",
+            f"Steps: {walk.steps:,}",
+            f"Final position: {walk.position:+,}",
+            f"Maximum: {walk.maximum:+,} (step {walk.maximum_step:,})",
+            f"Minimum: {walk.minimum:+,} (step {walk.minimum_step:,})",
+            f"Returns to zero: {walk.returns_to_zero:,} (fair coin: ≈ {walk.expected_returns:,.0f})",
+            "First passage:"
+        ]
+        for level, step in sorted(walk.first_passages.items()):
+            lines.append(f"  {level:+,}: " + (f"step {step:,}" if step is not None else "not reached"))
+        lines.append(f"Path: {len(walk.path):,} points")
+        return "\n".join(lines)
+
+    def get_convergence(
+        self,
+        results: Union[CoinBuffer, CoinCounts, WeightedOutcomes, List[str]]
+    ) -> Optional[ConvergenceSeries]:
+        """Return the running-proportion series of the results, analysing kept flips on demand.
+        
+        Args:
+            results: Coin flip results, the totals of a counts-only run, or weighted outcomes
+            
+        Returns:
+            Running 'Pile' proportion, or None when the individual flips are unavailable
+        """
+        if isinstance(results, WeightedOutcomes):
+            return None
+        if isinstance(results, CoinCounts):
+            return self.current_convergence
+        return analyze_convergence(CoinBuffer.coerce(results))
+
+    def generate_convergence_display(
+        self,
+        results: Union[CoinBuffer, CoinCounts, WeightedOutcomes, List[str]],
+        series: Optional[ConvergenceSeries]
+    ) -> str:
+        """Format the final proportion shown beside the convergence plot.
+        
+        Args:
+            results: Coin flip results, the totals of a counts-only run, or weighted outcomes
+            series: Running-proportion series drawn in the plot, if any
+            
+        Returns:
+            Final 'Pile' proportion against p ± 1.96σ
+        """
+        if isinstance(results, WeightedOutcomes):
+            return "Convergence is only available for coin flips"
+        p: float = self.engine.p
+        if series is None:
+            flips: int = max(results.piles + results.faces, 1)
+            return (
+                f"Final Pile proportion: {results.piles / flips:.6f} (p = {p:g})\n\n"
+                "Individual flips not kept (counts-only run)"
+            )
+        if not series.total:
+            return "No flips"
+        low, high = (float(bound[-1]) for bound in series.envelope(p))
+        proportion: float = series.piles / series.total
+        return "\n".join([
+            "--- Convergence (running Pile proportion) ---",
+            f"Flips: {series.total:,}",
+            f"Final proportion: {proportion:.6f} (p = {p:g})",
+            f"Deviation: {proportion - p:+.6f}",
+            f"95% band: [{low:.6f}, {high:.6f}] "
+            + ("inside" if low <= proportion <= high else "outside"),
+            f"Plot: {len(series.steps):,} points"
+        ])
+
+    def on_search_pattern(self, event: wx.CommandEvent) -> None:
+        """Search the current flips for the typed pattern.
+        
+        Args:
+            event: The button click event
+        """
+        try:
+            if not isinstance(self.current_results, CoinBuffer):
+                self.pattern_result.SetValue("Pattern search needs the individual flips of a coin run")
+                return
+            matches = find_pattern(
+                self.current_results,
+                parse_pattern(self.pattern_input.GetValue()),
+                overlapping=self.pattern_overlap.GetValue(),
+                p=self.engine.p
+            )
+            self.pattern_result.SetValue(self.generate_pattern_summary(matches))
+        except Exception as e:
+            wx.MessageDialog(self, f"Erreur: {str(e)}", "Erreur").ShowModal()
+
+    def generate_pattern_summary(self, matches: PatternMatches) -> str:
+        """Format a pattern search against its expected number of matches.
+        
+        Args:
+            matches: Occurrences of the pattern
+            
+        Returns:
+            Formatted string with the match count, expectation and first positions
+        """
+        pattern: str = ''.join('P' if bit else 'F' for bit in matches.pattern.tolist())
+        kind: str = "Overlapping" if matches.overlapping else "Non-overlapping"
+        summary: str = (
+            f"Pattern: {pattern} ({len(matches.pattern)} flips)\n"
+            f"{kind} matches: {matches.count:,} (expected {matches.expected:,.1f})"
+        )
+        if len(matches.positions):
+            # 1-based positions, as in the sequence table
+            label: str = (
+                "Positions" if len(matches.positions) == matches.count
+                else f"First {len(matches.positions):,} positions"
+            )
+            summary += (
+                f"\n{label}: " +
+                ", ".join(f"{position + 1:,}" for position in matches.positions.tolist())
+            )
+        return summary
+
+    @staticmethod
+    def format_ratio(piles: int, faces: int) -> str:
+        """Format the Pile/Face ratio, guarding against runs without any Face."""
+        return f"{piles/faces:.3f}" if faces else "∞"
+
+    @staticmethod
+    def as_sequence(results: Union[CoinBuffer, WeightedOutcomes, List[str]]) -> Union[CoinBuffer, WeightedOutcomes]:
+        """Return weighted outcomes unchanged and coin results as a packed buffer."""
+        if isinstance(results, WeightedOutcomes):
+            return results
+        return CoinBuffer.coerce(results)
+
+    def update_display(
+        self,
+        results: Union[CoinBuffer, CoinCounts, WeightedOutcomes, TrialCounts, List[str]],
+        row: int
+    ) -> None:
         """Update the grid display based on current view mode.
         
         Args:
-            results: List of coin flip results
+            results: Coin flip results, the totals of a counts-only run, weighted outcomes or trials
             row: Grid row to update
         """
         selected_mode = self.view_mode.GetString(self.view_mode.GetSelection())
+        self.sequence_renderer.cancel()
+        
+        if isinstance(results, TrialCounts):
+            self.show_sequence(None)
+            self.show_plot(results)
+            self.grid.SetCellValue(row, 1, self.generate_trials_summary(results))
+            return
+        
+        if selected_mode == ViewMode.CONVERGENCE.value:
+            self.show_sequence(None)
+            series = self.get_convergence(results)
+            self.show_plot(series)
+            self.grid.SetCellValue(row, 1, self.generate_convergence_display(results, series))
+            return
+        self.show_plot(None)
         
+        if selected_mode == ViewMode.RANDOM_WALK.value:
+            self.show_sequence(None)
+            self.grid.SetCellValue(row, 1, self.generate_walk_display(results))
+            return
+        
+        if isinstance(results, CoinCounts) or (isinstance(results, WeightedOutcomes) and results.indices is None):
+            self.show_sequence(None)
+            summary = self.generate_statistical_summary(results, self.current_runs)
+            if selected_mode != ViewMode.STATISTICS.value:
+                summary += "\n\nIndividual flips not kept (counts-only run)"
+            self.grid.SetCellValue(row, 1, summary)
+            return
+        
+        results = self.as_sequence(results)
+        is_large_full_view = selected_mode == ViewMode.FULL.value and len(results) > COIN_INLINE_THRESHOLD
+        self.show_sequence(results if is_large_full_view else None)
         if selected_mode == ViewMode.FULL.value:
-            self.handle_sequence_display(results, row)
+            self.display_results_progressively(results, row)
         elif selected_mode == ViewMode.STATISTICS.value:
             self.grid.SetCellValue(row, 1, self.generate_statistical_summary(results))
         else:  # Sample mode
             sample_size = min(COIN_SAMPLE_SIZE, len(results))
             sample_display = (
                 f"Sample of first {sample_size} results:\n" +
-                ' → '.join(results[:sample_size]) +
+                results.format_lines(0, sample_size, sample_size) +
                 f"\n... and {len(results) - sample_size} more results"
             )
             self.grid.SetCellValue(row, 1, sample_display)
 
+    def show_plot(self, results: Optional[Union[TrialCounts, ConvergenceSeries]]) -> None:
+        """Plot a trials histogram or a running proportion, or hide the plot.
+        
+        Trials are drawn against the exact binomial PMF; the running 'Pile'
+        proportion is drawn with its bucket min/max, the probability of 'Pile'
+        and the 95% band around it.
+        
+        Args:
+            results: Trials histogram or running-proportion series to plot, or None to hide the plot
+        """
+        if isinstance(results, ConvergenceSeries):
+            self.plot_panel.set_series(
+                results.steps,
+                results.proportion,
+                band=(results.low, results.high),
+                reference=self.engine.p,
+                envelope=results.envelope(self.engine.p),
+                title=f"Running Pile proportion over {results.total:,} flips (red: p, dashed: 95% band)"
+            )
+        elif results is not None:
+            self.plot_panel.set_histogram(
+                np.arange(results.coins + 1),
+                results.histogram,
+                overlay=results.expected,
+                title=f"Pile count per trial, {results.trials:,} trials of {results.coins:,} coins (red: binomial PMF)"
+            )
+        if self.plot_panel.IsShown() != (results is not None):
+            self.plot_panel.Show(results is not None)
+            self.panel.Layout()
+
+    def show_sequence(self, results: Optional[Union[CoinBuffer, WeightedOutcomes]]) -> None:
+        """Load a sequence into the virtual sequence view, or hide the view.
+        
+        Args:
+            results: Flips to browse, or None to hide the view
+        """
+        self.sequence_table.set_results(results)
+        if self.sequence_grid.IsShown() != (results is not None):
+            self.sequence_grid.Show(results is not None)
+            self.panel.Layout()
+
     def handle_flip_coins(self, event: wx.CommandEvent) -> None:
         """Handle the coin flip button click event with enhanced display handling.
+        
+        Small runs are generated directly; larger ones are handed to a
+        background worker so the window stays responsive.
     
         Args:
             event: The button click event
         """
         try:
-            num_coins: int = self.coin_input.GetValue()
+            if self.is_worker_running():
+                return
+            num_coins: int = self.get_coin_count()
         
             self.grid.ClearGrid()
-            results = self.flip_coins_gpu(num_coins)
-            self.current_results = results
+            self.current_runs = None
+            self.current_walk = None
+            self.current_convergence = None
+            weights_text: str = self.weights_input.GetValue().strip()
+            if weights_text:
+                self.draw_weighted_outcomes(num_coins, weights_text)
+                return
+            trials: int = self.trials_input.GetValue()
+            if trials > 1:
+                self.run_coin_trials(num_coins, trials)
+                return
+            
+            self.select_coin_engines()
+            selected_mode = self.view_mode.GetString(self.view_mode.GetSelection())
+            if not self.is_counts_only(num_coins):
+                if num_coins > COIN_WORKER_THRESHOLD:
+                    self.start_worker(self.engine, FlipCollector(num_coins))
+                    return
+                engine: Union[CoinEngine, BinomialCoinEngine] = self.engine
+                results = self.flip_coins_gpu(num_coins)
+            elif ((selected_mode == ViewMode.STATISTICS.value and num_coins <= COIN_RUN_ANALYSIS_LIMIT) or
+                  (selected_mode == ViewMode.RANDOM_WALK.value and num_coins <= COIN_WALK_ANALYSIS_LIMIT) or
+                  (selected_mode == ViewMode.CONVERGENCE.value and num_coins <= COIN_CONVERGENCE_ANALYSIS_LIMIT)):
+                # Small enough to stream through the run, random-walk or convergence analysis
+                is_walk: bool = selected_mode == ViewMode.RANDOM_WALK.value
+                collector = FlipCollector(
+                    num_coins,
+                    keep_flips=False,
+                    analyze_runs=selected_mode == ViewMode.STATISTICS.value,
+                    analyze_walk=is_walk,
+                    walk_levels=self.get_walk_levels() if is_walk else COIN_WALK_LEVELS,
+                    analyze_convergence=selected_mode == ViewMode.CONVERGENCE.value
+                )
+                if num_coins > COIN_WORKER_THRESHOLD:
+                    self.start_worker(self.engine, collector)
+                    return
+                engine = self.engine
+                self.collect_flips(collector)
+                results, self.current_runs = collector.result()
+                self.current_walk = collector.walk_result()
+                self.current_convergence = collector.convergence_result()
+            else:
+                engine = self.counts_engine
+                results = engine.count(num_coins)
+            
+            self.show_results(num_coins, engine, results)
         
-            piles = results.count('Pile')
-            faces = results.count('Face')
-            # Colonne NOTATION
-            self.grid.SetCellValue(0, GRID_COLUMNS['NOTATION'], f"{num_coins} pièces")
+        except Exception as e:
+            wx.MessageDialog(self, f"Erreur: {str(e)}", "Erreur").ShowModal()
 
-            # Colonne TOTAL
-            self.grid.SetCellValue(0, GRID_COLUMNS['TOTAL'], 
-                f"Pile: {piles}\nFace: {faces}")
+    def update_summary_columns(self, num_coins: int, piles: int, faces: int) -> None:
+        """Fill the NOTATION, TOTAL, AVERAGE and MINMAX columns from counts.
+        
+        Args:
+            num_coins: Number of coins shown in the notation column
+            piles: Number of 'Pile' results
+            faces: Number of 'Face' results
+        """
+        flips: int = max(piles + faces, 1)
+        # Colonne NOTATION
+        self.grid.SetCellValue(0, GRID_COLUMNS['NOTATION'], f"{num_coins:,} pièces")
 
-            # Colonne AVERAGE
-            self.grid.SetCellValue(0, GRID_COLUMNS['AVERAGE'],
-                f"Pile: {piles/num_coins:.2%}\nFace: {faces/num_coins:.2%}")
+        # Colonne TOTAL
+        self.grid.SetCellValue(0, GRID_COLUMNS['TOTAL'], 
+            f"Pile: {piles}\nFace: {faces}")
 
-            # Colonne MINMAX
-            self.grid.SetCellValue(0, GRID_COLUMNS['MINMAX'],
-                f"Ratio P/F: {piles/faces:.3f}")
-            self.grid.AutoSizeColumns()
-            self.grid.AutoSizeRows()
+        # Colonne AVERAGE
+        self.grid.SetCellValue(0, GRID_COLUMNS['AVERAGE'],
+            f"Pile: {piles/flips:.2%}\nFace: {faces/flips:.2%}")
 
-            # Colonne DETAILS - déjà géré par update_display()
-            self.update_display(results, 0)
+        # Colonne MINMAX
+        self.grid.SetCellValue(0, GRID_COLUMNS['MINMAX'],
+            f"Ratio P/F: {self.format_ratio(piles, faces)}")
 
-            for col in range(len(GRID_COLUMNS)):
-                self.grid.SetColSize(col, self.grid.GetColSize(col) + 10)  # Add padding
+    def update_outcome_columns(self, results: WeightedOutcomes) -> None:
+        """Fill the NOTATION, TOTAL, AVERAGE and MINMAX columns of a weighted run.
+        
+        Args:
+            results: Weighted outcomes of the run
+        """
+        draws: int = max(len(results), 1)
+        self.grid.SetCellValue(0, GRID_COLUMNS['NOTATION'], f"{len(results):,} tirages")
+        self.grid.SetCellValue(0, GRID_COLUMNS['TOTAL'], "\n".join(
+            f"{label}: {count}" for label, count in zip(results.labels, results.counts.tolist())
+        ))
+        self.grid.SetCellValue(0, GRID_COLUMNS['AVERAGE'], "\n".join(
+            f"{label}: {count/draws:.2%}" for label, count in zip(results.labels, results.counts.tolist())
+        ))
+        self.grid.SetCellValue(0, GRID_COLUMNS['MINMAX'],
+            f"Max: {results.labels[int(results.counts.argmax())]}\n"
+            f"Min: {results.labels[int(results.counts.argmin())]}")
 
-            # Ensure the grid uses available space
-            self.grid.ForceRefresh()
+    def update_trial_columns(self, results: TrialCounts) -> None:
+        """Fill the NOTATION, TOTAL, AVERAGE and MINMAX columns of a trials run.
         
-            # Track history
+        Args:
+            results: Histogram of 'Pile' counts per trial
+        """
+        observed = np.flatnonzero(results.histogram)
+        self.grid.SetCellValue(0, GRID_COLUMNS['NOTATION'], f"{results.coins:,} pièces × {results.trials:,}")
+        self.grid.SetCellValue(0, GRID_COLUMNS['TOTAL'], f"Pile: {results.piles}\nFace: {results.faces}")
+        self.grid.SetCellValue(0, GRID_COLUMNS['AVERAGE'], f"Pile/essai: {results.mean:.3f}")
+        self.grid.SetCellValue(0, GRID_COLUMNS['MINMAX'], f"Min: {observed[0]}\nMax: {observed[-1]}")
+
+    def show_results(
+        self,
+        num_coins: int,
+        engine: Union[CoinEngine, BinomialCoinEngine, WeightedOutcomeEngine, CoinTrialsEngine],
+        results: Union[CoinBuffer, CoinCounts, WeightedOutcomes, TrialCounts],
+        cancelled: bool = False
+    ) -> None:
+        """Display a finished run and record it in the game history.
+        
+        Args:
+            num_coins: Number of coins requested
+            engine: Engine that generated the run
+            results: Flip results, the totals of a counts-only run, weighted outcomes or trials
+            cancelled: Whether the run was stopped before the end
+        """
+        self.current_results = results
+        if isinstance(results, WeightedOutcomes):
+            self.update_outcome_columns(results)
+        elif isinstance(results, TrialCounts):
+            self.update_trial_columns(results)
+        else:
+            self.update_summary_columns(len(results), results.piles, results.faces)
+        self.grid.AutoSizeColumns()
+        self.grid.AutoSizeRows()
+
+        # Colonne DETAILS - déjà géré par update_display()
+        self.update_display(results, 0)
+
+        for col in range(len(GRID_COLUMNS)):
+            self.grid.SetColSize(col, self.grid.GetColSize(col) + 10)  # Add padding
+
+        # Ensure the grid uses available space
+        self.grid.ForceRefresh()
+    
+        # Track history
+        if isinstance(results, TrialCounts):
+            metadata = {
+                'num_coins': results.coins,
+                'trials': results.trials,
+                'piles': results.piles,
+                'faces': results.faces,
+                'histogram': results.histogram.tolist(),
+                'p': results.p,
+                'engine': engine.name,
+                'device': str(self.device)
+            }
+        elif isinstance(results, WeightedOutcomes):
+            metadata = {
+                'num_draws': len(results),
+                'outcomes': dict(zip(results.labels, results.counts.tolist())),
+                'probabilities': dict(zip(results.labels, results.probabilities.tolist())),
+                'engine': engine.name,
+                'counts_only': results.indices is None,
+                'device': str(self.device)
+            }
+        else:
             metadata = {
-                'num_coins': num_coins,
-                'piles': piles,
-                'faces': faces,
+                'num_coins': len(results),
+                'piles': results.piles,
+                'faces': results.faces,
+                'p': engine.p,
+                'engine': engine.name,
+                'counts_only': isinstance(results, CoinCounts),
                 'device': str(self.device)
             }
+        if cancelled:
+            metadata['cancelled'] = True
+            metadata['requested_coins'] = num_coins
+    
+        from project import track_game_history
+        game_event = track_game_history('coin', results, metadata)
+        GameHistory.get_instance().add_event(game_event)
+
+    def is_worker_running(self) -> bool:
+        """Tell whether a background flip run is in progress."""
+        return self.worker_thread is not None and self.worker_thread.is_alive()
+
+    def start_worker(
+        self,
+        engine: Union[CoinEngine, CoinTrialsEngine, WeightedOutcomeEngine],
+        collector: Union[FlipCollector, TrialsCollector, WeightedCollector],
+        batch_size: int = COIN_WORKER_BATCH_SIZE
+    ) -> None:
+        """Start a background flip, trials or weighted run and the timer draining its results.
+        
+        Args:
+            engine: Engine generating the flips, trials or weighted outcomes
+            collector: Collector fed on the worker thread
+            batch_size: Flips per worker batch
+        """
+        self.result_queue = queue.Queue(maxsize=COIN_WORKER_QUEUE_SIZE)
+        self.collector = collector
+        self.worker_result = None
+        self.worker_error = None
+        self.worker_thread = CoinFlipWorker(engine, collector, self.result_queue, batch_size)
+        self.flip_btn.Disable()
+        self.cancel_btn.Enable()
+        self.progress_gauge.SetValue(0)
+        self.grid.SetCellValue(0, GRID_COLUMNS['DETAILS'], "Running...")
+        self.worker_thread.start()
+        self.drain_timer.Start(COIN_DRAIN_INTERVAL_MS)
+
+    def on_drain_timer(self, event: wx.TimerEvent) -> None:
+        """Drain worker messages within a time budget and show partial statistics.
         
-            from project import track_game_history
-            game_event = track_game_history('coin', results, metadata)
-            GameHistory.get_instance().add_event(game_event)
+        Args:
+            event: The timer event
+        """
+        if self.collector is None:
+            return
+        num_coins: int = self.collector.num_coins
+        deadline: float = time.perf_counter() + COIN_DRAIN_BUDGET
+        finished: Optional[bool] = None
+        summary: Optional[Union[CoinCounts, TrialCounts, WeightedOutcomes]] = None
         
-        except Exception as e:
-            wx.MessageDialog(self, f"Erreur: {str(e)}", "Erreur").ShowModal()
+        try:
+            while time.perf_counter() < deadline:
+                kind, payload = self.result_queue.get_nowait()
+                if kind == 'progress':
+                    summary = payload
+                elif kind == 'result':
+                    self.worker_result = payload
+                elif kind == 'error':
+                    self.worker_error = payload
+                elif kind == 'done':
+                    finished = payload
+                    break
+        except queue.Empty:
+            pass
+        
+        if finished is None:
+            if summary is not None:
+                self.show_progress(summary)
+            return
+        
+        # The run is torn down before any dialog, whose modal loop would run this timer again
+        engine = self.worker_thread.engine
+        self.drain_timer.Stop()
+        self.collector = None
+        self.worker_thread = None
+        self.flip_btn.Enable()
+        self.cancel_btn.Disable()
+        if self.worker_result is None:
+            error, self.worker_error = self.worker_error, None
+            self.grid.SetCellValue(0, GRID_COLUMNS['DETAILS'], "Error")
+            wx.MessageDialog(self, f"Erreur: {str(error)}", "Erreur").ShowModal()
+            return
+        results, self.current_runs, self.current_walk, self.current_convergence = self.worker_result
+        self.worker_result = None
+        if not finished:
+            self.progress_gauge.SetValue(COIN_PROGRESS_RANGE)
+        self.show_results(num_coins, engine, results, cancelled=finished)
+
+    def show_progress(self, summary: Union[CoinCounts, TrialCounts, WeightedOutcomes]) -> None:
+        """Show the partial summary posted by the background worker.
+        
+        Args:
+            summary: Totals of the flips or draws so far, or histogram of the trials so far
+        """
+        if isinstance(summary, TrialCounts):
+            done, total, unit = summary.trials, self.collector.trials, "trials"
+            self.update_trial_columns(summary)
+        elif isinstance(summary, WeightedOutcomes):
+            done, total, unit = len(summary), self.collector.num_coins, "draws"
+            self.update_outcome_columns(summary)
+        else:
+            done, total, unit = len(summary), self.collector.num_coins, "flips"
+            self.update_summary_columns(self.collector.num_coins, summary.piles, summary.faces)
+        self.progress_gauge.SetValue(int(done / total * COIN_PROGRESS_RANGE))
+        self.grid.SetCellValue(0, GRID_COLUMNS['DETAILS'], f"Running... {done:,} / {total:,} {unit}")
+
+    def on_cancel(self, event: wx.CommandEvent) -> None:
+        """Handle the cancel button by stopping the background worker.
+        
+        Args:
+            event: The button click event
+        """
+        if self.is_worker_running():
+            self.worker_thread.cancel()
+
+    def stop_worker(self) -> None:
+        """Stop the background worker and its timer, waiting for the thread to exit.
+        
+        The queue is emptied while waiting, so a worker blocked on the full
+        queue can post its last message and return.
+        """
+        if hasattr(self, 'drain_timer'):
+            self.drain_timer.Stop()
+        if self.worker_thread is not None:
+            self.worker_thread.cancel()
+            deadline: float = time.perf_counter() + COIN_WORKER_JOIN_TIMEOUT
+            while self.worker_thread.is_alive() and time.perf_counter() < deadline:
+                try:
+                    while True:
+                        self.result_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self.worker_thread.join(timeout=COIN_WORKER_JOIN_POLL)
+            self.worker_thread = None
+        self.collector = None
+
+    def on_close(self, event: wx.CloseEvent) -> None:
+        """Stop any background run before the frame closes.
+        
+        Args:
+            event: The close event
+        """
+        self.stop_worker()
+        self.sequence_renderer.cancel()
+        event.Skip()
+
+    def Destroy(self) -> bool:
+        """Stop any background run, then destroy the frame."""
+        self.stop_worker()
+        self.sequence_renderer.cancel()
+        return super().Destroy()
 
     def on_view_mode_change(self, event: wx.CommandEvent) -> None:
         """Handle changes in view mode selection.
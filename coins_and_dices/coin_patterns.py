@@ -0,0 +1,224 @@
+from typing import List
+import re
+import numpy as np
+from .coin_buffer import CoinBuffer
+from .constants import COIN_ANALYSIS_CHUNK, COIN_PATTERN_MAX_POSITIONS
+
+PATTERN_TOKEN = re.compile(r'([PF])(?:\{(\d+)\})?')
+
+def parse_pattern(text: str) -> np.ndarray:
+    """Parse a coin pattern such as 'PPFPF' or 'P{10}F'.
+
+    'P' stands for 'Pile' and 'F' for 'Face'; a letter followed by {n} is
+    repeated n times. Case and spaces are ignored.
+
+    Args:
+        text: Pattern to parse
+
+    Returns:
+        uint8 array of pattern bits (1 = 'Pile')
+
+    Raises:
+        ValueError: If the pattern is empty or malformed
+    """
+    compact: str = re.sub(r'\s+', '', text).upper()
+    bits: List[int] = []
+    position: int = 0
+    while position < len(compact):
+        match = PATTERN_TOKEN.match(compact, position)
+        if match is None:
+            raise ValueError(f"Invalid coin pattern: {text}")
+        bits.extend([int(match.group(1) == 'P')] * int(match.group(2) or 1))
+        position = match.end()
+    if not bits:
+        raise ValueError("Coin pattern must not be empty")
+    return np.array(bits, dtype=np.uint8)
+
+def pattern_borders(pattern: np.ndarray) -> List[int]:
+    """Return the lengths of the pattern's borders, the pattern itself included.
+
+    A border is a proper prefix that is also a suffix; it is where two
+    occurrences can overlap. Lengths come from the KMP failure function,
+    longest first.
+
+    Args:
+        pattern: Pattern bits
+
+    Returns:
+        Border lengths in decreasing order, starting with len(pattern)
+    """
+    failure: List[int] = [0] * len(pattern)
+    length: int = 0
+    for i in range(1, len(pattern)):
+        while length and pattern[i] != pattern[length]:
+            length = failure[length - 1]
+        if pattern[i] == pattern[length]:
+            length += 1
+        failure[i] = length
+
+    borders: List[int] = [len(pattern)]
+    while failure[borders[-1] - 1]:
+        borders.append(failure[borders[-1] - 1])
+    return borders
+
+class PatternMatches:
+    """Occurrences of a pattern in a coin sequence.
+
+    Attributes:
+        pattern (np.ndarray): Pattern bits
+        total (int): Number of flips searched
+        count (int): Number of occurrences
+        positions (np.ndarray): 0-based start of the first occurrences
+        overlapping (bool): Whether occurrences may share flips
+        p (float): Probability of 'Pile' used for the expectation
+    """
+
+    def __init__(
+        self,
+        pattern: np.ndarray,
+        total: int,
+        count: int,
+        positions: np.ndarray,
+        overlapping: bool,
+        p: float
+    ) -> None:
+        self.pattern: np.ndarray = pattern
+        self.total: int = total
+        self.count: int = count
+        self.positions: np.ndarray = positions
+        self.overlapping: bool = overlapping
+        self.p: float = p
+
+    def prefix_probability(self, length: int) -> float:
+        """Probability that `length` consecutive flips spell the start of the pattern."""
+        piles: int = int(self.pattern[:length].sum())
+        return self.p ** piles * (1 - self.p) ** (length - piles)
+
+    @property
+    def expected(self) -> float:
+        """Expected number of occurrences in a random sequence of the same length.
+
+        Overlapping occurrences: (n - m + 1) * P(pattern). Non-overlapping
+        occurrences restart the search after each match, a renewal process
+        whose mean inter-arrival time is the sum of 1 / P(border) over the
+        pattern's borders, so about n / that sum occurrences are expected.
+        """
+        length: int = len(self.pattern)
+        if self.total < length:
+            return 0.0
+        if self.overlapping:
+            return (self.total - length + 1) * self.prefix_probability(length)
+        probabilities = [self.prefix_probability(border) for border in pattern_borders(self.pattern)]
+        if not all(probabilities):
+            return 0.0
+        return self.total / sum(1 / probability for probability in probabilities)
+
+class PatternScanner:
+    """Streaming pattern search over consecutive chunks of flips.
+
+    Candidates start as every position matching the first pattern flip and
+    are filtered one pattern flip at a time with vectorized comparisons, so
+    the candidate set roughly halves at each step. The last m - 1 flips of a
+    chunk are carried into the next one, so occurrences crossing chunk
+    boundaries are found exactly once.
+    """
+
+    def __init__(
+        self,
+        pattern: np.ndarray,
+        overlapping: bool = True,
+        max_positions: int = COIN_PATTERN_MAX_POSITIONS
+    ) -> None:
+        self.pattern: np.ndarray = pattern
+        self.overlapping: bool = overlapping
+        self.max_positions: int = max_positions
+        self.total: int = 0
+        self.count: int = 0
+        self._positions: List[np.ndarray] = []
+        self._stored: int = 0
+        self._tail: np.ndarray = np.empty(0, dtype=np.uint8)
+        self._next_free: int = 0  # First position a non-overlapping match may use
+
+    def _select_non_overlapping(self, starts: np.ndarray) -> np.ndarray:
+        # Greedy left-to-right selection. A match at least m flips after the
+        # previous match is always kept, so only clustered matches need a loop.
+        length: int = len(self.pattern)
+        starts = starts[starts >= self._next_free]
+        clustered = np.flatnonzero(np.diff(starts) < length) + 1
+        if not len(clustered):
+            return starts
+        keep = np.ones(len(starts), dtype=bool)
+        positions: List[int] = starts.tolist()
+        last_end: int = 0
+        previous: int = -1
+        for index in clustered.tolist():
+            if index - 1 != previous:  # The match opening the cluster is kept
+                last_end = positions[index - 1] + length
+            if positions[index] < last_end:
+                keep[index] = False
+            else:
+                last_end = positions[index] + length
+            previous = index
+        return starts[keep]
+
+    def update(self, bits: np.ndarray) -> None:
+        """Add the next chunk of flips.
+
+        Args:
+            bits: uint8 array of 0/1 values (1 = 'Pile')
+        """
+        length: int = len(self.pattern)
+        window = np.concatenate((self._tail, bits)) if len(self._tail) else bits
+        offset: int = self.total - len(self._tail)  # Global position of window[0]
+        self.total += len(bits)
+        span: int = len(window) - length + 1
+        if span > 0:
+            candidates = np.flatnonzero(window[:span] == self.pattern[0])
+            for index in range(1, length):
+                if not len(candidates):
+                    break
+                candidates = candidates[window[candidates + index] == self.pattern[index]]
+            starts = candidates.astype(np.int64) + offset
+            if not self.overlapping:
+                starts = self._select_non_overlapping(starts)
+                if len(starts):
+                    self._next_free = int(starts[-1]) + length
+            self.count += len(starts)
+            if self._stored < self.max_positions and len(starts):
+                kept = starts[:self.max_positions - self._stored]
+                self._positions.append(kept)
+                self._stored += len(kept)
+        self._tail = window[max(len(window) - (length - 1), 0):].copy() if length > 1 else window[:0]
+
+    def result(self, p: float = 0.5) -> PatternMatches:
+        """Return the occurrences found so far.
+
+        Args:
+            p: Probability of 'Pile' used for the expected count
+        """
+        positions = np.concatenate(self._positions) if self._positions else np.empty(0, dtype=np.int64)
+        return PatternMatches(self.pattern, self.total, self.count, positions, self.overlapping, p)
+
+def find_pattern(
+    results: CoinBuffer,
+    pattern: np.ndarray,
+    overlapping: bool = True,
+    p: float = 0.5,
+    chunk_size: int = COIN_ANALYSIS_CHUNK
+) -> PatternMatches:
+    """Count and locate a pattern in a coin sequence, chunk by chunk.
+
+    Args:
+        results: Bit-packed coin flip results
+        pattern: Pattern bits, as returned by parse_pattern
+        overlapping: Count occurrences sharing flips, or restart after each match
+        p: Probability of 'Pile' used for the expected count
+        chunk_size: Number of flips unpacked at a time
+
+    Returns:
+        Occurrences of the pattern with their expected count
+    """
+    scanner = PatternScanner(pattern, overlapping)
+    for bits in results.iter_bits(chunk_size):
+        scanner.update(bits)
+    return scanner.result(p)
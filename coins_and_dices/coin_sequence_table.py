@@ -0,0 +1,77 @@
+from typing import Optional, Union
+import wx
+import wx.grid
+from .coin_buffer import CoinBuffer
+from .weighted_sampler import WeightedOutcomes
+from .constants import ITEMS_PER_LINE
+
+class CoinSequenceTable(wx.grid.GridTableBase):
+    """Virtual grid table showing a whole coin sequence, one line of flips per row.
+
+    The grid only asks for the rows it paints, so each row is decoded and
+    formatted from the packed buffer when it becomes visible. Scrolling
+    through millions of flips costs no memory beyond the buffer itself.
+
+    Attributes:
+        results (Optional[Union[CoinBuffer, WeightedOutcomes]]): Sequence being displayed
+        items_per_line (int): Number of flips per grid row
+    """
+
+    def __init__(self, items_per_line: int = ITEMS_PER_LINE) -> None:
+        super().__init__()
+        self.results: Optional[Union[CoinBuffer, WeightedOutcomes]] = None
+        self.items_per_line: int = items_per_line
+
+    def set_results(self, results: Optional[Union[CoinBuffer, WeightedOutcomes]]) -> None:
+        """Replace the displayed sequence and notify the attached grid.
+
+        Args:
+            results: New sequence, or None to clear the table
+        """
+        old_rows: int = self.GetNumberRows()
+        self.results = results
+        new_rows: int = self.GetNumberRows()
+        grid: Optional[wx.grid.Grid] = self.GetView()
+        if grid is None:
+            return
+
+        grid.BeginBatch()
+        if new_rows < old_rows:
+            grid.ProcessTableMessage(wx.grid.GridTableMessage(
+                self, wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED, new_rows, old_rows - new_rows
+            ))
+        elif new_rows > old_rows:
+            grid.ProcessTableMessage(wx.grid.GridTableMessage(
+                self, wx.grid.GRIDTABLE_NOTIFY_ROWS_APPENDED, new_rows - old_rows
+            ))
+        grid.ProcessTableMessage(wx.grid.GridTableMessage(
+            self, wx.grid.GRIDTABLE_REQUEST_VIEW_GET_VALUES
+        ))
+        grid.EndBatch()
+        grid.ForceRefresh()
+
+    def GetNumberRows(self) -> int:
+        if self.results is None:
+            return 0
+        return (len(self.results) + self.items_per_line - 1) // self.items_per_line
+
+    def GetNumberCols(self) -> int:
+        return 1
+
+    def IsEmptyCell(self, row: int, col: int) -> bool:
+        return self.results is None
+
+    def GetValue(self, row: int, col: int) -> str:
+        if self.results is None:
+            return ""
+        start: int = row * self.items_per_line
+        return self.results.format_lines(start, start + self.items_per_line, self.items_per_line)
+
+    def SetValue(self, row: int, col: int, value: str) -> None:
+        pass  # Read-only view
+
+    def GetRowLabelValue(self, row: int) -> str:
+        return f"{row * self.items_per_line + 1:,}"
+
+    def GetColLabelValue(self, col: int) -> str:
+        return "Séquence complète"
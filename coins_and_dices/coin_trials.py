@@ -0,0 +1,152 @@
+from typing import Iterator, Tuple
+import math
+import numpy as np
+import torch
+from .coin_engine import biased_words, popcount64, random_words
+from .constants import COIN_TRIALS_BATCH_FLIPS
+
+def binomial_pmf(trials: int, p: float) -> np.ndarray:
+    """Exact Binomial(trials, p) probabilities of 0..trials successes.
+
+    Computed in log space so large numbers of coins do not overflow.
+
+    Args:
+        trials: Number of coins per trial
+        p: Probability of 'Pile'
+
+    Returns:
+        float64 array of length trials + 1
+    """
+    if p <= 0.0 or p >= 1.0:
+        pmf = np.zeros(trials + 1)
+        pmf[trials if p >= 1.0 else 0] = 1.0
+        return pmf
+    successes = np.arange(trials + 1)
+    log_comb = np.array([
+        math.lgamma(trials + 1) - math.lgamma(k + 1) - math.lgamma(trials - k + 1)
+        for k in range(trials + 1)
+    ])
+    return np.exp(log_comb + successes * math.log(p) + (trials - successes) * math.log1p(-p))
+
+class TrialCounts:
+    """Histogram of 'Pile' counts over repeated trials of k coins.
+
+    Attributes:
+        coins (int): Number of coins per trial (k)
+        trials (int): Number of trials (T)
+        histogram (np.ndarray): Number of trials per 'Pile' count, length k + 1
+        p (float): Probability of 'Pile'
+    """
+
+    def __init__(self, coins: int, trials: int, histogram: np.ndarray, p: float) -> None:
+        self.coins: int = coins
+        self.trials: int = trials
+        self.histogram: np.ndarray = histogram
+        self.p: float = p
+
+    @property
+    def piles(self) -> int:
+        """Total number of 'Pile' results over every trial."""
+        return int(np.dot(np.arange(self.coins + 1, dtype=np.int64), self.histogram))
+
+    @property
+    def faces(self) -> int:
+        """Total number of 'Face' results over every trial."""
+        return self.coins * self.trials - self.piles
+
+    @property
+    def mean(self) -> float:
+        """Mean number of 'Pile' per trial."""
+        return self.piles / self.trials if self.trials else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Variance of the number of 'Pile' per trial."""
+        if not self.trials:
+            return 0.0
+        values = np.arange(self.coins + 1, dtype=np.float64)
+        return float(np.dot((values - self.mean) ** 2, self.histogram) / self.trials)
+
+    @property
+    def expected(self) -> np.ndarray:
+        """Expected number of trials per 'Pile' count under the exact binomial PMF."""
+        return binomial_pmf(self.coins, self.p) * self.trials
+
+    def __len__(self) -> int:
+        return self.coins * self.trials
+
+class CoinTrialsEngine:
+    """Flip k coins T times and reduce each trial to its 'Pile' count on the device.
+
+    Trials are generated as (batch × k) blocks and reduced immediately, so
+    memory is bounded by the batch size whatever the number of trials. Each
+    trial is a row of random 64-bit words masked to k bits and popcounted;
+    biased coins use words with p-biased bits.
+
+    Attributes:
+        device (torch.device): Device used for random generation
+        p (float): Probability of 'Pile'
+    """
+
+    name: str = "trials"
+
+    def __init__(self, device: torch.device, p: float = 0.5) -> None:
+        self.device: torch.device = device
+        self.p: float = p
+
+    def count_batch(self, coins: int, trials: int) -> torch.Tensor:
+        """Return the 'Pile' count of each trial of a batch.
+
+        Args:
+            coins: Number of coins per trial
+            trials: Number of trials in the batch
+
+        Returns:
+            int64 tensor of length trials
+        """
+        num_words: int = (coins + 63) // 64
+        if self.p == 0.5:
+            words = random_words((trials, num_words), self.device)
+        else:
+            words = biased_words((trials, num_words), self.p, self.device)
+        tail_bits: int = coins % 64
+        if tail_bits:
+            words[:, -1] &= (1 << tail_bits) - 1
+        return popcount64(words).sum(dim=1)
+
+    def iter_batches(
+        self,
+        coins: int,
+        trials: int,
+        batch_flips: int = COIN_TRIALS_BATCH_FLIPS
+    ) -> Iterator[Tuple[int, torch.Tensor]]:
+        """Run trials batch by batch.
+
+        Args:
+            coins: Number of coins per trial (k)
+            trials: Number of trials (T)
+            batch_flips: Approximate number of flips generated per batch
+
+        Yields:
+            Tuples of (trials in the batch, histogram of the batch's 'Pile' counts on the device)
+        """
+        batch_trials: int = max(1, batch_flips // max(coins, 64))
+        for start in range(0, trials, batch_trials):
+            size: int = min(batch_trials, trials - start)
+            yield size, torch.bincount(self.count_batch(coins, size), minlength=coins + 1)
+
+    def run(self, coins: int, trials: int, batch_flips: int = COIN_TRIALS_BATCH_FLIPS) -> TrialCounts:
+        """Run T trials of k coins and build the histogram of 'Pile' counts.
+
+        Args:
+            coins: Number of coins per trial (k)
+            trials: Number of trials (T)
+            batch_flips: Approximate number of flips generated per batch
+
+        Returns:
+            Histogram of 'Pile' counts per trial
+        """
+        histogram = torch.zeros(coins + 1, dtype=torch.int64, device=self.device)
+        for _, batch_histogram in self.iter_batches(coins, trials, batch_flips):
+            histogram += batch_histogram
+        return TrialCounts(coins, trials, histogram.cpu().numpy(), self.p)
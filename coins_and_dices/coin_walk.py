@@ -0,0 +1,149 @@
+from typing import Dict, List, Optional, Sequence
+import math
+import numpy as np
+from .coin_buffer import CoinBuffer
+from .constants import COIN_ANALYSIS_CHUNK, COIN_WALK_LEVELS, COIN_WALK_PATH_POINTS
+
+class WalkStatistics:
+    """Statistics of a coin sequence read as a ±1 random walk ('Pile' = +1).
+
+    Attributes:
+        steps (int): Number of steps
+        position (int): Final position
+        maximum (int): Highest position reached, start included
+        maximum_step (int): First step reaching the maximum
+        minimum (int): Lowest position reached, start included
+        minimum_step (int): First step reaching the minimum
+        returns_to_zero (int): Number of steps ending at position 0
+        first_passages (Dict[int, Optional[int]]): First step reaching each level, None if never
+        path_steps (np.ndarray): Step index of each downsampled path point
+        path (np.ndarray): Position at each downsampled path point
+    """
+
+    def __init__(
+        self,
+        steps: int,
+        position: int,
+        maximum: int,
+        maximum_step: int,
+        minimum: int,
+        minimum_step: int,
+        returns_to_zero: int,
+        first_passages: Dict[int, Optional[int]],
+        path_steps: np.ndarray,
+        path: np.ndarray
+    ) -> None:
+        self.steps: int = steps
+        self.position: int = position
+        self.maximum: int = maximum
+        self.maximum_step: int = maximum_step
+        self.minimum: int = minimum
+        self.minimum_step: int = minimum_step
+        self.returns_to_zero: int = returns_to_zero
+        self.first_passages: Dict[int, Optional[int]] = first_passages
+        self.path_steps: np.ndarray = path_steps
+        self.path: np.ndarray = path
+
+    @property
+    def expected_returns(self) -> float:
+        """Asymptotic expected number of returns to zero of a fair walk, sqrt(2n/π)."""
+        return math.sqrt(2 * self.steps / math.pi)
+
+class RandomWalkAccumulator:
+    """Streaming random-walk analysis over consecutive chunks of flips.
+
+    Positions inside a chunk come from a cumulative sum of ±1 steps offset by
+    the position carried from the previous chunk, so memory stays bounded by
+    the chunk size. The path is downsampled on the fly to a fixed stride
+    derived from the expected number of steps.
+    """
+
+    def __init__(
+        self,
+        total_steps: int,
+        levels: Sequence[int] = COIN_WALK_LEVELS,
+        path_points: int = COIN_WALK_PATH_POINTS
+    ) -> None:
+        self.steps: int = 0
+        self.position: int = 0
+        self.maximum: int = 0
+        self.maximum_step: int = 0
+        self.minimum: int = 0
+        self.minimum_step: int = 0
+        self.returns_to_zero: int = 0
+        self.first_passages: Dict[int, Optional[int]] = {level: None for level in levels if level != 0}
+        self.stride: int = max(1, -(-total_steps // path_points))
+        self._path_steps: List[np.ndarray] = [np.zeros(1, dtype=np.int64)]
+        self._path: List[np.ndarray] = [np.zeros(1, dtype=np.int64)]
+
+    def update(self, bits: np.ndarray) -> None:
+        """Add the next chunk of flips.
+
+        Args:
+            bits: uint8 array of 0/1 values (1 = 'Pile')
+        """
+        size: int = len(bits)
+        if not size:
+            return
+        positions = bits.astype(np.int64)
+        positions *= 2
+        positions -= 1
+        np.cumsum(positions, out=positions)
+        positions += self.position
+
+        highest, lowest = int(positions.max()), int(positions.min())
+        if highest > self.maximum:
+            self.maximum = highest
+            self.maximum_step = self.steps + int(np.argmax(positions)) + 1
+        if lowest < self.minimum:
+            self.minimum = lowest
+            self.minimum_step = self.steps + int(np.argmin(positions)) + 1
+        self.returns_to_zero += int(np.count_nonzero(positions == 0))
+
+        # Steps are ±1, so a level inside the chunk's range is always hit
+        for level, step in self.first_passages.items():
+            if step is None and lowest <= level <= highest:
+                self.first_passages[level] = self.steps + int(np.argmax(positions == level)) + 1
+
+        first: int = self.stride - 1 - self.steps % self.stride
+        sampled = positions[first::self.stride]
+        if len(sampled):
+            self._path.append(sampled.copy())
+            self._path_steps.append(self.steps + first + 1 + np.arange(len(sampled), dtype=np.int64) * self.stride)
+
+        self.steps += size
+        self.position = int(positions[-1])
+
+    def result(self) -> WalkStatistics:
+        """Return statistics for every step seen so far."""
+        path_steps, path = np.concatenate(self._path_steps), np.concatenate(self._path)
+        if path_steps[-1] != self.steps:
+            path_steps = np.append(path_steps, self.steps)
+            path = np.append(path, self.position)
+        return WalkStatistics(
+            self.steps, self.position,
+            self.maximum, self.maximum_step,
+            self.minimum, self.minimum_step,
+            self.returns_to_zero, dict(self.first_passages),
+            path_steps, path
+        )
+
+def analyze_walk(
+    results: CoinBuffer,
+    levels: Sequence[int] = COIN_WALK_LEVELS,
+    chunk_size: int = COIN_ANALYSIS_CHUNK
+) -> WalkStatistics:
+    """Compute random-walk statistics of a coin sequence, chunk by chunk.
+
+    Args:
+        results: Bit-packed coin flip results
+        levels: Levels whose first-passage step is reported
+        chunk_size: Number of flips unpacked at a time
+
+    Returns:
+        Random-walk statistics of the whole sequence
+    """
+    accumulator = RandomWalkAccumulator(len(results), levels)
+    for bits in results.iter_bits(chunk_size):
+        accumulator.update(bits)
+    return accumulator.result()
@@ -0,0 +1,294 @@
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+import queue
+import threading
+import numpy as np
+import torch
+from .coin_analysis import RunLengthAccumulator, RunStatistics
+from .coin_buffer import CoinBuffer
+from .coin_convergence import ConvergenceAccumulator, ConvergenceSeries
+from .coin_engine import CoinCounts, CoinEngine
+from .coin_trials import CoinTrialsEngine, TrialCounts
+from .coin_walk import RandomWalkAccumulator, WalkStatistics
+from .dice_engine import DiceEngine
+from .dice_worker import DiceStreamCollector
+from .weighted_sampler import WeightedOutcomeEngine, WeightedOutcomes
+from .constants import (
+    COIN_ANALYSIS_CHUNK, COIN_ENGINE_BATCH_SIZE, COIN_TRIALS_BATCH_FLIPS, COIN_WALK_LEVELS, COIN_WORKER_BATCH_SIZE
+)
+
+class CoinFlipWorker(threading.Thread):
+    """Background thread generating and analysing flips, posting summaries to a queue.
+
+    The collector (FlipCollector, TrialsCollector, WeightedCollector or, for
+    streamed dice statistics, DiceStreamCollector) is fed on this thread, so
+    the consumer only receives small messages, as tuples of (kind, payload):
+    - ('progress', summary) with the collector's partial summary, after each batch
+    - ('result', results) from the collector's finish(), (results, runs, walk, convergence) for coins
+    - ('error', exception) if generation failed
+    - ('done', cancelled) once the worker stops, always last
+
+    The queue should be bounded, and this thread its only producer. A progress
+    summary is skipped when the queue is full, since the next one supersedes
+    it; the closing messages wait for room instead.
+
+    Attributes:
+        engine (Union[CoinEngine, CoinTrialsEngine, WeightedOutcomeEngine, DiceEngine]): Engine generating the run
+        collector (Union[FlipCollector, TrialsCollector, WeightedCollector, DiceStreamCollector]): Consumer of the run
+        result_queue (queue.Queue): Bounded queue receiving the messages
+        cancel_event (threading.Event): Set to stop generation early
+    """
+
+    def __init__(
+        self,
+        engine: Union[CoinEngine, CoinTrialsEngine, WeightedOutcomeEngine, DiceEngine],
+        collector: Union['FlipCollector', 'TrialsCollector', 'WeightedCollector', DiceStreamCollector],
+        result_queue: queue.Queue,
+        batch_size: int = COIN_WORKER_BATCH_SIZE
+    ) -> None:
+        super().__init__(daemon=True)
+        self.engine: Union[CoinEngine, CoinTrialsEngine, WeightedOutcomeEngine, DiceEngine] = engine
+        self.collector: Union[FlipCollector, TrialsCollector, WeightedCollector, DiceStreamCollector] = collector
+        self.result_queue: queue.Queue = result_queue
+        self.batch_size: int = batch_size
+        self.cancel_event: threading.Event = threading.Event()
+
+    def post_progress(self) -> None:
+        """Post the collector's partial summary unless the queue is full.
+
+        The summary is not even built when it would be dropped, since building
+        it can copy device state to the host (the trials histogram).
+        """
+        if self.result_queue.full():
+            return
+        self.result_queue.put_nowait(('progress', self.collector.summary()))
+
+    def run(self) -> None:
+        try:
+            for _ in self.collector.consume(self.engine, self.batch_size):
+                if self.cancel_event.is_set():
+                    break
+                self.post_progress()
+            self.result_queue.put(('result', self.collector.finish()))
+        except Exception as e:
+            self.result_queue.put(('error', e))
+        finally:
+            self.result_queue.put(('done', self.cancel_event.is_set()))
+
+    def cancel(self) -> None:
+        """Ask the worker to stop after the batch in progress."""
+        self.cancel_event.set()
+
+class FlipCollector:
+    """Assemble streamed flip batches into results.
+
+    Keeps either every flip (packed) or only the totals, and optionally feeds
+    the run-length, random-walk and convergence analyses. In a background run
+    the collector lives on the worker thread, which posts its summaries.
+
+    Attributes:
+        num_coins (int): Number of flips expected
+        flips_done (int): Number of flips received so far
+        piles (int): Number of 'Pile' results received so far
+    """
+
+    def __init__(
+        self,
+        num_coins: int,
+        keep_flips: bool = True,
+        analyze_runs: bool = False,
+        analyze_walk: bool = False,
+        walk_levels: Sequence[int] = COIN_WALK_LEVELS,
+        analyze_convergence: bool = False
+    ) -> None:
+        self.num_coins: int = num_coins
+        self.flips_done: int = 0
+        self.piles: int = 0
+        self._packed: Optional[np.ndarray] = (
+            np.empty((num_coins + 7) // 8, dtype=np.uint8) if keep_flips else None
+        )
+        self._runs: Optional[RunLengthAccumulator] = RunLengthAccumulator() if analyze_runs else None
+        self._walk: Optional[RandomWalkAccumulator] = (
+            RandomWalkAccumulator(num_coins, walk_levels) if analyze_walk else None
+        )
+        self._convergence: Optional[ConvergenceAccumulator] = (
+            ConvergenceAccumulator(num_coins) if analyze_convergence else None
+        )
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the flips received, between 0 and 1."""
+        return self.flips_done / self.num_coins if self.num_coins else 1.0
+
+    @property
+    def faces(self) -> int:
+        """Number of 'Face' results received so far."""
+        return self.flips_done - self.piles
+
+    def add(self, packed: np.ndarray, length: int, piles: int) -> None:
+        """Add a batch produced by CoinEngine.iter_batches.
+
+        Args:
+            packed: Packed flip bits of the batch
+            length: Number of flips in the batch
+            piles: Number of 'Pile' results in the batch
+        """
+        if self._packed is not None:
+            # Batches are multiples of 64 flips, so they stay byte-aligned
+            offset = self.flips_done // 8
+            self._packed[offset:offset + len(packed)] = packed
+        accumulators = [
+            accumulator for accumulator in (self._runs, self._walk, self._convergence)
+            if accumulator is not None
+        ]
+        if accumulators:
+            for bits in CoinBuffer(packed, length).iter_bits(COIN_ANALYSIS_CHUNK):
+                for accumulator in accumulators:
+                    accumulator.update(bits)
+        self.flips_done += length
+        self.piles += piles
+
+    def consume(self, engine: CoinEngine, batch_size: int = COIN_ENGINE_BATCH_SIZE) -> Iterator[None]:
+        """Generate the remaining flips with an engine, adding them batch by batch.
+
+        Args:
+            engine: Engine generating the flips
+            batch_size: Flips per batch
+
+        Yields:
+            None after each batch, so the caller can report progress or stop
+        """
+        for batch in engine.iter_batches(self.num_coins - self.flips_done, batch_size):
+            self.add(*batch)
+            yield
+
+    def summary(self) -> CoinCounts:
+        """Return the totals of the flips received so far."""
+        return CoinCounts(self.flips_done, self.piles)
+
+    def finish(self) -> Tuple[
+        Union[CoinBuffer, CoinCounts], Optional[RunStatistics], Optional[WalkStatistics], Optional[ConvergenceSeries]
+    ]:
+        """Return the flips received so far with every analysis requested.
+
+        Returns:
+            Tuple of (packed flips or totals, run statistics, walk statistics, convergence series)
+        """
+        results, runs = self.result()
+        return results, runs, self.walk_result(), self.convergence_result()
+
+    def result(self) -> Tuple[Union[CoinBuffer, CoinCounts], Optional[RunStatistics]]:
+        """Return the flips received so far and their run analysis.
+
+        Returns:
+            Tuple of (packed flips or totals, run statistics if analysed)
+        """
+        runs = self._runs.result() if self._runs is not None else None
+        if self._packed is not None:
+            return CoinBuffer(self._packed, self.flips_done, piles=self.piles), runs
+        return CoinCounts(self.flips_done, self.piles), runs
+
+    def walk_result(self) -> Optional[WalkStatistics]:
+        """Return the random-walk analysis of the flips received so far, if analysed."""
+        return self._walk.result() if self._walk is not None else None
+
+    def convergence_result(self) -> Optional[ConvergenceSeries]:
+        """Return the running-proportion series of the flips received so far, if analysed."""
+        return self._convergence.result() if self._convergence is not None else None
+
+class TrialsCollector:
+    """Accumulate the 'Pile' count histogram of repeated coin trials.
+
+    The histogram stays on the engine's device between batches and is only
+    copied to the host for summaries.
+
+    Attributes:
+        num_coins (int): Number of coins per trial
+        trials (int): Number of trials expected
+        trials_done (int): Number of trials run so far
+        p (float): Probability of 'Pile' of the engine
+    """
+
+    def __init__(self, num_coins: int, trials: int) -> None:
+        self.num_coins: int = num_coins
+        self.trials: int = trials
+        self.trials_done: int = 0
+        self.p: float = 0.5
+        self._histogram: torch.Tensor = torch.zeros(num_coins + 1, dtype=torch.int64)
+
+    def consume(self, engine: CoinTrialsEngine, batch_size: int = COIN_TRIALS_BATCH_FLIPS) -> Iterator[None]:
+        """Run the remaining trials with an engine, adding them batch by batch.
+
+        Args:
+            engine: Engine running the trials
+            batch_size: Approximate number of flips per batch
+
+        Yields:
+            None after each batch, so the caller can report progress or stop
+        """
+        self.p = engine.p
+        self._histogram = self._histogram.to(engine.device)
+        for size, histogram in engine.iter_batches(self.num_coins, self.trials - self.trials_done, batch_size):
+            self._histogram += histogram
+            self.trials_done += size
+            yield
+
+    def summary(self) -> TrialCounts:
+        """Return the histogram of the trials run so far."""
+        return TrialCounts(self.num_coins, self.trials_done, self._histogram.cpu().numpy(), self.p)
+
+    def finish(self) -> Tuple[TrialCounts, None, None, None]:
+        """Return the trials run so far, shaped like FlipCollector.finish.
+
+        Returns:
+            Tuple of (histogram of 'Pile' counts, None, None, None)
+        """
+        return self.summary(), None, None, None
+
+class WeightedCollector:
+    """Assemble streamed weighted draws into WeightedOutcomes.
+
+    Attributes:
+        num_coins (int): Number of draws expected
+        draws_done (int): Number of draws received so far
+    """
+
+    def __init__(self, num_coins: int) -> None:
+        self.num_coins: int = num_coins
+        self.draws_done: int = 0
+        self._labels: List[str] = []
+        self._probabilities: np.ndarray = np.empty(0)
+        self._counts: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._indices: Optional[np.ndarray] = None
+
+    def consume(self, engine: WeightedOutcomeEngine, batch_size: int = COIN_ENGINE_BATCH_SIZE) -> Iterator[None]:
+        """Draw the remaining outcomes with an engine, adding them batch by batch.
+
+        Args:
+            engine: Engine drawing the outcomes
+            batch_size: Draws per batch
+
+        Yields:
+            None after each batch, so the caller can report progress or stop
+        """
+        if self._indices is None:
+            self._labels, self._probabilities = engine.labels, engine.table.probabilities
+            self._counts = np.zeros(len(engine.labels), dtype=np.int64)
+            self._indices = np.empty(self.num_coins, dtype=engine.index_dtype)
+        for indices, counts in engine.iter_batches(self.num_coins - self.draws_done, batch_size):
+            self._indices[self.draws_done:self.draws_done + len(indices)] = indices
+            self._counts += counts
+            self.draws_done += len(indices)
+            yield
+
+    def summary(self) -> WeightedOutcomes:
+        """Return the totals of the draws received so far."""
+        return WeightedOutcomes(self._labels, self._probabilities, self._counts.copy())
+
+    def finish(self) -> Tuple[WeightedOutcomes, None, None, None]:
+        """Return the draws received so far, shaped like FlipCollector.finish.
+
+        Returns:
+            Tuple of (drawn outcomes, None, None, None)
+        """
+        indices = self._indices[:self.draws_done] if self._indices is not None else None
+        return WeightedOutcomes(self._labels, self._probabilities, self._counts.copy(), indices), None, None, None
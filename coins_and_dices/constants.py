@@ -1,4 +1,4 @@
-from typing import Tuple, List
+from typing import Dict, Tuple, List
 
 # Window dimensions
 WINDOW_SIZE: Tuple[int, int] = (1024, 768)
@@ -23,10 +23,22 @@ CUSTOM_DICE_MIN_COUNT: int = 1
 
 # Standard Dice Constants
 MAX_DICE: int = 1_000_000
+DICE_STREAM_MAX_DICE: int = 10_000_000_000  # Dice per term when rolls are streamed into statistics
 MAX_SIDES: float = 1e9  # Support for billion-sided dice
 MAX_ROLLS_PER_LINE: int = 30
 DICE_BATCH_SIZE: int = 1_000_000  # GPU processing batch size
 STANDARD_DICE_FRAME_SIZE: Tuple[int, int] = (1024, 768)
+DICE_PLAN_CACHE_SIZE: int = 256  # Compiled dice expressions kept for reuse
+DICE_EXPLODE_LIMIT: int = 100  # Rerolls of an exploding die before it stops
+DICE_DISTRIBUTION_MAX_POINTS: int = 1 << 22  # Largest exact distribution support computed
+DICE_DIRECT_CONVOLUTION_LIMIT: int = 1 << 16  # Above this length product, convolutions use the FFT
+DICE_KEEP_MAX_STEPS: int = 500_000  # Vector updates allowed for an exact keep-highest/lowest distribution
+DICE_HISTOGRAM_MAX_BINS: int = 1 << 20  # Wider roll ranges get their quantiles by selection
+DICE_STATS_SYNC_BATCHES: int = 64  # Streamed batches between reads of the running total and histogram range
+DICE_QUANTILES: List[float] = [0.01, 0.05, 0.25, 0.75, 0.95, 0.99]  # Quantiles in the statistics view
+DICE_TRIALS_MAX: int = 1_000_000_000  # Largest number of repetitions of a notation
+DICE_TRIALS_SUMMARY_LINES: int = 15  # Totals listed in the trials summary
+DICE_TRIALS_PLOT_BARS: int = 400  # Wider ranges of totals are plotted over merged bins
 
 GRID_COLUMNS = {
     'NOTATION': 0,
@@ -35,6 +47,17 @@ GRID_COLUMNS = {
     'AVERAGE': 3,
     'MINMAX': 4
 }
+DICE_GRID_COLUMNS = {**GRID_COLUMNS, 'EXPECTED': 5}
+DICE_GRID_COLUMN_WIDTHS: Dict[str, int] = {
+    'NOTATION': 140,
+    'DETAILS': 520,
+    'TOTAL': 100,
+    'AVERAGE': 120,
+    'MINMAX': 180,
+    'EXPECTED': 220
+}
+DICE_GRID_ROW_HEIGHT: int = 90  # Fixed result row height in pixels, never measured from the text
+DICE_TABLE_CACHE_CELLS: int = 512  # Formatted result cells kept for repainting
 
 # Add these new constants for Runebound_frame
 RUNEBOUND_FRAME_SIZE: Tuple[int, int] = (800, 600)
@@ -52,23 +75,68 @@ RUNEBOUND_FACES: List[List[str]] = [
     ["Route", "Plaine", "Colline"]
 ]
 
+# Plot panel constants
+PLOT_PANEL_SIZE: Tuple[int, int] = (-1, 220)
+PLOT_MARGIN: int = 20  # Pixels around the plotted area
+
 # Coin display constants
 ITEMS_PER_LINE: int = 12
+ROLL_SEPARATOR: str = ' → '  # Separator between items of a formatted line
+FORMAT_TABLE_SIZE: int = 1 << 16  # Integers below it are formatted through a cached label table
+FORMAT_CHUNK_ROWS: int = 1 << 15  # Fixed-point rows converted per pass, sized to stay in cache
 BATCH_SIZE: int = 1_000_000  # Increased for better GPU utilization
 COIN_UPDATE_INTERVAL: float = 0.1  # seconds
 COIN_VIRTUAL_THRESHOLD: int = 1_000_000
+COIN_INLINE_THRESHOLD: int = 10_000  # Larger sequences are browsed in the virtual table
+COIN_SEQUENCE_COLUMN_WIDTH: int = 900  # Width of the virtual sequence column
 COIN_BATCH_DISPLAY: int = 10_000
 COIN_BATCH_SIZE: int = 100_000
 COIN_SAMPLE_SIZE: int = 1000
 COIN_CACHE_SIZE: int = 1_000_000  # Results caching threshold
 WORKER_THREAD_SLEEP: float = 0.01  # Thread sleep interval
+COIN_WORKER_THRESHOLD: int = 1_000_000  # Runs above this use the background worker
+COIN_WORKER_BATCH_SIZE: int = 1 << 20  # Flips per streamed worker batch
+COIN_WORKER_JOIN_TIMEOUT: float = 2.0  # Seconds to wait for the worker on close
+COIN_WORKER_QUEUE_SIZE: int = 8  # Worker messages waiting for the UI before the worker blocks
+COIN_WORKER_JOIN_POLL: float = 0.05  # Seconds between queue drains while joining the worker
+COIN_DRAIN_INTERVAL_MS: int = 50  # Worker queue polling interval
+COIN_DRAIN_BUDGET: float = 0.03  # Seconds of queue draining per timer tick
+COIN_PROGRESS_RANGE: int = 1000  # Resolution of the progress gauge
 
 # Add these performance-related constants
 COIN_MAX_COUNT: int = 10_000_000  # Maximum number of coins
 COIN_MIN_COUNT: int = 1  # Minimum number of coins
 COIN_PROGRESS_UPDATE: int = 100  # Progress dialog update interval
+COIN_DECODE_CHUNK: int = 65_536  # Flips decoded to labels per iteration step
+COIN_ENGINE_BATCH_SIZE: int = 1 << 23  # Flips per generator batch (multiple of 64)
+COIN_BINOMIAL_CHUNK: int = 1 << 48  # Flips per binomial draw in counts-only mode
+COIN_BIAS_BITS: int = 24  # Binary digits of a biased coin's p, the resolution of a float32 draw
+COIN_COUNTS_ONLY_THRESHOLD: int = 10_000_000  # Above this, only totals are kept
+COIN_SCALES: List[int] = [1, 1_000, 1_000_000]  # Multipliers for the coin count
+COIN_ANALYSIS_CHUNK: int = 1 << 22  # Flips unpacked per analysis step
+COIN_RUN_ANALYSIS_LIMIT: int = 100_000_000  # Largest statistics run streamed for run analysis
+COIN_RUN_HISTOGRAM_LINES: int = 15  # Run lengths listed before grouping the tail
+COIN_WALK_LEVELS: List[int] = [10, 100, 1000, -10, -100, -1000]  # Default first-passage levels
+COIN_WALK_PATH_POINTS: int = 2000  # Points kept in the downsampled walk path
+COIN_WALK_ANALYSIS_LIMIT: int = 1_000_000_000  # Largest run streamed for random-walk analysis
+COIN_PATTERN_MAX_POSITIONS: int = 1000  # Match positions kept by a pattern search
+COIN_PATTERN_RESULT_HEIGHT: int = 60  # Height of the pattern search result box
+COIN_TRIALS_BATCH_FLIPS: int = 1 << 24  # Flips generated per trials batch
+COIN_TRIALS_MAX_COINS: int = 10_000  # Largest number of coins per trial
+COIN_TRIALS_MAX: int = 1_000_000_000  # Largest number of trials
+COIN_TRIALS_SUMMARY_LINES: int = 25  # Pile counts listed in the trials summary
+COIN_CONVERGENCE_POINTS: int = 2000  # Buckets in the running-proportion series
+COIN_CONVERGENCE_ANALYSIS_LIMIT: int = 1_000_000_000  # Largest run streamed for the convergence series
+COIN_DEFAULT_PROBABILITY: float = 0.5  # Probability of 'Pile' for a fair coin
+COIN_PROBABILITY_INCREMENT: float = 0.01  # Step of the 'Pile' probability control
 
 # Sequence optimization constants
 SEQUENCE_BATCH_SIZE: int = 50000  # Process results in smaller chunks
 DISPLAY_BUFFER_SIZE: int = 1000   # Number of results to buffer before updating UI
 SEQUENCE_UPDATE_INTERVAL: float = 0.05  # Seconds between UI updates
+RENDER_INTERVAL_MS: int = 33  # Progressive render frame interval (~30 fps)
+RENDER_TICK_BUDGET: float = 0.015  # Seconds of block formatting per render frame
+RENDER_BLOCK_LINES: int = 256  # Formatted lines appended per render block
+RENDER_SYNC_LIMIT: int = 2_000  # Sequences up to this size render synchronously
+DICE_RENDER_INTERVAL_MS: int = 16  # Dice rolls render frame interval (~60 fps)
+DICE_RENDER_TICK_BUDGET: float = 0.008  # Seconds of roll formatting per dice render frame
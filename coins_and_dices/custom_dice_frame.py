@@ -3,10 +3,12 @@ from .game_history import GameHistory
 import wx
 import json
 import os
+import numpy as np
 import torch
 import time
-from typing import Dict, List, Union, Optional, Tuple, Any
+from typing import Dict, List, Sequence, Union, Optional, Tuple, Any
 from .custom_dice_dialog import CustomDiceDialog
+from .weighted_sampler import WeightedOutcomes
 from .constants import (
     CUSTOM_DICE_FRAME_SIZE, 
     CUSTOM_DICE_RESULT_AREA_SIZE,
@@ -48,40 +50,46 @@ class CustomDiceFrame(wx.Frame):
         self.Show()
 
 
-    def roll_custom_dice(self, dice_name: str, number: int) -> List[str]:
+    def roll_custom_dice(self, dice_name: str, number: int) -> WeightedOutcomes:
         """
         Roll custom dice using GPU acceleration with batch processing.
         
-        Implements efficient batch processing using PyTorch for GPU-accelerated
-        random number generation. Handles large numbers of rolls by processing
-        in smaller batches to prevent memory issues.
+        Face indices are drawn on the device batch by batch and stored in a
+        compact array (uint8 up to 256 faces, uint16 up to 65,536); face
+        labels are only looked up when the results are read or formatted.
         
         Args:
             dice_name: Name of the dice configuration to use
             number: Total number of dice to roll
             
         Returns:
-            List[str]: List of roll results as strings
+            WeightedOutcomes: Rolled faces, iterable as face labels
         """
-        if dice_name not in self.custom_dices:
-            return []
-
-        values: List[str] = self.custom_dices[dice_name]['values']
+        values: List[str] = self.custom_dices[dice_name]['values'] if dice_name in self.custom_dices else []
         num_faces: int = len(values)
-        results: List[str] = []
-        remaining: int = number
-
-        while remaining > 0:
-            batch_size: int = min(BATCH_SIZE, remaining)
-            random_tensor: torch.Tensor = torch.rand(batch_size, device=self.device)
-            indices: torch.Tensor = (random_tensor * num_faces).long()
-            batch_results: List[str] = [values[idx.item()] for idx in indices.cpu()]
-            results.extend(batch_results)
-            remaining -= batch_size
-
-        return results
+        if not num_faces:
+            return WeightedOutcomes.from_indices([], np.empty(0), np.empty(0, dtype=np.uint8))
+
+        indices: np.ndarray = np.empty(number, dtype=np.min_scalar_type(num_faces - 1))
+        for start in range(0, number, BATCH_SIZE):
+            batch_size: int = min(BATCH_SIZE, number - start)
+            indices[start:start + batch_size] = torch.randint(
+                num_faces, (batch_size,), device=self.device
+            ).cpu().numpy()
+        return WeightedOutcomes.from_indices(values, np.full(num_faces, 1 / num_faces), indices)
+
+    @staticmethod
+    def as_outcomes(results: Union[WeightedOutcomes, Sequence[str]]) -> WeightedOutcomes:
+        """Return rolled outcomes unchanged and a list of face labels as outcomes."""
+        if isinstance(results, WeightedOutcomes):
+            return results
+        labels, indices = np.unique(np.asarray(results, dtype=str), return_inverse=True)
+        return WeightedOutcomes.from_indices(
+            labels.tolist(), np.full(len(labels), 1 / max(len(labels), 1)),
+            indices.astype(np.min_scalar_type(max(len(labels) - 1, 0)))
+        )
 
-    def _display_virtual_results(self, results: List[str]) -> None:
+    def _display_virtual_results(self, results: Union[WeightedOutcomes, Sequence[str]]) -> None:
         """
         Display results using virtual mode for large datasets.
         
@@ -89,15 +97,18 @@ class CustomDiceFrame(wx.Frame):
         of results with a count of hidden items for large datasets.
         
         Args:
-            results: Complete list of dice roll results
+            results: Complete dice roll results
         """
+        results = self.as_outcomes(results)
+        first_stop: int = min(COIN_SAMPLE_SIZE, len(results))
+        last_start: int = max(len(results) - COIN_SAMPLE_SIZE, 0)
         sample_text: str = (
             f"Total rolls: {len(results):,}\n\n"
             f"First {COIN_SAMPLE_SIZE} results:\n"
-            f"{' → '.join(map(str, results[:COIN_SAMPLE_SIZE]))}\n\n"
+            f"{results.format_lines(0, first_stop, COIN_SAMPLE_SIZE)}\n\n"
             f"[... {len(results) - 2*COIN_SAMPLE_SIZE:,} more results ...]\n\n"
             f"Last {COIN_SAMPLE_SIZE} results:\n"
-            f"{' → '.join(map(str, results[-COIN_SAMPLE_SIZE:]))}"
+            f"{results.format_lines(last_start, len(results), COIN_SAMPLE_SIZE)}"
         )
         self.custom_result.SetValue(sample_text)
 
@@ -128,7 +139,7 @@ class CustomDiceFrame(wx.Frame):
                     style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE
                 )
 
-            results: List[str] = self.roll_custom_dice(dice_name, number)
+            results: WeightedOutcomes = self.roll_custom_dice(dice_name, number)
             
             metadata: Dict[str, Any] = {
                 'dice_name': dice_name,
@@ -144,7 +155,7 @@ class CustomDiceFrame(wx.Frame):
             if number > COIN_VIRTUAL_THRESHOLD:
                 self._display_virtual_results(results)
             else:
-                self.custom_result.SetValue("\n".join(map(str, results)))
+                self.custom_result.SetValue(results.format_lines(0, len(results), 1))
 
             if progress:
                 progress.Destroy()
@@ -0,0 +1,306 @@
+from functools import lru_cache, reduce
+from typing import List, Optional, Tuple, Union
+import math
+import numpy as np
+from .coin_trials import binomial_pmf
+from .constants import (
+    DICE_DIRECT_CONVOLUTION_LIMIT, DICE_DISTRIBUTION_MAX_POINTS, DICE_KEEP_MAX_STEPS, DICE_PLAN_CACHE_SIZE
+)
+from .dice_expression import DicePlan, DiceTerm
+
+COMPARISONS = ('>=', '>', '<=', '<', '==')
+
+def convolve_pmf(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Distribution of the sum of two independent integer variables.
+
+    Short inputs use a direct convolution; longer ones multiply their real
+    FFTs, which turns the O(n·m) product into O(n log n). FFT rounding can
+    leave tiny negative tails, which are clipped to zero.
+
+    Args:
+        first: Probabilities of consecutive values of the first variable
+        second: Probabilities of consecutive values of the second variable
+
+    Returns:
+        Probabilities of consecutive values of the sum
+    """
+    if len(first) * len(second) <= DICE_DIRECT_CONVOLUTION_LIMIT:
+        return np.convolve(first, second)
+    size: int = len(first) + len(second) - 1
+    length: int = 1 << (size - 1).bit_length()
+    result = np.fft.irfft(np.fft.rfft(first, length) * np.fft.rfft(second, length), length)[:size]
+    np.maximum(result, 0.0, out=result)
+    return result
+
+class DiceDistribution:
+    """Exact probability distribution of an integer dice total.
+
+    Attributes:
+        offset (int): Smallest possible total
+        pmf (np.ndarray): Probability of each total from offset upwards
+    """
+
+    def __init__(self, offset: int, pmf: np.ndarray) -> None:
+        self.offset: int = offset
+        self.pmf: np.ndarray = pmf
+
+    @property
+    def totals(self) -> np.ndarray:
+        """Every possible total, aligned with pmf."""
+        return np.arange(self.offset, self.offset + len(self.pmf))
+
+    @property
+    def cdf(self) -> np.ndarray:
+        """Probability of each total or less, aligned with pmf."""
+        return np.minimum(np.cumsum(self.pmf), 1.0)
+
+    @property
+    def mean(self) -> float:
+        """Expected total."""
+        return self.offset + float(np.dot(np.arange(len(self.pmf)), self.pmf))
+
+    @property
+    def variance(self) -> float:
+        """Variance of the total."""
+        deviations = np.arange(len(self.pmf)) - (self.mean - self.offset)
+        return float(np.dot(deviations * deviations, self.pmf))
+
+    @property
+    def std(self) -> float:
+        """Standard deviation of the total."""
+        return math.sqrt(self.variance)
+
+    def probability(self, target: Union[int, float], comparison: str = '>=') -> float:
+        """Probability that the total compares to a target.
+
+        Args:
+            target: Value compared against
+            comparison: One of '>=', '>', '<=', '<', '=='
+
+        Returns:
+            Probability of the comparison holding
+
+        Raises:
+            ValueError: If the comparison is unknown
+        """
+        if comparison not in COMPARISONS:
+            raise ValueError(f"Unknown comparison: {comparison}")
+        if comparison == '==':
+            index = target - self.offset
+            return float(self.pmf[int(index)]) if float(index).is_integer() and 0 <= index < len(self.pmf) else 0.0
+        if comparison in ('>=', '>'):
+            # Smallest total satisfying the comparison
+            first = math.ceil(target) if comparison == '>=' else math.floor(target) + 1
+            return float(self.pmf[max(first - self.offset, 0):].sum())
+        last = math.floor(target) if comparison == '<=' else math.ceil(target) - 1
+        return float(self.pmf[:max(last - self.offset + 1, 0)].sum())
+
+    def shift(self, constant: int) -> 'DiceDistribution':
+        """Distribution of the total plus a constant."""
+        return DiceDistribution(self.offset + constant, self.pmf)
+
+    def negate(self) -> 'DiceDistribution':
+        """Distribution of the opposite of the total."""
+        return DiceDistribution(-(self.offset + len(self.pmf) - 1), self.pmf[::-1].copy())
+
+    def __add__(self, other: 'DiceDistribution') -> 'DiceDistribution':
+        """Distribution of the sum of two independent totals."""
+        return DiceDistribution(self.offset + other.offset, convolve_pmf(self.pmf, other.pmf))
+
+    def __len__(self) -> int:
+        return len(self.pmf)
+
+def die_faces(sides: Union[int, float]) -> int:
+    """Number of faces of a die; a fractional side count adds a shorter last face."""
+    return math.ceil(sides)
+
+@lru_cache(maxsize=DICE_PLAN_CACHE_SIZE)
+def die_distribution(sides: Union[int, float]) -> DiceDistribution:
+    """Distribution of one die rolled as floor(u * sides) + 1.
+
+    Args:
+        sides: Number of sides, whole or fractional
+
+    Returns:
+        Uniform distribution over 1..sides, or with a shorter last face for fractional sides
+    """
+    whole: int = math.floor(sides)
+    pmf = np.full(die_faces(sides), 1.0 / sides)
+    if whole != sides:
+        pmf[-1] = (sides - whole) / sides
+    return DiceDistribution(1, pmf)
+
+@lru_cache(maxsize=DICE_PLAN_CACHE_SIZE)
+def sum_distribution(count: int, sides: Union[int, float]) -> DiceDistribution:
+    """Distribution of the sum of identical dice, by repeated squaring.
+
+    NdX is built from (N/2)dX convolved with itself, plus one die when N is
+    odd, so only about 2·log2(N) convolutions are needed. Every partial sum
+    is memoized, so related notations (2d6, 4d6, 5d6, ...) share work.
+
+    Args:
+        count: Number of dice
+        sides: Number of sides
+
+    Returns:
+        Exact distribution of the sum
+    """
+    if count == 1:
+        return die_distribution(sides)
+    half = sum_distribution(count // 2, sides)
+    total = half + half
+    if count % 2:
+        total = total + die_distribution(sides)
+    return total
+
+def die_tail(sides: Union[int, float], threshold: float) -> float:
+    """Probability that one die shows at least the threshold."""
+    first: int = max(math.ceil(threshold), 1)
+    if first > die_faces(sides):
+        return 0.0
+    return (sides - (first - 1)) / sides
+
+@lru_cache(maxsize=DICE_PLAN_CACHE_SIZE)
+def success_distribution(count: int, sides: Union[int, float], threshold: float) -> DiceDistribution:
+    """Binomial distribution of the number of dice at or above a threshold."""
+    return DiceDistribution(0, binomial_pmf(count, die_tail(sides, threshold)))
+
+@lru_cache(maxsize=DICE_PLAN_CACHE_SIZE)
+def keep_distribution(
+    count: int,
+    sides: Union[int, float],
+    kept: int,
+    highest: bool = True,
+    threshold: Optional[float] = None
+) -> Optional[DiceDistribution]:
+    """Exact distribution of the kept dice of NdX keep-highest/lowest, by dynamic programming.
+
+    Faces are visited from the best to the worst for the kept side. The state
+    is the number of dice already placed on better faces and the score of the
+    kept ones; c of the remaining dice land on the current face with weight
+    C(remaining, c)·p^c, and only those still within the first `kept` dice
+    add to the score. The cost is about faces·count²/2 vector updates.
+
+    Args:
+        count: Number of dice rolled
+        sides: Number of sides, whole or fractional
+        kept: Number of dice kept
+        highest: Keep the highest dice, or the lowest ones
+        threshold: Score kept dice at or above it as 1 success instead of their value
+
+    Returns:
+        Exact distribution of the kept score, or None when it would take
+        more than DICE_KEEP_MAX_STEPS updates
+    """
+    faces: np.ndarray = die_distribution(sides).pmf
+    if len(faces) * (count + 1) * (count + 2) // 2 > DICE_KEEP_MAX_STEPS:
+        return None
+    values = range(len(faces), 0, -1) if highest else range(1, len(faces) + 1)
+    best: int = 1 if threshold is not None else len(faces)
+    states = np.zeros((count + 1, kept * best + 1))
+    states[0, 0] = 1.0
+    for value in values:
+        probability: float = faces[value - 1]
+        score: int = int(value >= threshold) if threshold is not None else value
+        updated = np.zeros_like(states)
+        for placed in range(count + 1):
+            row = states[placed]
+            if not row.any():
+                continue
+            for landed in range(count - placed + 1):
+                gain: int = score * (min(placed + landed, kept) - min(placed, kept))
+                weight: float = math.comb(count - placed, landed) * probability ** landed
+                updated[placed + landed, gain:] += row[:len(row) - gain] * weight
+        states = updated
+    lowest: int = 0 if threshold is not None else kept
+    return DiceDistribution(lowest, states[count, lowest:])
+
+def term_keep_distribution(term: DiceTerm) -> Optional[DiceDistribution]:
+    """Exact distribution of the score of a keep term, before its sign."""
+    mode, kept = term.keep
+    return keep_distribution(term.count, term.sides, kept, mode == 'h', term.threshold)
+
+def die_moments(sides: Union[int, float]) -> Tuple[float, float]:
+    """Mean and variance of one die, in closed form.
+
+    Args:
+        sides: Number of sides, whole or fractional
+
+    Returns:
+        Tuple of (mean, variance)
+    """
+    whole: int = math.floor(sides)
+    if whole == sides:
+        return (sides + 1) / 2, (sides * sides - 1) / 12
+    last: float = (sides - whole) / sides  # Probability of the shorter last face
+    mean = whole * (whole + 1) / (2 * sides) + (whole + 1) * last
+    square = whole * (whole + 1) * (2 * whole + 1) / (6 * sides) + (whole + 1) ** 2 * last
+    return mean, square - mean * mean
+
+def plan_moments(plan: DicePlan) -> Optional[Tuple[float, float]]:
+    """Exact mean and variance of a dice expression, without building its distribution.
+
+    Args:
+        plan: Compiled dice expression
+
+    Returns:
+        Tuple of (mean, variance), or None when a term has no closed form
+        and its distribution is too costly
+    """
+    mean: float = plan.constant
+    variance: float = 0.0
+    for term in plan.terms:
+        if term.explode:
+            return None
+        if term.keep is not None:
+            distribution = term_keep_distribution(term)
+            if distribution is None:
+                return None
+            term_mean, term_variance = distribution.mean, distribution.variance
+        elif term.threshold is not None:
+            tail = die_tail(term.sides, term.threshold)
+            term_mean, term_variance = term.count * tail, term.count * tail * (1 - tail)
+        else:
+            die_mean, die_variance = die_moments(term.sides)
+            term_mean, term_variance = term.count * die_mean, term.count * die_variance
+        mean += term.sign * term_mean
+        variance += term_variance
+    return mean, variance
+
+@lru_cache(maxsize=DICE_PLAN_CACHE_SIZE)
+def plan_distribution(
+    plan: DicePlan,
+    max_points: int = DICE_DISTRIBUTION_MAX_POINTS
+) -> Optional[DiceDistribution]:
+    """Exact distribution of the total of a dice expression.
+
+    Args:
+        plan: Compiled dice expression
+        max_points: Largest number of possible totals computed
+
+    Returns:
+        Exact distribution, or None when a term is not supported or the
+        support is larger than max_points
+    """
+    parts: List[DiceDistribution] = []
+    support: int = 1
+    for term in plan.terms:
+        if term.explode:
+            return None
+        scored: int = term.keep[1] if term.keep is not None else term.count
+        if term.threshold is not None:
+            support += scored
+        else:
+            support += scored * (die_faces(term.sides) - 1)
+        if support > max_points:
+            return None
+        if term.keep is not None:
+            distribution = term_keep_distribution(term)
+            if distribution is None:
+                return None
+        elif term.threshold is not None:
+            distribution = success_distribution(term.count, term.sides, term.threshold)
+        else:
+            distribution = sum_distribution(term.count, term.sides)
+        parts.append(distribution.negate() if term.sign < 0 else distribution)
+    return reduce(lambda first, second: first + second, parts).shift(plan.constant)
@@ -0,0 +1,151 @@
+from typing import Iterator, Union
+import numpy as np
+import torch
+from .constants import DICE_BATCH_SIZE
+
+RANDOM_BITS = 62  # Width of the shared draw of sample_faces, above any side count
+
+def dice_dtype(sides: int) -> np.dtype:
+    """Return the smallest integer dtype holding every face of a die.
+
+    Args:
+        sides: Number of sides
+
+    Returns:
+        uint8, uint16 or uint32 when the faces fit, int64 otherwise
+    """
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if sides <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+def is_integer_sides(sides: Union[int, float]) -> bool:
+    """Tell whether a side count names a die with whole-numbered faces."""
+    return float(sides).is_integer()
+
+def sum_rolls(rolls: np.ndarray) -> Union[int, float]:
+    """Total of a roll array, accumulated in int64 for integer faces.
+
+    Args:
+        rolls: Roll results as returned by DiceEngine.roll
+
+    Returns:
+        Exact integer total for integer faces, float total otherwise
+    """
+    if np.issubdtype(rolls.dtype, np.integer):
+        return int(rolls.sum(dtype=np.int64))
+    return float(rolls.sum())
+
+class DiceEngine:
+    """Dice roll generator producing compact arrays of faces.
+
+    Integer dice are sampled exactly: uniform integers below the next power
+    of two are drawn on the device and values past the side count are
+    rejected, so every face is equally likely whatever the side count (a
+    float32 floor cannot even represent most faces of a 1e9-sided die).
+    Results are stored in the smallest dtype holding the faces. Dice with
+    fractional side counts keep the float64 floor(u * sides) + 1 rule.
+
+    Attributes:
+        device (torch.device): Device used for random generation
+        batch_size (int): Number of rolls generated per batch
+    """
+
+    def __init__(self, device: torch.device, batch_size: int = DICE_BATCH_SIZE) -> None:
+        self.device: torch.device = device
+        self.batch_size: int = batch_size
+
+    def sample_batch(self, size: int, sides: int) -> torch.Tensor:
+        """Draw one batch of integer faces on the device.
+
+        Args:
+            size: Number of rolls
+            sides: Number of sides, at least 1
+
+        Returns:
+            Integer tensor of faces between 1 and sides
+        """
+        bits: int = max(int(sides - 1).bit_length(), 1)
+        dtype = torch.int16 if bits <= 14 else torch.int32 if bits <= 30 else torch.int64
+        faces = torch.empty(size, dtype=dtype, device=self.device)
+        acceptance: float = sides / (1 << bits)  # Always above 1/2
+        filled: int = 0
+        while filled < size:
+            needed: int = size - filled
+            # Power-of-two ranges are unbiased; oversample so one draw usually suffices
+            draws = torch.randint(
+                0, 1 << bits, (int(needed / acceptance * 1.05) + 64,),
+                dtype=dtype, device=self.device
+            )
+            accepted = draws[draws < sides][:needed]
+            faces[filled:filled + len(accepted)] = accepted
+            filled += len(accepted)
+        faces += 1
+        return faces
+
+    def sample_faces(self, sides: torch.Tensor) -> torch.Tensor:
+        """Draw one integer face per element, each die with its own side count.
+
+        A single 62-bit draw is shifted down to the next power of two above
+        each side count, and only the rejected elements are drawn again, so
+        dice of different sizes share one kernel launch and stay exact.
+
+        Args:
+            sides: int64 tensor of side counts on the device, each at least 1
+
+        Returns:
+            int64 tensor with faces[i] between 1 and sides[i]
+        """
+        bits = torch.frexp((sides - 1).to(torch.float64)).exponent.to(torch.int64)
+        shifts = RANDOM_BITS - bits
+        faces = torch.randint(
+            0, 1 << RANDOM_BITS, sides.shape, dtype=torch.int64, device=self.device
+        ) >> shifts
+        rejected = torch.nonzero(faces >= sides).flatten()
+        while len(rejected):
+            redrawn = torch.randint(
+                0, 1 << RANDOM_BITS, rejected.shape, dtype=torch.int64, device=self.device
+            ) >> shifts[rejected]
+            faces[rejected] = redrawn
+            rejected = rejected[redrawn >= sides[rejected]]
+        faces += 1
+        return faces
+
+    def iter_batches(self, number: int, sides: Union[int, float]) -> Iterator[torch.Tensor]:
+        """Yield the rolls of a notation batch by batch, on the device.
+
+        Args:
+            number: Number of dice
+            sides: Number of sides; a fractional count yields float64 rolls
+
+        Yields:
+            Tensor of at most batch_size rolls
+        """
+        if sides <= 0:
+            raise ValueError(f"Number of sides must be positive: {sides}")
+        integer_sides: bool = is_integer_sides(sides)
+        for start in range(0, number, self.batch_size):
+            size: int = min(self.batch_size, number - start)
+            if integer_sides:
+                yield self.sample_batch(size, int(sides))
+            else:
+                uniform = torch.rand(size, dtype=torch.float64, device=self.device)
+                yield (uniform * sides).floor_() + 1
+
+    def roll(self, number: int, sides: Union[int, float]) -> np.ndarray:
+        """Roll a number of identical dice.
+
+        Args:
+            number: Number of dice
+            sides: Number of sides; a fractional count yields float64 rolls
+
+        Returns:
+            Array of rolls, in the smallest dtype holding the faces
+        """
+        dtype = dice_dtype(int(sides)) if is_integer_sides(sides) else np.dtype(np.float64)
+        rolls = np.empty(number, dtype=dtype)
+        offset: int = 0
+        for batch in self.iter_batches(number, sides):
+            rolls[offset:offset + len(batch)] = batch.cpu().numpy()
+            offset += len(batch)
+        return rolls
@@ -0,0 +1,393 @@
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+import re
+import numpy as np
+import torch
+from .constants import DICE_EXPLODE_LIMIT, DICE_PLAN_CACHE_SIZE, MAX_DICE, MAX_SIDES
+from .dice_engine import DiceEngine, dice_dtype, is_integer_sides, sum_rolls
+from .dice_statistics import RollAccumulator
+
+TERM_TOKEN = re.compile(
+    r'([+-])?'
+    r'(?:(\d+)d(\d+e\d+|\d+(?:\.\d*)?|\.\d+)'  # NdX
+    r'(!)?'                                     # Exploding dice
+    r'(?:k([hl]?)(\d+))?'                       # Keep highest / lowest
+    r'(?:>=(\d+(?:\.\d*)?))?'                   # Success threshold
+    r'|(\d+))'                                  # Constant modifier
+)
+
+class DiceTerm:
+    """One signed NdX term of a dice expression and its modifiers.
+
+    Attributes:
+        count (int): Number of dice rolled
+        sides (Union[int, float]): Number of sides
+        sign (int): +1 or -1
+        explode (bool): Whether dice showing their highest face are rolled again and added
+        keep (Optional[Tuple[str, int]]): 'h' or 'l' and the number of dice kept
+        threshold (Optional[float]): Dice at or above it count as successes instead of being summed
+    """
+
+    def __init__(
+        self,
+        count: int,
+        sides: Union[int, float],
+        sign: int = 1,
+        explode: bool = False,
+        keep: Optional[Tuple[str, int]] = None,
+        threshold: Optional[float] = None
+    ) -> None:
+        self.count: int = count
+        self.sides: Union[int, float] = sides
+        self.sign: int = sign
+        self.explode: bool = explode
+        self.keep: Optional[Tuple[str, int]] = keep
+        self.threshold: Optional[float] = threshold
+
+    @property
+    def is_plain(self) -> bool:
+        """Whether the term is a bare, added NdX."""
+        return self.sign > 0 and not self.explode and self.keep is None and self.threshold is None
+
+    def roll(self, engine: DiceEngine, trials: int = 1) -> torch.Tensor:
+        """Roll the term's dice on the device and apply its modifiers.
+
+        Independent trials are rolled together as one (trials × count)
+        tensor, so keeping dice is a single batched topk along the rows.
+
+        Args:
+            engine: Dice generator
+            trials: Number of independent rolls of the term
+
+        Returns:
+            (trials × kept dice) tensor of the kept die values
+        """
+        values = torch.cat(list(engine.iter_batches(trials * self.count, self.sides))).view(trials, self.count)
+        if self.explode:
+            values = values.to(torch.int64)
+            flat = values.view(-1)
+            rerolled = torch.nonzero(flat == self.sides).flatten()
+            for _ in range(DICE_EXPLODE_LIMIT):
+                if not len(rerolled):
+                    break
+                extra = engine.sample_batch(len(rerolled), int(self.sides))
+                flat.index_add_(0, rerolled, extra.to(torch.int64))
+                rerolled = rerolled[extra == self.sides]
+        if self.keep is not None:
+            mode, kept = self.keep
+            values = torch.topk(values, kept, dim=1, largest=mode == 'h').values
+        return values
+
+    def score(self, values: torch.Tensor) -> Union[int, float]:
+        """Signed contribution of rolled values to the expression total."""
+        return self.score_batch(values).item()
+
+    def score_batch(self, values: torch.Tensor) -> torch.Tensor:
+        """Signed contribution of rolled values, as a scalar tensor left on their device."""
+        if self.threshold is not None:
+            total = (values >= self.threshold).sum()
+        elif values.dtype.is_floating_point:
+            total = values.sum(dtype=torch.float64)
+        else:
+            total = values.sum(dtype=torch.int64)
+        return total * self.sign
+
+    def score_trials(self, values: torch.Tensor) -> torch.Tensor:
+        """Signed contribution of each row of rolled values, as returned by roll."""
+        if self.threshold is not None:
+            totals = (values >= self.threshold).sum(dim=1)
+        elif values.dtype.is_floating_point:
+            totals = values.sum(dim=1, dtype=torch.float64)
+        else:
+            totals = values.sum(dim=1, dtype=torch.int64)
+        return totals * self.sign
+
+class DiceResult:
+    """Outcome of one execution of a dice plan.
+
+    Attributes:
+        values (np.ndarray): Kept die values of every term, in a compact dtype
+        total (Union[int, float]): Value of the expression
+        mean (float): Average kept die value
+        minimum (Union[int, float]): Lowest kept die value
+        maximum (Union[int, float]): Highest kept die value
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        total: Union[int, float],
+        mean: float,
+        minimum: Union[int, float],
+        maximum: Union[int, float]
+    ) -> None:
+        self.values: np.ndarray = values
+        self.total: Union[int, float] = total
+        self.mean: float = mean
+        self.minimum: Union[int, float] = minimum
+        self.maximum: Union[int, float] = maximum
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, total: Union[int, float]) -> 'DiceResult':
+        """Build a result, summarizing the die values on the host."""
+        return cls(values, total, sum_rolls(values) / len(values), values.min().item(), values.max().item())
+
+class DicePlan:
+    """Compiled dice expression, executed as vectorized tensor operations.
+
+    Attributes:
+        notation (str): Normalized expression
+        terms (Tuple[DiceTerm, ...]): Dice terms in expression order
+        constant (int): Sum of the signed constant modifiers
+    """
+
+    def __init__(self, notation: str, terms: Tuple[DiceTerm, ...], constant: int = 0) -> None:
+        self.notation: str = notation
+        self.terms: Tuple[DiceTerm, ...] = terms
+        self.constant: int = constant
+
+    @property
+    def dice_count(self) -> int:
+        """Number of dice rolled by one execution, rerolls excluded."""
+        return sum(term.count for term in self.terms)
+
+    @property
+    def streamable(self) -> bool:
+        """Whether every term can be rolled batch by batch, without keeping its dice."""
+        return all(not term.explode and term.keep is None for term in self.terms)
+
+    @property
+    def simple(self) -> Optional[Tuple[int, Union[int, float]]]:
+        """(count, sides) when the expression is a single bare NdX, None otherwise."""
+        if len(self.terms) == 1 and self.terms[0].is_plain and not self.constant:
+            return self.terms[0].count, self.terms[0].sides
+        return None
+
+    def roll(self, engine: DiceEngine) -> DiceResult:
+        """Execute the plan once.
+
+        Args:
+            engine: Dice generator
+
+        Returns:
+            Kept die values and the expression total
+        """
+        if self.simple is not None:
+            values = engine.roll(*self.simple)
+            return DiceResult.from_values(values, sum_rolls(values))
+
+        parts: List[np.ndarray] = []
+        total: Union[int, float] = self.constant
+        for term in self.terms:
+            values = term.roll(engine).flatten()
+            total += term.score(values)
+            array = values.cpu().numpy()
+            if not values.dtype.is_floating_point:
+                array = array.astype(dice_dtype(int(array.max(initial=1))), copy=False)
+            parts.append(array)
+        return DiceResult.from_values(np.concatenate(parts), total)
+
+    @property
+    def whole(self) -> bool:
+        """Whether every total is a whole number."""
+        return all(term.threshold is not None or is_integer_sides(term.sides) for term in self.terms)
+
+    def trial_totals(self, engine: DiceEngine, trials: int) -> torch.Tensor:
+        """Execute the plan for one chunk of trials, on the device.
+
+        Each term is rolled as one (trials × count) tensor and reduced to a
+        score per trial straight away.
+
+        Args:
+            engine: Dice generator
+            trials: Number of executions
+
+        Returns:
+            int64 totals, or float64 when a summed term has fractional sides
+        """
+        totals = torch.full(
+            (trials,), self.constant, dtype=torch.int64 if self.whole else torch.float64, device=engine.device
+        )
+        for term in self.terms:
+            totals += term.score_trials(term.roll(engine, trials))
+        return totals
+
+    def trial_chunk(self, engine: DiceEngine) -> int:
+        """Number of trials rolling about engine.batch_size dice."""
+        return max(engine.batch_size // self.dice_count, 1)
+
+    def roll_totals(self, engine: DiceEngine, trials: int) -> np.ndarray:
+        """Execute the plan many times and return every total.
+
+        Args:
+            engine: Dice generator
+            trials: Number of executions
+
+        Returns:
+            int64 totals, or float64 when a summed term has fractional sides
+        """
+        chunk: int = self.trial_chunk(engine)
+        return torch.cat([
+            self.trial_totals(engine, min(chunk, trials - start)) for start in range(0, trials, chunk)
+        ]).cpu().numpy()
+
+    def stream_batches(self, engine: DiceEngine) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        """Execute the plan batch by batch without keeping the rolls.
+
+        Args:
+            engine: Dice generator
+
+        Yields:
+            Tuple of (batch of die values, signed score of the batch), both on the device
+
+        Raises:
+            ValueError: If a term needs all of its dice at once (keep or explode)
+        """
+        if not self.streamable:
+            raise ValueError(f"Keep and exploding dice cannot be streamed: {self.notation}")
+        for term in self.terms:
+            for batch in engine.iter_batches(term.count, term.sides):
+                yield batch, term.score_batch(batch)
+
+    def stream(self, engine: DiceEngine, accumulator: RollAccumulator) -> Union[int, float]:
+        """Execute the plan into a running accumulator.
+
+        Batch scores are summed on the device by the accumulator, which only
+        reads them back at its sync points.
+
+        Args:
+            engine: Dice generator
+            accumulator: Receives every batch of die values with its score
+
+        Returns:
+            Expression total
+
+        Raises:
+            ValueError: If a term needs all of its dice at once (keep or explode)
+        """
+        for batch, score in self.stream_batches(engine):
+            accumulator.update(batch, score)
+        return self.constant + accumulator.total
+
+@lru_cache(maxsize=DICE_PLAN_CACHE_SIZE)
+def compile_dice_expression(notation: str, max_dice: int = MAX_DICE) -> DicePlan:
+    """Compile a dice expression into a reusable plan.
+
+    Expressions are sums of signed terms: NdX dice, optionally exploding
+    ('3d6!'), keeping the highest or lowest dice ('4d6kh3', '2d20kl1') or
+    counting successes ('10d10>=7'), and integer modifiers ('2d6+1d4-1').
+    Plans are cached, so rolling the same expression again skips parsing.
+
+    Args:
+        notation: Dice expression
+        max_dice: Largest number of dice per term
+
+    Returns:
+        Compiled plan
+
+    Raises:
+        ValueError: If the expression is malformed or out of bounds
+    """
+    compact: str = notation.strip().lower()
+    terms: List[DiceTerm] = []
+    constant: int = 0
+    position: int = 0
+    while position < len(compact):
+        match = TERM_TOKEN.match(compact, position)
+        if match is None or (position and match.group(1) is None):
+            raise ValueError(f"Invalid dice expression: {notation}")
+        sign: int = -1 if match.group(1) == '-' else 1
+        position = match.end()
+        if match.group(8) is not None:
+            constant += sign * int(match.group(8))
+            continue
+
+        count: int = int(match.group(2))
+        sides: float = float(match.group(3))
+        if not 0 < count <= max_dice:
+            raise ValueError(f"Dice count must be between 1 and {max_dice:,}: {notation}")
+        if not 0 < sides <= MAX_SIDES:
+            raise ValueError(f"Number of sides must be between 0 and {MAX_SIDES:g}: {notation}")
+        whole: bool = is_integer_sides(sides)
+        explode: bool = match.group(4) is not None
+        if explode and (not whole or sides < 2):
+            raise ValueError(f"Exploding dice need whole sides of at least 2: {notation}")
+        keep: Optional[Tuple[str, int]] = None
+        if match.group(6) is not None:
+            kept: int = int(match.group(6))
+            if not 0 < kept <= count:
+                raise ValueError(f"Cannot keep {kept} of {count} dice: {notation}")
+            keep = (match.group(5) or 'h', kept)
+        threshold: Optional[float] = float(match.group(7)) if match.group(7) is not None else None
+        terms.append(DiceTerm(count, int(sides) if whole else sides, sign, explode, keep, threshold))
+
+    if not terms:
+        raise ValueError(f"Dice expression needs at least one dice term: {notation}")
+    return DicePlan(compact, tuple(terms), constant)
+
+def roll_fused(plans: Sequence[DicePlan], engine: DiceEngine) -> List[DiceResult]:
+    """Roll plain integer NdX plans together, in a single draw.
+
+    Every die gets the side count of its notation, faces come from one
+    DiceEngine.sample_faces call, and per-notation totals, minima and maxima
+    are segmented reductions over the notation index of each die. Only the
+    faces and three small summary tensors cross to the host.
+
+    Args:
+        plans: Plans whose simple form has whole sides
+        engine: Dice generator
+
+    Returns:
+        One result per plan, in order
+    """
+    if not plans:
+        return []
+    counts = [plan.simple[0] for plan in plans]
+    sides = [int(plan.simple[1]) for plan in plans]
+    device = engine.device
+    count_tensor = torch.tensor(counts, dtype=torch.int64, device=device)
+    segments = torch.repeat_interleave(torch.arange(len(plans), device=device), count_tensor)
+    faces = engine.sample_faces(torch.tensor(sides, dtype=torch.int64, device=device)[segments])
+    totals = torch.zeros(len(plans), dtype=torch.int64, device=device).index_add_(0, segments, faces)
+    minima = torch.zeros_like(totals).scatter_reduce_(0, segments, faces, 'amin', include_self=False)
+    maxima = torch.zeros_like(totals).scatter_reduce_(0, segments, faces, 'amax', include_self=False)
+
+    values = np.split(faces.cpu().numpy(), np.cumsum(counts)[:-1])
+    return [
+        DiceResult(part.astype(dice_dtype(side)), total, total / count, minimum, maximum)
+        for part, side, count, total, minimum, maximum in zip(
+            values, sides, counts, totals.tolist(), minima.tolist(), maxima.tolist()
+        )
+    ]
+
+def roll_plans(plans: Sequence[DicePlan], engine: DiceEngine) -> List[DiceResult]:
+    """Execute several plans, fusing the plain integer ones into shared draws.
+
+    Consecutive NdX plans with whole sides are grouped up to the engine's
+    batch size and rolled by roll_fused, so hundreds of small notations cost
+    about as much as one. Other plans are executed on their own.
+
+    Args:
+        plans: Compiled dice expressions
+        engine: Dice generator
+
+    Returns:
+        One result per plan, in order
+    """
+    results: List[DiceResult] = []
+    group: List[DicePlan] = []
+    group_size: int = 0
+    for plan in plans:
+        simple = plan.simple
+        if simple is None or not is_integer_sides(simple[1]):
+            results.extend(roll_fused(group, engine))
+            group, group_size = [], 0
+            results.append(plan.roll(engine))
+            continue
+        if group and group_size + simple[0] > engine.batch_size:
+            results.extend(roll_fused(group, engine))
+            group, group_size = [], 0
+        group.append(plan)
+        group_size += simple[0]
+    results.extend(roll_fused(group, engine))
+    return results
@@ -0,0 +1,113 @@
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import wx
+import wx.grid
+from .constants import DICE_GRID_COLUMNS, DICE_TABLE_CACHE_CELLS
+
+CellValue = Union[str, Callable[[], str]]
+
+class DiceResultsTable(wx.grid.GridTableBase):
+    """Virtual grid table of dice results, one notation per row.
+
+    Every cell holds either its text or a function making it from the
+    row's compact results (roll array, statistics, plan). The grid only asks
+    for the cells it paints, so a row's text is made when the row first
+    becomes visible and kept in a bounded cache of recently painted cells.
+    Rows that are never scrolled into view are never formatted.
+
+    Attributes:
+        rows (List[List[CellValue]]): Text or text maker of every cell
+        cache_size (int): Number of made cell texts kept
+    """
+
+    def __init__(self, columns: int = len(DICE_GRID_COLUMNS), cache_size: int = DICE_TABLE_CACHE_CELLS) -> None:
+        super().__init__()
+        self.rows: List[List[CellValue]] = []
+        self.cache_size: int = cache_size
+        self._columns: int = columns
+        self._labels: Dict[int, str] = {}
+        self._made: 'OrderedDict[Tuple[int, int], str]' = OrderedDict()
+
+    def set_cell(self, row: int, col: int, value: CellValue) -> None:
+        """Set the text of a cell, or a function making it when first painted.
+
+        Args:
+            row: Row index
+            col: Column index
+            value: Cell text, or function returning it
+        """
+        self.set_row(row, {col: value})
+
+    def set_row(self, row: int, values: Dict[int, CellValue]) -> None:
+        """Set several cells of a row at once, refreshing the grid once.
+
+        Args:
+            row: Row index
+            values: Text or text maker of each column to set
+        """
+        cells: List[CellValue] = self.rows[row]
+        for col, value in values.items():
+            cells[col] = value
+            if self._made:
+                self._made.pop((row, col), None)
+        grid: Optional[wx.grid.Grid] = self.GetView()
+        if grid is not None:
+            grid.ForceRefresh()
+
+    def _notify(self, message: int, *args: int) -> None:
+        grid: Optional[wx.grid.Grid] = self.GetView()
+        if grid is not None:
+            grid.ProcessTableMessage(wx.grid.GridTableMessage(self, message, *args))
+
+    def GetNumberRows(self) -> int:
+        return len(self.rows)
+
+    def GetNumberCols(self) -> int:
+        return self._columns
+
+    def IsEmptyCell(self, row: int, col: int) -> bool:
+        return row >= len(self.rows) or self.rows[row][col] == ""
+
+    def GetValue(self, row: int, col: int) -> str:
+        if row >= len(self.rows):
+            return ""
+        value: CellValue = self.rows[row][col]
+        if isinstance(value, str):
+            return value
+        key: Tuple[int, int] = (row, col)
+        text: Optional[str] = self._made.get(key)
+        if text is None:
+            text = value()
+            self._made[key] = text
+            if len(self._made) > self.cache_size:
+                self._made.popitem(last=False)
+        else:
+            self._made.move_to_end(key)
+        return text
+
+    def SetValue(self, row: int, col: int, value: CellValue) -> None:
+        self.rows[row][col] = value
+        self._made.pop((row, col), None)
+
+    def Clear(self) -> None:
+        for cells in self.rows:
+            cells[:] = [""] * self._columns
+        self._made.clear()
+
+    def AppendRows(self, numRows: int = 1) -> bool:
+        self.rows.extend([""] * self._columns for _ in range(numRows))
+        self._notify(wx.grid.GRIDTABLE_NOTIFY_ROWS_APPENDED, numRows)
+        return True
+
+    def DeleteRows(self, pos: int = 0, numRows: int = 1) -> bool:
+        numRows = min(numRows, len(self.rows) - pos)
+        del self.rows[pos:pos + numRows]
+        self._made.clear()  # Cached cells below pos moved up
+        self._notify(wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED, pos, numRows)
+        return True
+
+    def GetColLabelValue(self, col: int) -> str:
+        return self._labels.get(col, "")
+
+    def SetColLabelValue(self, col: int, label: str) -> None:
+        self._labels[col] = label
@@ -0,0 +1,289 @@
+from typing import Dict, List, Optional, Sequence, Union
+import math
+import numpy as np
+import torch
+from .constants import DICE_HISTOGRAM_MAX_BINS, DICE_QUANTILES, DICE_STATS_SYNC_BATCHES
+
+def quantile_rank(q: float, count: int) -> int:
+    """1-based rank of the q-quantile: the smallest value with at least q·count rolls at or below it."""
+    return min(max(math.ceil(q * count), 1), count)
+
+def median_ranks(count: int) -> List[int]:
+    """1-based ranks averaged into the median, one for odd counts and two for even counts."""
+    return [(count + 1) // 2, count // 2 + 1]
+
+class RollStatistics:
+    """Summary statistics of a set of rolls.
+
+    Attributes:
+        count (int): Number of rolls
+        mean (float): Average roll
+        std (float): Sample standard deviation
+        minimum (float): Lowest roll
+        maximum (float): Highest roll
+        median (Optional[float]): Median roll, averaging the two middle rolls of an even count; None if not tracked
+        quantiles (Dict[float, float]): Value of each requested quantile
+        mode (Optional[float]): Most frequent roll, None when no histogram was built
+        mode_count (int): Number of rolls equal to the mode
+    """
+
+    def __init__(
+        self,
+        count: int,
+        mean: float,
+        std: float,
+        minimum: float,
+        maximum: float,
+        median: Optional[float],
+        quantiles: Dict[float, float],
+        mode: Optional[float] = None,
+        mode_count: int = 0
+    ) -> None:
+        self.count: int = count
+        self.mean: float = mean
+        self.std: float = std
+        self.minimum: float = minimum
+        self.maximum: float = maximum
+        self.median: Optional[float] = median
+        self.quantiles: Dict[float, float] = quantiles
+        self.mode: Optional[float] = mode
+        self.mode_count: int = mode_count
+
+    @classmethod
+    def from_histogram(
+        cls,
+        counts: np.ndarray,
+        offset: int = 0,
+        quantiles: Sequence[float] = DICE_QUANTILES
+    ) -> 'RollStatistics':
+        """Derive every statistic from a histogram of integer rolls, in O(bins).
+
+        Args:
+            counts: Number of rolls of each value from offset upwards
+            offset: Value of the first bin
+            quantiles: Quantiles to report
+
+        Returns:
+            Exact statistics of the rolls
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        total: int = int(counts.sum())
+        occupied = np.flatnonzero(counts)
+        values = np.arange(len(counts), dtype=np.float64)
+        mean: float = float(np.dot(values, counts)) / total
+        variance: float = float(np.dot((values - mean) ** 2, counts)) / (total - 1) if total > 1 else 0.0
+        cumulative = np.cumsum(counts)
+
+        def order_statistic(rank: int) -> float:
+            return float(offset + np.searchsorted(cumulative, rank))
+
+        mode_index: int = int(np.argmax(counts))
+        return cls(
+            total, offset + mean, math.sqrt(variance),
+            float(offset + occupied[0]), float(offset + occupied[-1]),
+            sum(order_statistic(rank) for rank in median_ranks(total)) / 2,
+            {q: order_statistic(quantile_rank(q, total)) for q in quantiles},
+            float(offset + mode_index), int(counts[mode_index])
+        )
+
+def order_statistics(values: np.ndarray, ranks: Sequence[int]) -> Dict[int, float]:
+    """Exact values at the given 1-based ranks, by selection instead of sorting.
+
+    The middle requested rank is placed with np.partition in linear time,
+    then lower and higher ranks are selected within the part of the array
+    on their side only, so k ranks cost about log2(k) passes over the rolls.
+
+    Args:
+        values: Rolls
+        ranks: 1-based ranks between 1 and len(values)
+
+    Returns:
+        Value of each rank
+    """
+    selected: Dict[int, float] = {}
+    pending = [(values, 0, sorted({rank - 1 for rank in ranks}))]
+    while pending:
+        part, offset, indices = pending.pop()
+        if not indices:
+            continue
+        middle: int = indices[len(indices) // 2]
+        part = np.partition(part, middle - offset)
+        selected[middle + 1] = float(part[middle - offset])
+        pending.append((part[:middle - offset], offset, [index for index in indices if index < middle]))
+        pending.append((part[middle - offset + 1:], middle + 1, [index for index in indices if index > middle]))
+    return selected
+
+def roll_statistics(
+    rolls: Union[np.ndarray, List[Union[int, float]]],
+    device: torch.device,
+    quantiles: Sequence[float] = DICE_QUANTILES,
+    max_bins: int = DICE_HISTOGRAM_MAX_BINS
+) -> RollStatistics:
+    """Compute exact roll statistics without sorting the rolls.
+
+    Whole-numbered rolls spanning fewer than max_bins values are counted
+    with a single bincount on the device and every statistic is derived
+    from the histogram. Wider or fractional rolls (1e9-sided dice) get their
+    moments in one pass and their median and quantiles by selection, so
+    only the requested order statistics are computed.
+
+    Args:
+        rolls: Roll results
+        device: Device used for the histogram
+        quantiles: Quantiles to report
+        max_bins: Largest number of histogram bins
+
+    Returns:
+        Statistics of the rolls
+    """
+    array = np.asarray(rolls)
+    if not len(array):
+        raise ValueError("Cannot summarize an empty set of rolls")
+    total: int = len(array)
+    minimum, maximum = array.min().item(), array.max().item()
+    whole: bool = array.dtype.kind in 'iu' or bool(np.array_equal(array, np.floor(array)))
+    if whole and maximum - minimum < max_bins:
+        if array.dtype not in (np.uint8, np.int16, np.int32, np.int64):
+            array = array.astype(np.int64)
+        values = torch.from_numpy(array).to(device)
+        if maximum < max_bins and minimum >= 0:
+            counts = torch.bincount(values, minlength=int(maximum) + 1)[int(minimum):]
+        else:
+            counts = torch.bincount(values.to(torch.int64) - int(minimum), minlength=int(maximum - minimum) + 1)
+        return RollStatistics.from_histogram(counts.cpu().numpy(), int(minimum), quantiles)
+
+    mean: float = float(array.mean(dtype=np.float64))
+    deviations = array - mean
+    variance: float = float(np.dot(deviations, deviations)) / (total - 1) if total > 1 else 0.0
+    ranks: Dict[float, int] = {q: quantile_rank(q, total) for q in quantiles}
+    selected = order_statistics(array, median_ranks(total) + list(ranks.values()))
+    return RollStatistics(
+        total, mean, math.sqrt(variance), float(minimum), float(maximum),
+        sum(selected[rank] for rank in median_ranks(total)) / 2,
+        {q: selected[rank] for q, rank in ranks.items()}
+    )
+
+class RollAccumulator:
+    """Streaming roll statistics, updated batch by batch on the device.
+
+    Batch moments are merged into the running ones with the parallel form of
+    Welford's algorithm (Chan et al.), which stays accurate over billions of
+    rolls. Mean, M2, minimum, maximum, a partial sum and the optional
+    histogram stay on the device, so update() never waits for it. Every
+    sync_batches batches, and before results are read, the partial sum is
+    folded into an exact Python integer (a 10-billion-die total can overflow
+    int64) and the histogram's overflow bins are checked. Memory does not
+    depend on the number of rolls.
+
+    Attributes:
+        device (torch.device): Device holding the running statistics
+        count (int): Number of rolls seen
+        max_bins (int): Largest roll value + 1 still counted in the histogram, allocated up front
+        sync_batches (int): Batches between reads of the device state
+    """
+
+    def __init__(
+        self,
+        device: torch.device,
+        max_bins: int = DICE_HISTOGRAM_MAX_BINS,
+        sync_batches: int = DICE_STATS_SYNC_BATCHES
+    ) -> None:
+        self.device: torch.device = device
+        self.count: int = 0
+        self.max_bins: int = max_bins
+        self.sync_batches: int = sync_batches
+        self._total: Union[int, float] = 0
+        self._pending_total: Optional[torch.Tensor] = None
+        self._pending_batches: int = 0
+        self._mean = torch.zeros((), dtype=torch.float64, device=device)
+        self._m2 = torch.zeros((), dtype=torch.float64, device=device)
+        self._minimum: Optional[torch.Tensor] = None
+        self._maximum: Optional[torch.Tensor] = None
+        self._ones = torch.ones(1, dtype=torch.int64, device=device)
+        # Bin 0 counts negative rolls and the last bin rolls of max_bins or more
+        self._histogram: Optional[torch.Tensor] = torch.zeros(max_bins + 2, dtype=torch.int64, device=device)
+
+    def update(self, batch: torch.Tensor, score: Optional[torch.Tensor] = None) -> None:
+        """Add a batch of rolls.
+
+        Args:
+            batch: 1-D tensor of rolls on the accumulator's device
+            score: Scalar tensor added to the total instead of the batch sum (signed or success-counting terms)
+        """
+        size: int = len(batch)
+        if not size:
+            return
+        values = batch.to(torch.float64)
+        batch_mean = values.mean()
+        batch_m2 = ((values - batch_mean) ** 2).sum()
+        combined: int = self.count + size
+        delta = batch_mean - self._mean
+        self._mean += delta * (size / combined)
+        self._m2 += batch_m2 + delta * delta * (self.count * size / combined)
+        self.count = combined
+
+        low, high = torch.aminmax(batch)
+        self._minimum = low if self._minimum is None else torch.minimum(self._minimum, low)
+        self._maximum = high if self._maximum is None else torch.maximum(self._maximum, high)
+        batch_total = score if score is not None else batch.sum(
+            dtype=torch.float64 if batch.dtype.is_floating_point else torch.int64
+        )
+        self._pending_total = batch_total if self._pending_total is None else self._pending_total + batch_total
+
+        if self._histogram is not None:
+            if batch.dtype.is_floating_point:
+                # Fractional rolls land in the underflow bin, like negative ones
+                whole = torch.where(batch == batch.floor(), batch, -1.0)
+                bins = whole.clamp_(-1, self.max_bins).to(torch.int64)
+            else:
+                bins = batch.to(torch.int64).clamp(-1, self.max_bins)
+            self._histogram.scatter_add_(0, bins.add_(1), self._ones.expand(len(bins)))
+
+        self._pending_batches += 1
+        if self._pending_batches >= self.sync_batches:
+            self.sync()
+
+    def sync(self) -> None:
+        """Read back the device partial sum and drop the histogram if it overflowed."""
+        if self._pending_total is not None:
+            self._total += self._pending_total.item()
+            self._pending_total = None
+        self._pending_batches = 0
+        if self._histogram is not None and bool(self._histogram[0] + self._histogram[-1]):
+            self._histogram = None  # Too wide: keep the moments only
+
+    @property
+    def total(self) -> Union[int, float]:
+        """Sum of the rolls seen, or of their scores when given."""
+        self.sync()
+        return self._total
+
+    @property
+    def mean(self) -> float:
+        """Average of the rolls seen."""
+        return float(self._mean)
+
+    def result(self, quantiles: Sequence[float] = DICE_QUANTILES) -> RollStatistics:
+        """Return the statistics of every roll seen.
+
+        Median, quantiles and mode are exact when the histogram was kept and
+        unavailable otherwise.
+
+        Args:
+            quantiles: Quantiles to report
+
+        Returns:
+            Statistics of the rolls
+        """
+        if not self.count:
+            raise ValueError("Cannot summarize an empty set of rolls")
+        self.sync()
+        if self._histogram is not None:
+            counts = self._histogram[1:-1].cpu().numpy()
+            return RollStatistics.from_histogram(counts[:np.flatnonzero(counts)[-1] + 1], 0, quantiles)
+        variance: float = float(self._m2) / (self.count - 1) if self.count > 1 else 0.0
+        return RollStatistics(
+            self.count, self.mean, math.sqrt(variance),
+            float(self._minimum), float(self._maximum),
+            None, {}
+        )
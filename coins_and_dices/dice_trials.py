@@ -0,0 +1,136 @@
+from typing import Callable, Optional
+import numpy as np
+import torch
+from .constants import DICE_HISTOGRAM_MAX_BINS
+from .dice_distribution import DiceDistribution, plan_distribution
+from .dice_engine import DiceEngine
+from .dice_expression import DicePlan
+
+class TrialTotals:
+    """Histogram of the totals of a dice expression over repeated trials.
+
+    Attributes:
+        notation (str): Expression rolled on every trial
+        trials (int): Number of trials (T)
+        offset (int): Total counted by the first histogram bin
+        histogram (np.ndarray): Number of trials per total from offset upwards
+        distribution (Optional[DiceDistribution]): Exact distribution of the total, if available
+    """
+
+    def __init__(
+        self,
+        notation: str,
+        trials: int,
+        offset: int,
+        histogram: np.ndarray,
+        distribution: Optional[DiceDistribution] = None
+    ) -> None:
+        self.notation: str = notation
+        self.trials: int = trials
+        self.offset: int = offset
+        self.histogram: np.ndarray = histogram
+        self.distribution: Optional[DiceDistribution] = distribution
+
+    @property
+    def totals(self) -> np.ndarray:
+        """Total of each histogram bin."""
+        return np.arange(self.offset, self.offset + len(self.histogram))
+
+    @property
+    def sum(self) -> int:
+        """Sum of the totals of every trial."""
+        return int(np.dot(self.totals, self.histogram))
+
+    @property
+    def mean(self) -> float:
+        """Mean total per trial."""
+        return self.offset + float(np.dot(np.arange(len(self.histogram)), self.histogram)) / self.trials
+
+    @property
+    def variance(self) -> float:
+        """Variance of the total per trial."""
+        deviations = np.arange(len(self.histogram)) - (self.mean - self.offset)
+        return float(np.dot(deviations * deviations, self.histogram)) / self.trials
+
+    @property
+    def minimum(self) -> int:
+        """Lowest total rolled."""
+        return self.offset + int(np.flatnonzero(self.histogram)[0])
+
+    @property
+    def maximum(self) -> int:
+        """Highest total rolled."""
+        return self.offset + int(np.flatnonzero(self.histogram)[-1])
+
+    @property
+    def expected(self) -> Optional[np.ndarray]:
+        """Expected number of trials per histogram bin under the exact distribution."""
+        if self.distribution is None:
+            return None
+        expected = np.zeros(len(self.histogram))
+        start: int = max(self.distribution.offset, self.offset)
+        stop: int = min(self.distribution.offset + len(self.distribution), self.offset + len(self.histogram))
+        if start < stop:
+            expected[start - self.offset:stop - self.offset] = (
+                self.distribution.pmf[start - self.distribution.offset:stop - self.distribution.offset]
+            )
+        return expected * self.trials
+
+class DiceTrialsEngine:
+    """Roll a dice expression T times and reduce each trial to its total on the device.
+
+    Trials are rolled in (chunk × dice) tensors of about DICE_BATCH_SIZE
+    dice and immediately counted into a histogram of totals, so memory does
+    not depend on the number of trials.
+
+    Attributes:
+        engine (DiceEngine): Dice generator
+        max_bins (int): Widest range of totals counted
+    """
+
+    name: str = "trials"
+
+    def __init__(self, device: torch.device, max_bins: int = DICE_HISTOGRAM_MAX_BINS) -> None:
+        self.engine: DiceEngine = DiceEngine(device)
+        self.max_bins: int = max_bins
+
+    def run(
+        self,
+        plan: DicePlan,
+        trials: int,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> TrialTotals:
+        """Run T trials of an expression and build the histogram of totals.
+
+        Args:
+            plan: Compiled dice expression with whole-numbered totals
+            trials: Number of trials (T)
+            on_progress: Called with the number of trials done after each chunk
+
+        Returns:
+            Histogram of totals per trial, with the exact distribution when available
+
+        Raises:
+            ValueError: If totals can be fractional or span more than max_bins values
+        """
+        if not plan.whole:
+            raise ValueError(f"Trials need whole-numbered totals: {plan.notation}")
+        chunk: int = plan.trial_chunk(self.engine)
+        offset: int = 0
+        histogram: Optional[torch.Tensor] = None
+        for start in range(0, trials, chunk):
+            size: int = min(chunk, trials - start)
+            totals = plan.trial_totals(self.engine, size)
+            low, high = (int(value) for value in torch.aminmax(totals))
+            if histogram is None:
+                offset, histogram = low, torch.zeros(0, dtype=torch.int64, device=totals.device)
+            # Grow the histogram to cover the chunk, on either side
+            low, high = min(low, offset), max(high, offset + len(histogram) - 1)
+            if high - low >= self.max_bins:
+                raise ValueError(f"Trial totals span more than {self.max_bins:,} values: {plan.notation}")
+            counts = torch.bincount(totals - low, minlength=high - low + 1)
+            counts[offset - low:offset - low + len(histogram)] += histogram
+            offset, histogram = low, counts
+            if on_progress is not None:
+                on_progress(start + size)
+        return TrialTotals(plan.notation, trials, offset, histogram.cpu().numpy(), plan_distribution(plan))
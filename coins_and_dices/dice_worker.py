@@ -0,0 +1,58 @@
+from typing import Iterator, List, Sequence, Tuple, Union
+import math
+from .constants import DICE_BATCH_SIZE, DICE_HISTOGRAM_MAX_BINS
+from .dice_engine import DiceEngine
+from .dice_expression import DicePlan
+from .dice_statistics import RollAccumulator, RollStatistics
+
+class DiceStreamCollector:
+    """Stream the statistics of dice expressions, one expression after the other.
+
+    Meant to be fed by a CoinFlipWorker, so billions of dice are rolled off
+    the UI thread and the run can be cancelled between batches. Every batch
+    is folded into a RollAccumulator on the device and dropped; an
+    expression's total and statistics are read back once it is finished.
+
+    Attributes:
+        plans (List[DicePlan]): Streamable expressions to roll
+        dice_count (int): Number of dice of every expression together
+        dice_done (int): Number of dice rolled so far
+        results (List[Tuple[Union[int, float], RollStatistics]]): Total and statistics of each finished expression
+    """
+
+    def __init__(self, plans: Sequence[DicePlan]) -> None:
+        self.plans: List[DicePlan] = list(plans)
+        self.dice_count: int = sum(plan.dice_count for plan in self.plans)
+        self.dice_done: int = 0
+        self.results: List[Tuple[Union[int, float], RollStatistics]] = []
+
+    def consume(self, engine: DiceEngine, batch_size: int = DICE_BATCH_SIZE) -> Iterator[None]:
+        """Roll the remaining expressions with an engine, batch by batch.
+
+        Die values never exceed the largest number of sides of an expression,
+        which bounds the histogram its accumulator allocates.
+
+        Args:
+            engine: Dice generator
+            batch_size: Dice per batch
+
+        Yields:
+            None after each batch, so the caller can report progress or stop
+        """
+        batches = DiceEngine(engine.device, batch_size)
+        for plan in self.plans[len(self.results):]:
+            sides: int = max(math.ceil(term.sides) for term in plan.terms)
+            accumulator = RollAccumulator(engine.device, min(DICE_HISTOGRAM_MAX_BINS, sides + 1))
+            for batch, score in plan.stream_batches(batches):
+                accumulator.update(batch, score)
+                self.dice_done += len(batch)
+                yield
+            self.results.append((plan.constant + accumulator.total, accumulator.result()))
+
+    def summary(self) -> Tuple[int, List[Tuple[Union[int, float], RollStatistics]]]:
+        """Return the number of dice rolled so far and the finished expressions."""
+        return self.dice_done, list(self.results)
+
+    def finish(self) -> List[Tuple[Union[int, float], RollStatistics]]:
+        """Return the total and statistics of every finished expression."""
+        return list(self.results)
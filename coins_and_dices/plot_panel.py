@@ -0,0 +1,192 @@
+from typing import List, Optional, Tuple
+import numpy as np
+import wx
+from .constants import PLOT_MARGIN, PLOT_PANEL_SIZE
+
+class PlotPanel(wx.Panel):
+    """Lightweight plot drawn directly with a device context.
+
+    Shows either a histogram as bars, optionally with an expected curve drawn
+    over them, or a line series with a min/max band, a reference level and
+    an envelope. Drawing only scales the stored arrays to the panel size, so
+    repaints stay cheap whatever the size of the underlying run.
+
+    Attributes:
+        title (str): Caption drawn above the plot
+        x (Optional[np.ndarray]): Value of each bar, or abscissa of each series point
+        heights (Optional[np.ndarray]): Height of each bar
+        overlay (Optional[np.ndarray]): Expected height of each bar, drawn as a line
+        y (Optional[np.ndarray]): Ordinate of each series point
+        band (Optional[Tuple[np.ndarray, np.ndarray]]): Low/high values around each series point
+        envelope (Optional[Tuple[np.ndarray, np.ndarray]]): Lower/upper reference curves
+        reference (Optional[float]): Horizontal reference level
+    """
+
+    def __init__(self, parent: wx.Window, size: tuple = PLOT_PANEL_SIZE) -> None:
+        super().__init__(parent, size=size)
+        self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        self.title: str = ""
+        self.x: Optional[np.ndarray] = None
+        self.heights: Optional[np.ndarray] = None
+        self.overlay: Optional[np.ndarray] = None
+        self.y: Optional[np.ndarray] = None
+        self.band: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.envelope: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.reference: Optional[float] = None
+        self.Bind(wx.EVT_PAINT, self.on_paint)
+        self.Bind(wx.EVT_SIZE, self.on_size)
+
+    def set_histogram(
+        self,
+        x: np.ndarray,
+        heights: np.ndarray,
+        overlay: Optional[np.ndarray] = None,
+        title: str = ""
+    ) -> None:
+        """Display a histogram, with an optional expected curve.
+
+        Args:
+            x: Value of each bar
+            heights: Height of each bar
+            overlay: Expected height of each bar
+            title: Caption drawn above the plot
+        """
+        self.clear()
+        self.x = np.asarray(x)
+        self.heights = np.asarray(heights, dtype=np.float64)
+        self.overlay = None if overlay is None else np.asarray(overlay, dtype=np.float64)
+        self.title = title
+        self.Refresh()
+
+    def set_series(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        band: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        reference: Optional[float] = None,
+        envelope: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        title: str = ""
+    ) -> None:
+        """Display a line series.
+
+        Args:
+            x: Abscissa of each point, increasing
+            y: Ordinate of each point
+            band: Low/high values around each point, drawn as a shaded band
+            reference: Horizontal reference level
+            envelope: Lower/upper reference curves at each point
+            title: Caption drawn above the plot
+        """
+        self.clear()
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.band = band
+        self.reference = reference
+        self.envelope = envelope
+        self.title = title
+        self.Refresh()
+
+    def clear(self) -> None:
+        """Remove the plotted data."""
+        self.x = self.heights = self.overlay = self.y = None
+        self.band = self.envelope = self.reference = None
+        self.title = ""
+        self.Refresh()
+
+    def on_size(self, event: wx.SizeEvent) -> None:
+        """Redraw the plot at the new size."""
+        self.Refresh()
+        event.Skip()
+
+    def on_paint(self, event: wx.PaintEvent) -> None:
+        """Draw the stored histogram or series scaled to the panel.
+
+        Args:
+            event: The paint event
+        """
+        dc = wx.AutoBufferedPaintDC(self)
+        dc.SetBackground(wx.WHITE_BRUSH)
+        dc.Clear()
+        width, height = self.GetClientSize()
+        area = wx.Rect(
+            PLOT_MARGIN, PLOT_MARGIN,
+            max(width - 2 * PLOT_MARGIN, 1), max(height - 2 * PLOT_MARGIN, 1)
+        )
+        if self.heights is not None and len(self.heights):
+            self.draw_histogram(dc, area)
+        elif self.y is not None and len(self.y):
+            self.draw_series(dc, area)
+        else:
+            return
+
+        dc.SetPen(wx.BLACK_PEN)
+        dc.DrawLine(area.Left, area.Bottom, area.Right, area.Bottom)
+        dc.SetTextForeground(wx.BLACK)
+        dc.DrawText(self.title, area.Left, max(area.Top - dc.GetCharHeight() - 2, 0))
+        dc.DrawText(f"{self.x[0]:g}", area.Left, area.Bottom + 2)
+        last_label = f"{self.x[-1]:g}"
+        dc.DrawText(last_label, area.Right - dc.GetTextExtent(last_label)[0], area.Bottom + 2)
+
+    def draw_histogram(self, dc: wx.DC, area: wx.Rect) -> None:
+        """Draw the bars and the expected curve."""
+        peak = max(self.heights.max(), self.overlay.max() if self.overlay is not None else 0.0)
+        scale = area.Height / peak if peak > 0 else 0.0
+        bar_width = area.Width / len(self.heights)
+
+        dc.SetPen(wx.TRANSPARENT_PEN)
+        dc.SetBrush(wx.Brush(wx.Colour(70, 130, 180)))
+        for index, bar in enumerate(self.heights.tolist()):
+            bar_height = int(round(bar * scale))
+            if bar_height:
+                x = area.Left + int(index * bar_width)
+                dc.DrawRectangle(x, area.Bottom - bar_height, max(int(bar_width), 1), bar_height)
+
+        if self.overlay is not None:
+            dc.SetPen(wx.Pen(wx.RED, 2))
+            centres = area.Left + (np.arange(len(self.overlay)) + 0.5) * bar_width
+            self.draw_curve(dc, centres, area.Bottom - self.overlay * scale)
+
+    def draw_series(self, dc: wx.DC, area: wx.Rect) -> None:
+        """Draw the band, the envelope, the reference level and the series line."""
+        curves: List[np.ndarray] = [self.y]
+        if self.band is not None:
+            curves.extend(self.band)
+        if self.envelope is not None:
+            curves.extend(self.envelope)
+        low = min(float(np.min(curve)) for curve in curves)
+        high = max(float(np.max(curve)) for curve in curves)
+        if self.reference is not None:
+            low, high = min(low, self.reference), max(high, self.reference)
+        span = high - low or 1.0
+
+        x_span = (self.x[-1] - self.x[0]) or 1.0
+        xs = area.Left + (self.x - self.x[0]) / x_span * area.Width
+
+        def to_y(values: np.ndarray) -> np.ndarray:
+            return area.Bottom - (np.asarray(values) - low) / span * area.Height
+
+        if self.band is not None:
+            dc.SetPen(wx.Pen(wx.Colour(173, 216, 230)))
+            for x, top, bottom in zip(xs.tolist(), to_y(self.band[1]).tolist(), to_y(self.band[0]).tolist()):
+                dc.DrawLine(int(x), int(round(top)), int(x), int(round(bottom)) + 1)
+        if self.envelope is not None:
+            dc.SetPen(wx.Pen(wx.Colour(128, 128, 128), 1, wx.PENSTYLE_SHORT_DASH))
+            for curve in self.envelope:
+                self.draw_curve(dc, xs, to_y(curve))
+        if self.reference is not None:
+            dc.SetPen(wx.Pen(wx.RED, 1))
+            reference_y = int(round(float(to_y(self.reference))))
+            dc.DrawLine(area.Left, reference_y, area.Right, reference_y)
+        dc.SetPen(wx.Pen(wx.Colour(70, 130, 180), 2))
+        self.draw_curve(dc, xs, to_y(self.y))
+
+        dc.SetTextForeground(wx.BLACK)
+        dc.DrawText(f"{high:.4g}", 2, area.Top)
+        dc.DrawText(f"{low:.4g}", 2, area.Bottom - dc.GetCharHeight())
+
+    @staticmethod
+    def draw_curve(dc: wx.DC, xs: np.ndarray, ys: np.ndarray) -> None:
+        """Draw a polyline through pixel coordinates."""
+        points = [wx.Point(int(x), int(round(y))) for x, y in zip(xs.tolist(), ys.tolist())]
+        if len(points) > 1:
+            dc.DrawLines(points)
@@ -0,0 +1,178 @@
+from typing import Callable, Deque, Iterable, Iterator, Optional, Tuple
+from collections import deque
+import io
+import time
+import wx
+from .constants import RENDER_BLOCK_LINES, RENDER_INTERVAL_MS, RENDER_TICK_BUDGET
+
+def iter_line_blocks(
+    format_lines: Callable[[int, int, int], str],
+    length: int,
+    items_per_line: int,
+    block_lines: int = RENDER_BLOCK_LINES
+) -> Iterator[str]:
+    """Format a sequence as blocks of lines, one block at a time.
+
+    Args:
+        format_lines: Function formatting items [start, stop) with a given
+            number of items per line, such as CoinBuffer.format_lines
+        length: Number of items in the sequence
+        items_per_line: Number of items per formatted line
+        block_lines: Number of lines per yielded block
+
+    Yields:
+        Newline-joined lines covering the next block of items
+    """
+    block_size: int = items_per_line * block_lines
+    for block_start in range(0, length, block_size):
+        yield format_lines(block_start, min(block_start + block_size, length), items_per_line)
+
+class ProgressiveRenderer:
+    """Timer-driven renderer filling a text target with preformatted blocks.
+
+    Blocks come from a producer iterator and are appended to an in-memory
+    buffer; the target is never read back. On each wx.Timer tick the producer
+    is advanced until the per-tick time budget is spent, then the target may
+    be redrawn, and the UI keeps processing events between ticks. No block is
+    ever skipped.
+
+    Grid cells can only be replaced, so a redraw costs time proportional to
+    the text so far. Two rules keep that cost bounded:
+    - the target is only redrawn once the production since the last redraw
+      took at least as long as that redraw, so redraws space out
+      geometrically and their total cost stays linear in the text length
+    - time spent past a tick's deadline, redraw included, is taken from the
+      following ticks, which are skipped entirely while it exceeds a budget
+
+    Renders for other targets can be queued behind the current one; they
+    start on the tick after it completes.
+
+    Attributes:
+        timer (wx.Timer): Timer driving the render ticks
+        interval_ms (int): Milliseconds between ticks
+        budget (float): Seconds of block production allowed per tick
+    """
+
+    def __init__(
+        self,
+        owner: wx.EvtHandler,
+        interval_ms: int = RENDER_INTERVAL_MS,
+        budget: float = RENDER_TICK_BUDGET
+    ) -> None:
+        self.interval_ms: int = interval_ms
+        self.budget: float = budget
+        self.timer: wx.Timer = wx.Timer(owner)
+        owner.Bind(wx.EVT_TIMER, self._on_tick, self.timer)
+        self._blocks: Optional[Iterator[str]] = None
+        self._buffer: io.StringIO = io.StringIO()
+        self._draw: Optional[Callable[[str], None]] = None
+        self._on_done: Optional[Callable[[], None]] = None
+        self._draw_cost: float = 0.0
+        self._undrawn: float = 0.0
+        self._overrun: float = 0.0
+        self._queue: Deque[Tuple[Iterator[str], Callable[[str], None], Optional[Callable[[], None]]]] = deque()
+
+    def is_running(self) -> bool:
+        """Tell whether a render is still in progress."""
+        return self._blocks is not None
+
+    def start(
+        self,
+        blocks: Iterable[str],
+        draw: Callable[[str], None],
+        on_done: Optional[Callable[[], None]] = None,
+        synchronous: bool = False
+    ) -> None:
+        """Start rendering, replacing any render in progress or queued.
+
+        Args:
+            blocks: Preformatted text blocks, joined with newlines
+            draw: Callback receiving the whole text rendered so far
+            on_done: Callback run once every block has been drawn
+            synchronous: Render everything now instead of on timer ticks
+        """
+        self.cancel()
+        self._overrun = 0.0
+        self._begin(iter(blocks), draw, on_done)
+        if synchronous:
+            self.finish()
+        else:
+            self.timer.Start(self.interval_ms)
+
+    def enqueue(
+        self,
+        blocks: Iterable[str],
+        draw: Callable[[str], None],
+        on_done: Optional[Callable[[], None]] = None
+    ) -> None:
+        """Render after the renders in progress or queued, without completing them first.
+
+        Args:
+            blocks: Preformatted text blocks, joined with newlines
+            draw: Callback receiving the whole text rendered so far
+            on_done: Callback run once every block has been drawn
+        """
+        if self._blocks is None:
+            self.start(blocks, draw, on_done)
+        else:
+            self._queue.append((iter(blocks), draw, on_done))
+
+    def finish(self) -> None:
+        """Render every remaining block immediately, queued renders included."""
+        while self._blocks is not None:
+            self._render(deadline=None)
+
+    def cancel(self) -> None:
+        """Stop the render in progress and drop the queued ones, keeping what was already drawn."""
+        self.timer.Stop()
+        self._blocks = None
+        self._queue.clear()
+
+    def _begin(
+        self,
+        blocks: Iterator[str],
+        draw: Callable[[str], None],
+        on_done: Optional[Callable[[], None]]
+    ) -> None:
+        self._blocks = blocks
+        self._buffer = io.StringIO()
+        self._draw = draw
+        self._on_done = on_done
+        self._draw_cost = self._undrawn = 0.0
+
+    def _on_tick(self, event: wx.TimerEvent) -> None:
+        if self._blocks is None:
+            return
+        if self._overrun >= self.budget:
+            self._overrun -= self.budget  # Leave this frame to the UI
+            return
+        self._render(deadline=time.perf_counter() + self.budget - self._overrun)
+
+    def _render(self, deadline: Optional[float]) -> None:
+        start: float = time.perf_counter()
+        done: bool = True
+        for block in self._blocks:
+            if self._buffer.tell():
+                self._buffer.write("\n")
+            self._buffer.write(block)
+            if deadline is not None and time.perf_counter() >= deadline:
+                done = False
+                break
+
+        drawn: float = time.perf_counter()
+        self._undrawn += drawn - start
+        if done or self._undrawn >= self._draw_cost:
+            self._draw(self._buffer.getvalue())
+            self._draw_cost = time.perf_counter() - drawn
+            self._undrawn = 0.0
+        if deadline is not None:
+            self._overrun = max(0.0, time.perf_counter() - deadline)
+        if done:
+            on_done = self._on_done
+            self._blocks = None
+            if self._queue:
+                self._begin(*self._queue.popleft())
+            else:
+                self.timer.Stop()
+            if on_done is not None:
+                on_done()
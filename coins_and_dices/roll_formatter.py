@@ -0,0 +1,172 @@
+from functools import lru_cache
+from typing import Sequence, Tuple
+import numpy as np
+from .constants import FORMAT_CHUNK_ROWS, FORMAT_TABLE_SIZE, ROLL_SEPARATOR
+
+@lru_cache(maxsize=8)
+def digit_quads(keep: int) -> np.ndarray:
+    """ASCII digits of 0000..9999, read four bytes at a time.
+
+    Entries 0..9999 hold all four digits. Entries 10000..19999 hold the same
+    digits with their leading zeros set to NUL, except the last `keep` ones,
+    for the most significant group of digits of a value.
+
+    Args:
+        keep: Number of trailing digits kept even when zero
+
+    Returns:
+        Array of 20000 little-endian 4-byte groups
+    """
+    text = [f"{value:04d}" for value in range(10_000)]
+    lead = [digits.lstrip("0").rjust(keep, "0").rjust(4, "\0") for digits in text]
+    return np.frombuffer("".join(text + lead).encode(), dtype=np.uint32)
+
+@lru_cache(maxsize=64)
+def label_tables(labels: Tuple[str, ...], separator: str = ROLL_SEPARATOR) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Lookup tables of labels as they appear last, inside and at the end of a line.
+
+    Args:
+        labels: Label of each code
+        separator: Separator between items of a line
+
+    Returns:
+        Object arrays of the bare labels, labels followed by the separator and labels followed by a newline
+    """
+    return (
+        np.array(labels, dtype=object),
+        np.array([label + separator for label in labels], dtype=object),
+        np.array([label + "\n" for label in labels], dtype=object)
+    )
+
+@lru_cache(maxsize=16)
+def number_tables(size: int, separator: str = ROLL_SEPARATOR) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Lookup tables of the integers 0..size-1, see label_tables."""
+    return label_tables(tuple(str(value) for value in range(size)), separator)
+
+def join_codes(codes: np.ndarray, tables: Tuple[np.ndarray, np.ndarray, np.ndarray], items_per_line: int) -> str:
+    """Join coded items into lines through lookup tables from label_tables."""
+    plain, inside, line_end = tables
+    parts = inside[codes]
+    parts[items_per_line - 1::items_per_line] = line_end[codes[items_per_line - 1::items_per_line]]
+    parts[-1] = plain[codes[-1]]
+    return "".join(parts.tolist())
+
+def format_labels(
+    codes: np.ndarray,
+    labels: Sequence[str],
+    items_per_line: int,
+    separator: str = ROLL_SEPARATOR
+) -> str:
+    """Format coded outcomes (coin bits, custom dice faces) as lines of labels.
+
+    Args:
+        codes: Index of the label of each item
+        labels: Label of each code
+        items_per_line: Number of items per line
+        separator: Separator between items of a line
+
+    Returns:
+        Newline-joined lines of separator-joined labels
+    """
+    if not len(codes):
+        return ""
+    return join_codes(codes, label_tables(tuple(labels), separator), items_per_line)
+
+def format_fixed_point(scaled: np.ndarray, decimals: int, items_per_line: int, separator: str) -> str:
+    """Format integers as text through a byte matrix.
+
+    Every item gets a row of bytes: sign, digits, optional decimal point and
+    the separator or newline after it. Rows are filled FORMAT_CHUNK_ROWS at a
+    time so the intermediate arrays stay in cache. Digits are looked up four
+    at a time in digit_quads, the group that holds the leading digit of a
+    value taking its copy with leading zeros set to NUL; those NULs, unused
+    signs and the last separator are deleted from the bytes in a single
+    translate call.
+
+    Args:
+        scaled: Values multiplied by 10**decimals
+        decimals: Number of digits after the decimal point
+        items_per_line: Number of items per line
+        separator: Separator between items of a line
+
+    Returns:
+        Newline-joined lines of separator-joined values
+    """
+    negative: bool = bool(scaled.min() < 0)
+    largest: int = int(np.abs(scaled).max() if negative else scaled.max())
+    width: int = max(len(str(largest)), decimals + 1)
+    groups: int = -(-width // 4)
+    # Quotients by 10_000 are cheaper in 32 bits
+    dtype = np.uint32 if largest < 1 << 32 else np.uint64
+    tables = [digit_quads(min(max(decimals + 1 - 4 * (groups - 1 - column), 0), 4)) for column in range(groups)]
+
+    suffix = np.frombuffer(separator.encode(), dtype=np.uint8)
+    sign: int = 1 if negative else 0
+    point: int = 1 if decimals else 0
+    whole: int = width - decimals
+    end: int = sign + width + point
+    # A bytearray is translated in place of a copy through tobytes
+    buffer = bytearray(len(scaled) * (end + len(suffix)))
+    rows = np.frombuffer(buffer, dtype=np.uint8).reshape(len(scaled), -1)
+    quads = np.empty((min(FORMAT_CHUNK_ROWS, len(scaled)), groups), dtype=np.uint32)
+    digits = quads.view(np.uint8)[:, 4 * groups - width:]
+    for start in range(0, len(scaled), FORMAT_CHUNK_ROWS):
+        part = scaled[start:start + FORMAT_CHUNK_ROWS]
+        rest = (np.abs(part) if negative else part).astype(dtype)
+        for column in range(groups - 1, 0, -1):
+            higher = rest // 10_000
+            quad = rest - higher * 10_000
+            rest = higher
+            # Nothing above this group: it holds the leading digit
+            np.add(quad, 10_000, out=quad, where=rest == 0)
+            np.take(tables[column], quad, out=quads[:len(part), column])
+        np.take(tables[0], rest + 10_000, out=quads[:len(part), 0])
+
+        block = rows[start:start + FORMAT_CHUNK_ROWS]
+        if negative:
+            block[:, 0] = (part < 0) * ord('-')
+        block[:, sign:sign + whole] = digits[:len(part), :whole]
+        if decimals:
+            block[:, sign + whole] = ord('.')
+            block[:, sign + whole + 1:end] = digits[:len(part), whole:]
+        block[:, end:] = suffix
+    rows[items_per_line - 1::items_per_line, end] = ord('\n')
+    rows[items_per_line - 1::items_per_line, end + 1:] = 0
+    rows[-1, end:] = 0
+    return buffer.translate(None, b'\x00').decode()
+
+def format_numbers(values: np.ndarray, items_per_line: int, separator: str = ROLL_SEPARATOR) -> str:
+    """Format rolls as lines of values, integers as is and floats with two decimals.
+
+    Non-negative integers below FORMAT_TABLE_SIZE are looked up in a cached
+    table of their strings; other integers and floats are converted by
+    format_fixed_point, floats being rounded half to even at two decimals.
+    Integers read exactly as str(x); floats as f"{x:.2f}" except when x * 100
+    lands on a half cent in float arithmetic.
+
+    Args:
+        values: Roll results
+        items_per_line: Number of values per line
+        separator: Separator between values of a line
+
+    Returns:
+        Newline-joined lines of separator-joined values
+    """
+    values = np.asarray(values)
+    if not len(values):
+        return ""
+    if values.dtype.kind in 'iu':
+        low, high = values.min().item(), values.max().item()
+        if low >= 0 and high < FORMAT_TABLE_SIZE:
+            size: int = max(1 << int(high).bit_length(), 256)
+            return join_codes(values, number_tables(size, separator), items_per_line)
+        return format_fixed_point(values.astype(np.int64), 0, items_per_line, separator)
+    scaled = np.rint(values.astype(np.float64) * 100)
+    if not np.isfinite(scaled).all() or np.abs(scaled).max() >= 2 ** 62:
+        # Out of fixed-point range: format value by value
+        lines = values.tolist()
+        return "\n".join(
+            separator.join(f"{value:.2f}" for value in lines[start:start + items_per_line])
+            for start in range(0, len(lines), items_per_line)
+        )
+    return format_fixed_point(scaled.astype(np.int64), 2, items_per_line, separator)
@@ -1,15 +1,29 @@
-import time
 from typing import List, Tuple, Optional, Union, Dict, Literal
 from .game_history import GameHistory
+import time
+import queue
 import wx
 import wx.grid
+import numpy as np
 import torch
-import re
-import statistics
 from enum import Enum
+from .dice_engine import DiceEngine
+from .dice_expression import DicePlan, compile_dice_expression, roll_plans
+from .dice_distribution import plan_distribution, plan_moments
+from .dice_statistics import RollStatistics, roll_statistics
+from .dice_trials import DiceTrialsEngine, TrialTotals
+from .dice_worker import DiceStreamCollector
+from .coin_worker import CoinFlipWorker
+from .dice_results_table import DiceResultsTable
+from .plot_panel import PlotPanel
+from .progressive_renderer import ProgressiveRenderer, iter_line_blocks
+from .roll_formatter import format_numbers
 from .constants import (
-    STANDARD_DICE_FRAME_SIZE, MAX_DICE, MAX_SIDES,
-    MAX_ROLLS_PER_LINE, GRID_COLUMNS, DICE_BATCH_SIZE
+    STANDARD_DICE_FRAME_SIZE, MAX_ROLLS_PER_LINE, DICE_GRID_COLUMNS, DICE_STREAM_MAX_DICE,
+    DICE_TRIALS_MAX, DICE_TRIALS_PLOT_BARS, DICE_TRIALS_SUMMARY_LINES,
+    DICE_RENDER_INTERVAL_MS, DICE_RENDER_TICK_BUDGET, RENDER_SYNC_LIMIT,
+    DICE_GRID_COLUMN_WIDTHS, DICE_GRID_ROW_HEIGHT, COIN_WORKER_QUEUE_SIZE, COIN_WORKER_JOIN_TIMEOUT,
+    COIN_WORKER_JOIN_POLL, COIN_DRAIN_INTERVAL_MS, COIN_DRAIN_BUDGET, COIN_PROGRESS_RANGE
 )
 
 class ViewMode(Enum):
@@ -25,9 +39,27 @@ class StandardDiceFrame(wx.Frame):
     Attributes:
         panel (wx.Panel): Main panel containing UI elements
         dice_input (wx.TextCtrl): Input control for dice notation
+        trials_input (wx.SpinCtrl): Number of trials; above 1, each notation is rolled as repeated trials
+        plot_panel (PlotPanel): Histogram of the trial totals of the last notation
         grid (wx.grid.Grid): Grid displaying results and statistics
+        results_table (DiceResultsTable): Virtual table behind the grid, formatting visible rows on demand
         device (torch.device): GPU device if available, otherwise CPU
+        engine (DiceEngine): Exact dice roll generator
+        current_rolls (np.ndarray): Rolls of the last notation, in a compact dtype
+        current_statistics (Optional[RollStatistics]): Statistics of the last notation when its rolls were not kept
+        current_trials (Optional[TrialTotals]): Trial totals of the last notation in trials mode
         view_mode (wx.Choice): Control for selecting result display mode
+        rolls_renderer (ProgressiveRenderer): Frame-rate limited renderer of Full mode rolls
+        roll_btn (wx.Button): Starts a roll, disabled while statistics are streamed
+        cancel_btn (wx.Button): Stops the streamed statistics run
+        progress_gauge (wx.Gauge): Progress of the streamed statistics run
+        drain_timer (wx.Timer): Timer draining the worker queue on the UI thread
+        result_queue (queue.Queue): Bounded queue of worker messages
+        worker_thread (Optional[CoinFlipWorker]): Worker streaming the statistics, None when idle
+        collector (Optional[DiceStreamCollector]): Collector of the streamed run in progress
+        worker_result (Optional[List[Tuple[Union[int, float], RollStatistics]]]): Results posted before the worker finishes
+        worker_error (Optional[Exception]): Error posted before the worker finishes
+        stream_rows (List[Tuple[int, str, DicePlan]]): Grid row, notation and plan of each streamed expression
         LARGE_RESULT_THRESHOLD (int): Threshold for switching to summary mode
     """
     
@@ -40,12 +72,28 @@ class StandardDiceFrame(wx.Frame):
             size=STANDARD_DICE_FRAME_SIZE
         )
         self.device: torch.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        self.engine: DiceEngine = DiceEngine(self.device)
         self.panel: wx.Panel
         self.dice_input: wx.TextCtrl
+        self.trials_input: wx.SpinCtrl
+        self.plot_panel: PlotPanel
         self.grid: wx.grid.Grid
+        self.results_table: DiceResultsTable
         self.view_mode: wx.Choice
-        self.current_rolls: List[Union[int, float]] = []
+        self.current_rolls: np.ndarray = np.empty(0, dtype=np.uint8)
+        self.current_statistics: Optional[RollStatistics] = None
+        self.current_trials: Optional[TrialTotals] = None
+        self.result_queue: queue.Queue = queue.Queue(maxsize=COIN_WORKER_QUEUE_SIZE)
+        self.worker_thread: Optional[CoinFlipWorker] = None
+        self.collector: Optional[DiceStreamCollector] = None
+        self.worker_result: Optional[List[Tuple[Union[int, float], RollStatistics]]] = None
+        self.worker_error: Optional[Exception] = None
+        self.stream_rows: List[Tuple[int, str, DicePlan]] = []
         self.init_ui()
+        self.rolls_renderer = ProgressiveRenderer(self, DICE_RENDER_INTERVAL_MS, DICE_RENDER_TICK_BUDGET)
+        self.drain_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_drain_timer, self.drain_timer)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
 
     def init_ui(self) -> None:
         """Initialize and setup all UI components including view mode selector."""
@@ -56,10 +104,21 @@ class StandardDiceFrame(wx.Frame):
         input_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self.dice_input = wx.TextCtrl(self.panel, size=(300, -1))
         input_sizer.Add(
-            wx.StaticText(self.panel, label="Notation (ex: 2d6, 3d1e6):"),
+            wx.StaticText(self.panel, label="Notation (ex: 2d6, 3d1e6, 4d6kh3, 2d8+1d4+2):"),
             0, wx.ALL|wx.CENTER, 5
         )
         input_sizer.Add(self.dice_input, 1, wx.ALL, 5)
+        self.trials_input = wx.SpinCtrl(
+            self.panel,
+            min=1,
+            max=DICE_TRIALS_MAX,
+            initial=1
+        )
+        input_sizer.Add(
+            wx.StaticText(self.panel, label="Répétitions:"),
+            0, wx.ALL|wx.CENTER, 5
+        )
+        input_sizer.Add(self.trials_input, 0, wx.ALL, 5)
         main_sizer.Add(input_sizer, 0, wx.EXPAND|wx.ALL, 5)
         
         # View mode selector
@@ -77,14 +136,29 @@ class StandardDiceFrame(wx.Frame):
         view_sizer.Add(self.view_mode, 0, wx.ALL, 5)
         main_sizer.Add(view_sizer, 0, wx.EXPAND|wx.ALL, 5)
         
-        # Roll button
-        roll_btn = wx.Button(self.panel, label="Lancer les dés")
-        roll_btn.Bind(wx.EVT_BUTTON, self.on_roll_dice)
-        main_sizer.Add(roll_btn, 0, wx.ALL|wx.CENTER, 5)
+        # Roll and cancel buttons
+        button_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.roll_btn = wx.Button(self.panel, label="Lancer les dés")
+        self.roll_btn.Bind(wx.EVT_BUTTON, self.on_roll_dice)
+        self.cancel_btn = wx.Button(self.panel, label="Annuler")
+        self.cancel_btn.Bind(wx.EVT_BUTTON, self.on_cancel)
+        self.cancel_btn.Disable()
+        button_sizer.Add(self.roll_btn, 0, wx.ALL, 5)
+        button_sizer.Add(self.cancel_btn, 0, wx.ALL, 5)
+        main_sizer.Add(button_sizer, 0, wx.CENTER)
+        
+        # Progress of streamed statistics
+        self.progress_gauge = wx.Gauge(self.panel, range=COIN_PROGRESS_RANGE)
+        main_sizer.Add(self.progress_gauge, 0, wx.EXPAND|wx.ALL, 5)
         
         self.setup_grid()
         main_sizer.Add(self.grid, 1, wx.EXPAND|wx.ALL, 5)
         
+        # Histogram of trial totals
+        self.plot_panel = PlotPanel(self.panel)
+        self.plot_panel.Hide()
+        main_sizer.Add(self.plot_panel, 0, wx.EXPAND|wx.ALL, 5)
+        
         # Export button for large results
         export_btn = wx.Button(self.panel, label="Exporter les résultats")
         export_btn.Bind(wx.EVT_BUTTON, self.on_export_results)
@@ -94,23 +168,44 @@ class StandardDiceFrame(wx.Frame):
         self.Center()
         self.Show()
 
-    def generate_statistical_summary(self, rolls: List[Union[int, float]]) -> str:
+    def generate_statistical_summary(
+        self,
+        rolls: Union[np.ndarray, List[Union[int, float]], RollStatistics]
+    ) -> str:
         """Generate a comprehensive statistical summary of roll results.
         
+        Statistics come from a histogram of the rolls built on the device, or
+        from partial selection when the values are too spread out, so the
+        rolls are never sorted.
+        
         Args:
-            rolls: List of dice roll results
+            rolls: Dice roll results, or statistics already accumulated while rolling
             
         Returns:
             Formatted string containing statistical summary
         """
-        return (
-            f"Total Rolls: {len(rolls):,}\n"
-            f"Average: {statistics.mean(rolls):.2f}\n"
-            f"Median: {statistics.median(rolls):.2f}\n"
-            f"Std Dev: {statistics.stdev(rolls):.2f}\n"
-            f"Min: {min(rolls):.2f}\n"
-            f"Max: {max(rolls):.2f}"
-        )
+        stats = rolls if isinstance(rolls, RollStatistics) else roll_statistics(rolls, self.device)
+        median: str = f"{stats.median:.2f}" if stats.median is not None else "n/a"
+        lines: List[str] = [
+            f"Total Rolls: {stats.count:,}",
+            f"Average: {stats.mean:.2f}",
+            f"Median: {median}",
+            f"Std Dev: {stats.std:.2f}",
+            f"Min: {stats.minimum:.2f}",
+            f"Max: {stats.maximum:.2f}"
+        ]
+        if stats.mode is not None:
+            lines.append(f"Mode: {self.format_value(stats.mode)} ({stats.mode_count:,} rolls)")
+        if stats.quantiles:
+            lines.append("Quantiles: " + " | ".join(
+                f"p{q * 100:g} {self.format_value(value)}" for q, value in stats.quantiles.items()
+            ))
+        return "\n".join(lines)
+
+    @staticmethod
+    def format_value(value: float) -> str:
+        """Format a roll value, without decimals when it is whole."""
+        return f"{value:,.0f}" if float(value).is_integer() else f"{value:,.2f}"
 
     def summarize_large_results(
         self,
@@ -136,35 +231,36 @@ class StandardDiceFrame(wx.Frame):
             )
         return self.format_rolls_display(rolls)
 
-    import time
-
     def display_results_progressively(
         self,
-        rolls: List[Union[int, float]],
+        rolls: Union[np.ndarray, List[Union[int, float]]],
         row: int,
-        batch_size: int = 10000,
         virtual_threshold: int = 1_000_000
     ) -> None:
         """Display roll results progressively with virtual mode for large datasets.
     
         Implements an efficient display strategy:
         - For datasets > virtual_threshold: Shows summary with first/last sections
-        - For smaller datasets: Uses batched progressive loading with throttling
+        - For up to RENDER_SYNC_LIMIT rolls: Formats the cell when it is painted
+        - Otherwise: Formats blocks of lines on rolls_renderer timer ticks and
+          redraws the cell at spaced-out frames; no block is skipped
+    
+        Rows rendered on ticks are queued behind the row the renderer is
+        filling, so starting one never blocks on another.
     
         Args:
-            rolls: List of dice roll results to display
+            rolls: Dice roll results to display
             row: Grid row index to update
-            batch_size: Number of results to process per batch for regular display
             virtual_threshold: Size threshold to switch to virtual display mode
         """
         def create_virtual_display(
-            data: List[Union[int, float]], 
+            data: np.ndarray, 
             sample_size: int = 1000
         ) -> str:
             """Create a summarized view for very large datasets.
 
             Args:
-                data: Complete list of roll results
+                data: Complete array of roll results
                 sample_size: Number of entries to show at start and end
         
             Returns:
@@ -179,51 +275,26 @@ class StandardDiceFrame(wx.Frame):
                 f"{self.format_rolls_display(data[-sample_size:])}"
             )    
         
-        def update_cell(
-            batch: List[Union[int, float]], 
-            is_first: bool = False
-        ) -> None:
-            """Update grid cell with new batch of results.
+        def format_lines(start: int, stop: int, items_per_line: int) -> str:
+            return format_numbers(rolls[start:stop], items_per_line)
         
-            Args:
-                batch: List of results to append to display
-                is_first: Flag indicating if this is the first batch
-            """
-            if is_first:
-                new_value: str = self.format_rolls_display(batch)
-            else:
-                current_value: str = self.grid.GetCellValue(row, GRID_COLUMNS['DETAILS'])
-                new_value: str = (current_value + "\n" + self.format_rolls_display(batch)).strip()
-            self.grid.SetCellValue(row, GRID_COLUMNS['DETAILS'], new_value)
+        def draw(text: str) -> None:
+            self.grid.SetCellValue(row, DICE_GRID_COLUMNS['DETAILS'], text)
+        
+        rolls = np.asarray(rolls)
     
         # Use virtual mode for large datasets
         if len(rolls) > virtual_threshold:
-            virtual_display: str = create_virtual_display(rolls)
-            wx.CallAfter(
-                self.grid.SetCellValue,
-                row,
-                GRID_COLUMNS['DETAILS'],
-                virtual_display
-            )
+            self.results_table.set_cell(row, DICE_GRID_COLUMNS['DETAILS'], lambda: create_virtual_display(rolls))
+            return
+        if len(rolls) <= RENDER_SYNC_LIMIT:
+            self.results_table.set_cell(row, DICE_GRID_COLUMNS['DETAILS'], lambda: self.format_rolls_display(rolls))
             return
     
-        # Progressive display for smaller datasets
-        update_interval: float = 0.1  # seconds
-        last_update: float = time.time()
-    
-        # Initialize with first batch
-        first_batch: List[Union[int, float]] = rolls[:batch_size]
-        wx.CallAfter(update_cell, first_batch, True)
-        wx.Yield()
-    
-        # Process remaining batches
-        for i in range(batch_size, len(rolls), batch_size):
-            current_time: float = time.time()
-            if current_time - last_update >= update_interval:
-                batch: List[Union[int, float]] = rolls[i:i + batch_size]
-                wx.CallAfter(update_cell, batch)
-                wx.Yield()
-                last_update = current_time    
+        self.rolls_renderer.enqueue(
+            iter_line_blocks(format_lines, len(rolls), MAX_ROLLS_PER_LINE),
+            draw
+        )
     
     def update_display(
         self,
@@ -245,11 +316,11 @@ class StandardDiceFrame(wx.Frame):
     
         # Use if/elif instead of enum conversion to prevent recursion
         if selected_mode == "Statistics":
-            self.grid.SetCellValue(row, GRID_COLUMNS['DETAILS'],
-                             self.generate_statistical_summary(rolls))
+            self.results_table.set_cell(row, DICE_GRID_COLUMNS['DETAILS'],
+                                        lambda: self.generate_statistical_summary(rolls))
         elif selected_mode == "Sample":
-            self.grid.SetCellValue(row, GRID_COLUMNS['DETAILS'],
-                             self.summarize_large_results(rolls))
+            self.results_table.set_cell(row, DICE_GRID_COLUMNS['DETAILS'],
+                                        lambda: self.summarize_large_results(rolls))
         else:  # "Full" mode
             self.display_results_progressively(rolls, row)
 
@@ -259,8 +330,32 @@ class StandardDiceFrame(wx.Frame):
         Args:
             event: The view mode change event
         """
-        if self.current_rolls:
+        self.rolls_renderer.cancel()
+        if len(self.current_rolls):
             self.update_display(self.current_rolls, self.grid.GetNumberRows() - 1)
+        elif self.current_statistics is not None:
+            self.grid.SetCellValue(
+                self.grid.GetNumberRows() - 1,
+                DICE_GRID_COLUMNS['DETAILS'],
+                self.generate_statistical_summary(self.current_statistics) +
+                "\nIndividual rolls not kept (statistics-only run)"
+            )
+
+    def on_close(self, event: wx.CloseEvent) -> None:
+        """Stop the render and the streamed run in progress before the frame closes.
+        
+        Args:
+            event: The close event
+        """
+        self.rolls_renderer.cancel()
+        self.stop_worker()
+        event.Skip()
+
+    def Destroy(self) -> bool:
+        """Stop the render and the streamed run in progress, then destroy the frame."""
+        self.rolls_renderer.cancel()
+        self.stop_worker()
+        return super().Destroy()
 
     def on_export_results(self, event: wx.CommandEvent) -> None:
         """Handle export button click for saving full results.
@@ -268,7 +363,7 @@ class StandardDiceFrame(wx.Frame):
         Args:
             event: The button click event
         """
-        if not self.current_rolls:
+        if not len(self.current_rolls):
             return
             
         with wx.FileDialog(
@@ -288,16 +383,23 @@ class StandardDiceFrame(wx.Frame):
                 wx.LogError(f"Cannot save results to file '{pathname}'.")
                 
     def setup_grid(self) -> None:
-        """Setup and configure the results grid with appropriate columns."""
+        """Setup the results grid over a virtual table, with fixed column widths and row height.
+        
+        Nothing is measured from the cell texts, so laying out thousands of
+        result rows does not format them.
+        """
+        self.results_table = DiceResultsTable()
         self.grid = wx.grid.Grid(self.panel)
-        self.grid.CreateGrid(0, len(GRID_COLUMNS))
+        self.grid.SetTable(self.results_table, True)
+        self.grid.SetDefaultRowSize(DICE_GRID_ROW_HEIGHT, True)
         
         column_labels: Dict[int, str] = {
-            GRID_COLUMNS['NOTATION']: "Notation",
-            GRID_COLUMNS['DETAILS']: "Détails des lancers",
-            GRID_COLUMNS['TOTAL']: "Total",
-            GRID_COLUMNS['AVERAGE']: "Moyenne",
-            GRID_COLUMNS['MINMAX']: "Min/Max"
+            DICE_GRID_COLUMNS['NOTATION']: "Notation",
+            DICE_GRID_COLUMNS['DETAILS']: "Détails des lancers",
+            DICE_GRID_COLUMNS['TOTAL']: "Total",
+            DICE_GRID_COLUMNS['AVERAGE']: "Moyenne",
+            DICE_GRID_COLUMNS['MINMAX']: "Min/Max",
+            DICE_GRID_COLUMNS['EXPECTED']: "Espérance"
         }
         
         for col, label in column_labels.items():
@@ -305,128 +407,440 @@ class StandardDiceFrame(wx.Frame):
             attr = wx.grid.GridCellAttr()
             attr.SetReadOnly(True)
             self.grid.SetColAttr(col, attr)
-        
-        self.grid.AutoSizeColumns()
+        for name, width in DICE_GRID_COLUMN_WIDTHS.items():
+            self.grid.SetColSize(DICE_GRID_COLUMNS[name], width)
 
-    def roll_dice_gpu(self, number: int, sides: Union[int, float]) -> List[Union[int, float]]:
-        """Generate random dice rolls using GPU acceleration with batch processing."""
-        results = []
-        remaining = number
-    
-        while remaining > 0:
-            batch_size = min(DICE_BATCH_SIZE, remaining)
-            random_tensor = torch.rand(batch_size, device=self.device)
-            scaled_tensor = (random_tensor * sides).floor() + 1
-            results.extend(scaled_tensor.cpu().tolist())
-            remaining -= batch_size
+    def roll_dice_gpu(self, number: int, sides: Union[int, float]) -> np.ndarray:
+        """Generate random dice rolls using GPU acceleration with batch processing.
+        
+        Whole side counts are sampled as exact integers and kept in the
+        smallest dtype holding the faces; fractional side counts give float64.
+        
+        Args:
+            number: Number of dice
+            sides: Number of sides
             
-        return results
+        Returns:
+            Array of roll results
+        """
+        return self.engine.roll(number, sides)
 
-    def format_rolls_display(self, rolls: List[Union[int, float]]) -> str:
+    def format_rolls_display(self, rolls: Union[np.ndarray, List[Union[int, float]]]) -> str:
         """Format the roll results for display with line breaks.
         
         Args:
-            rolls: List of dice roll results
+            rolls: Dice roll results
+            
+        Returns:
+            Formatted string representation of rolls, two decimals for fractional dice
+        """
+        return format_numbers(np.asarray(rolls), MAX_ROLLS_PER_LINE)
+
+    def format_expectation(self, plan: DicePlan, total: Optional[Union[int, float]] = None) -> str:
+        """Format the exact expectation of an expression next to a rolled total.
+        
+        Args:
+            plan: Compiled dice expression
+            total: Rolled total, None to give the expectation alone
             
         Returns:
-            Formatted string representation of rolls
+            Exact mean ± standard deviation and the probability of rolling at least the total
         """
-        formatted_lines: List[str] = []
-        for i in range(0, len(rolls), MAX_ROLLS_PER_LINE):
-            chunk = rolls[i:i + MAX_ROLLS_PER_LINE]
-            if isinstance(chunk[0], float):
-                line = " → ".join(f"{x:.2f}" for x in chunk)
-            else:
-                line = " → ".join(str(x) for x in chunk)
-            formatted_lines.append(line)
-        return "\n".join(formatted_lines)
+        distribution = plan_distribution(plan)
+        if distribution is not None:
+            expectation: str = f"Expected: {distribution.mean:,.2f} ± {distribution.std:,.2f}"
+            if total is None:
+                return expectation
+            return f"{expectation}\nP(≥ {total:,}): {distribution.probability(total, '>='):.2%}"
+        moments = plan_moments(plan)
+        if moments is None:
+            return "No exact distribution"
+        mean, variance = moments
+        return f"Expected: {mean:,.2f} ± {variance ** 0.5:,.2f}"
 
     def validate_dice_notation(self, notation: str) -> bool:
         """Validate the dice notation format and constraints.
         
         Args:
-            notation: Dice notation string (e.g., "2d6" or "3d1e6")
+            notation: Dice expression (e.g., "2d6", "3d1e6" or "4d6kh3")
             
         Returns:
             True if valid, False otherwise
         """
-        if not notation.strip():
-            return False
-            
-        match = re.match(r'^(\d+)d((?:\d+(?:\.\d*)?)|(?:\d*\.\d+)|(?:\d+e\d+))$', notation.lower())
-        if not match:
+        try:
+            compile_dice_expression(notation)
+        except ValueError:
             return False
-            
-        num_dice: int = int(match.group(1))
-        sides: float = float(match.group(2))
-        
-        return 0 < num_dice <= MAX_DICE and sides > 0
+        return True
 
     def parse_dice_notation(self, notation: str) -> Optional[Tuple[int, float]]:
-        """Parse the dice notation into number of dice and sides.
+        """Parse a plain NdX notation into number of dice and sides.
         
         Args:
             notation: Dice notation string (e.g., "2d6" or "3d1e6")
             
         Returns:
-            Tuple of (number of dice, number of sides) or None if invalid
+            Tuple of (number of dice, number of sides) or None if not a valid plain notation
+        """
+        try:
+            simple = compile_dice_expression(notation).simple
+        except ValueError:
+            return None
+        return (simple[0], float(simple[1])) if simple is not None else None
+
+    def start_worker(self, stream_rows: List[Tuple[int, str, DicePlan]]) -> None:
+        """Stream the statistics of expressions on a background worker.
+        
+        Each batch is rolled and folded into running statistics on the
+        worker thread, which checks for cancellation between batches; the
+        drain timer fills the rows as the expressions finish.
+        
+        Args:
+            stream_rows: Grid row, notation and plan of each expression
+        """
+        self.stream_rows = stream_rows
+        self.result_queue = queue.Queue(maxsize=COIN_WORKER_QUEUE_SIZE)
+        self.collector = DiceStreamCollector([plan for _, _, plan in stream_rows])
+        self.worker_result = None
+        self.worker_error = None
+        self.worker_thread = CoinFlipWorker(self.engine, self.collector, self.result_queue, self.engine.batch_size)
+        self.roll_btn.Disable()
+        self.cancel_btn.Enable()
+        self.progress_gauge.SetValue(0)
+        for row, _, _ in stream_rows:
+            self.grid.SetCellValue(row, DICE_GRID_COLUMNS['DETAILS'], "Running...")
+        self.worker_thread.start()
+        self.drain_timer.Start(COIN_DRAIN_INTERVAL_MS)
+
+    def on_drain_timer(self, event: wx.TimerEvent) -> None:
+        """Drain worker messages within a time budget and fill the finished rows.
+        
+        Args:
+            event: The timer event
+        """
+        if self.collector is None:
+            return
+        deadline: float = time.perf_counter() + COIN_DRAIN_BUDGET
+        finished: Optional[bool] = None
+        summary: Optional[Tuple[int, List[Tuple[Union[int, float], RollStatistics]]]] = None
+        
+        try:
+            while time.perf_counter() < deadline:
+                kind, payload = self.result_queue.get_nowait()
+                if kind == 'progress':
+                    summary = payload
+                elif kind == 'result':
+                    self.worker_result = payload
+                elif kind == 'error':
+                    self.worker_error = payload
+                elif kind == 'done':
+                    finished = payload
+                    break
+        except queue.Empty:
+            pass
+        
+        if finished is None:
+            if summary is not None:
+                self.show_stream_progress(*summary)
+            return
+        
+        # The run is torn down before any dialog, whose modal loop would run this timer again
+        self.drain_timer.Stop()
+        results = self.worker_result if self.worker_result is not None else self.collector.results
+        error, self.worker_error = self.worker_error, None
+        self.collector = None
+        self.worker_thread = None
+        self.worker_result = None
+        self.roll_btn.Enable()
+        self.cancel_btn.Disable()
+        if error is None and not finished:
+            self.progress_gauge.SetValue(COIN_PROGRESS_RANGE)
+        self.show_stream_results(results)
+        for row, _, _ in self.stream_rows[len(results):]:
+            self.grid.SetCellValue(
+                row, DICE_GRID_COLUMNS['DETAILS'], "Cancelled" if error is None else "Error"
+            )
+        if error is not None:
+            wx.MessageDialog(self, f"Erreur: {str(error)}", "Erreur").ShowModal()
+
+    def show_stream_progress(
+        self,
+        dice_done: int,
+        results: List[Tuple[Union[int, float], RollStatistics]]
+    ) -> None:
+        """Show the progress posted by the background worker.
+        
+        Args:
+            dice_done: Number of dice rolled so far
+            results: Total and statistics of each finished expression
+        """
+        self.show_stream_results(results)
+        self.progress_gauge.SetValue(int(dice_done / self.collector.dice_count * COIN_PROGRESS_RANGE))
+        if len(results) < len(self.stream_rows):
+            self.grid.SetCellValue(
+                self.stream_rows[len(results)][0], DICE_GRID_COLUMNS['DETAILS'],
+                f"Running... {dice_done:,} / {self.collector.dice_count:,} dice"
+            )
+
+    def show_stream_results(self, results: List[Tuple[Union[int, float], RollStatistics]]) -> None:
+        """Fill the rows of the streamed expressions finished so far.
+        
+        Args:
+            results: Total and statistics of each finished expression, in row order
+        """
+        last_row: int = self.grid.GetNumberRows() - 1
+        for (row, notation, plan), (total, stats) in zip(self.stream_rows, results):
+            if row == last_row:
+                self.current_rolls = np.empty(0, dtype=np.uint8)
+                self.current_statistics = stats
+            self.results_table.set_cell(
+                row, DICE_GRID_COLUMNS['DETAILS'], lambda stats=stats: self.generate_statistical_summary(stats)
+            )
+            self.update_result_columns(row, notation, plan, total, stats.mean, stats.minimum, stats.maximum)
+
+    def on_cancel(self, event: wx.CommandEvent) -> None:
+        """Handle the cancel button by stopping the streamed run after its current batch.
+        
+        Args:
+            event: The button click event
+        """
+        if self.worker_thread is not None and self.worker_thread.is_alive():
+            self.worker_thread.cancel()
+
+    def stop_worker(self) -> None:
+        """Stop the background worker and its timer, waiting for the thread to exit.
+        
+        The queue is emptied while waiting, so a worker blocked on the full
+        queue can post its last message and return.
+        """
+        if hasattr(self, 'drain_timer'):
+            self.drain_timer.Stop()
+        if self.worker_thread is not None:
+            self.worker_thread.cancel()
+            deadline: float = time.perf_counter() + COIN_WORKER_JOIN_TIMEOUT
+            while self.worker_thread.is_alive() and time.perf_counter() < deadline:
+                try:
+                    while True:
+                        self.result_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self.worker_thread.join(timeout=COIN_WORKER_JOIN_POLL)
+            self.worker_thread = None
+        self.collector = None
+
+    def run_dice_trials(self, plan: DicePlan, trials: int) -> TrialTotals:
+        """Roll an expression as repeated trials and count the totals.
+        
+        Args:
+            plan: Compiled dice expression
+            trials: Number of trials
+            
+        Returns:
+            Histogram of the total of each trial
+        """
+        return DiceTrialsEngine(self.device).run(plan, trials)
+
+    def generate_trials_summary(self, results: TrialTotals) -> str:
+        """Format a trials run against the exact distribution of the total.
+        
+        Args:
+            results: Histogram of the total of each trial
+            
+        Returns:
+            Formatted string with moments and the most frequent totals
+        """
+        lines: List[str] = [f"Trials: {results.trials:,} × {results.notation}"]
+        expected = results.expected
+        if expected is None:
+            lines.extend([
+                f"Mean total: {results.mean:,.4f}",
+                f"Std Dev: {results.variance ** 0.5:,.4f}",
+                "Totals: observed"
+            ])
+            shown = np.sort(np.argsort(results.histogram)[-DICE_TRIALS_SUMMARY_LINES:])
+            lines.extend(
+                f"  {results.offset + index:,}: {int(results.histogram[index]):,}" for index in shown.tolist()
+            )
+            return "\n".join(lines)
+        lines.extend([
+            f"Mean total: {results.mean:,.4f} (expected {results.distribution.mean:,.4f})",
+            f"Std Dev: {results.variance ** 0.5:,.4f} (expected {results.distribution.std:,.4f})",
+            "Totals: observed / expected"
+        ])
+        shown = np.sort(np.argsort(expected)[-DICE_TRIALS_SUMMARY_LINES:])
+        lines.extend(
+            f"  {results.offset + index:,}: {int(results.histogram[index]):,} / {expected[index]:,.1f}"
+            for index in shown.tolist()
+        )
+        return "\n".join(lines)
+
+    def update_trial_columns(self, row: int, plan: DicePlan, results: TrialTotals) -> None:
+        """Fill the result columns of a trials run.
+        
+        Args:
+            row: Grid row of the notation
+            plan: Compiled dice expression
+            results: Histogram of the total of each trial
         """
-        match = re.match(r'^(\d+)d((?:\d+(?:\.\d*)?)|(?:\d*\.\d+)|(?:\d+e\d+))$', notation.lower())
-        if match:
-            return int(match.group(1)), float(match.group(2))
-        return None
+        self.grid.SetCellValue(row, DICE_GRID_COLUMNS['NOTATION'], f"{results.notation} × {results.trials:,}")
+        self.results_table.set_cell(row, DICE_GRID_COLUMNS['DETAILS'], lambda: self.generate_trials_summary(results))
+        self.grid.SetCellValue(row, DICE_GRID_COLUMNS['TOTAL'], f"{results.sum:,}")
+        self.grid.SetCellValue(row, DICE_GRID_COLUMNS['AVERAGE'], f"Moyenne/essai: {results.mean:,.3f}")
+        self.grid.SetCellValue(
+            row, DICE_GRID_COLUMNS['MINMAX'], f"Min: {results.minimum:,}\nMax: {results.maximum:,}"
+        )
+        self.results_table.set_cell(row, DICE_GRID_COLUMNS['EXPECTED'], lambda: self.format_expectation(plan))
+
+    def show_plot(self, results: Optional[TrialTotals]) -> None:
+        """Plot the histogram of trial totals over the exact distribution, or hide the plot.
+        
+        Only the range of totals actually rolled is drawn; ranges wider than
+        DICE_TRIALS_PLOT_BARS are merged into equal-width bins.
+        
+        Args:
+            results: Trials to plot, or None to hide the plot
+        """
+        if results is not None:
+            first, last = results.minimum - results.offset, results.maximum - results.offset + 1
+            width: int = -(-(last - first) // DICE_TRIALS_PLOT_BARS)
+            padding: int = -(last - first) % width
+            
+            def merge(values: np.ndarray) -> np.ndarray:
+                return np.pad(values[first:last], (0, padding)).reshape(-1, width).sum(axis=1)
+            
+            expected = results.expected
+            binned: str = f", bins of {width:,}" if width > 1 else ""
+            self.plot_panel.set_histogram(
+                results.totals[first:last:width],
+                merge(results.histogram),
+                overlay=None if expected is None else merge(expected),
+                title=(
+                    f"Total per trial, {results.trials:,} trials of {results.notation}{binned} "
+                    f"(red: exact distribution)"
+                )
+            )
+        if self.plot_panel.IsShown() != (results is not None):
+            self.plot_panel.Show(results is not None)
+            self.panel.Layout()
 
     def on_roll_dice(self, event: wx.CommandEvent) -> None:
         """Handle the dice roll button click event with enhanced display handling.
         
+        With more than one repetition, every notation is rolled as repeated
+        trials and the histogram of its totals is plotted. Otherwise plain
+        notations are rolled together in fused draws. In Statistics
+        mode, expressions without keep or exploding terms and with more dice
+        than one engine batch are streamed on a background worker: up to
+        DICE_STREAM_MAX_DICE dice per term are rolled, only their running
+        statistics are kept and the run can be cancelled. Result rows are
+        filled lazily; see roll_notations.
+        
         Args:
             event: The button click event
         """
         try:
             dice_notations: List[str] = self.dice_input.GetValue().split()
             
-            self.grid.ClearGrid()
-            if self.grid.GetNumberRows() > 0:
-                self.grid.DeleteRows(0, self.grid.GetNumberRows())
-            self.grid.AppendRows(len(dice_notations))
-            
-            for i, notation in enumerate(dice_notations):
-                if not self.validate_dice_notation(notation):
-                    raise ValueError(f"Invalid dice notation: {notation}")
-                
-                parsed = self.parse_dice_notation(notation)
-                if parsed:
-                    num_dice, sides = parsed
-                    rolls = self.roll_dice_gpu(num_dice, sides)
-                    self.current_rolls = rolls
-                    
-                    total = sum(rolls)
-                    average = total / len(rolls)
-                    
-                    metadata = {
-                        'notation': notation,
-                        'num_dice': num_dice,
-                        'sides': sides,
-                        'total': total,
-                        'device': str(self.device)
-                    }
-                    
-                    self.grid.SetCellValue(i, GRID_COLUMNS['NOTATION'], notation)
-                    self.update_display(rolls, i)
-                    self.grid.SetCellValue(i, GRID_COLUMNS['TOTAL'], f"{total:.2f}")
-                    self.grid.SetCellValue(i, GRID_COLUMNS['AVERAGE'], f"{average:.2f}")
-                    self.grid.SetCellValue(
-                        i,
-                        GRID_COLUMNS['MINMAX'],
-                        f"Min: {min(rolls):.2f} | Max: {max(rolls):.2f}"
-                    )
-            
-            self.grid.AutoSizeRows()
-            self.grid.AutoSizeColumns()
+            self.rolls_renderer.cancel()
+            self.grid.BeginBatch()
+            try:
+                self.roll_notations(dice_notations)
+            finally:
+                self.grid.EndBatch()
             
         except Exception as e:
             wx.MessageDialog(self, f"Erreur: {str(e)}", "Erreur").ShowModal()
 
+    def roll_notations(self, dice_notations: List[str]) -> None:
+        """Roll every notation into its own row of the results table.
+        
+        Rows keep the compact results; their cells are formatted when painted.
+        Streamed rows are filled by the drain timer once their expression is
+        finished.
+        
+        Args:
+            dice_notations: Dice notations, one per row
+        """
+        self.grid.ClearGrid()
+        if self.grid.GetNumberRows() > 0:
+            self.grid.DeleteRows(0, self.grid.GetNumberRows())
+        self.grid.AppendRows(len(dice_notations))
+        
+        trials: int = self.trials_input.GetValue()
+        self.current_trials = None
+        if trials > 1:
+            for i, notation in enumerate(dice_notations):
+                plan = compile_dice_expression(notation)
+                self.current_trials = self.run_dice_trials(plan, trials)
+                self.update_trial_columns(i, plan, self.current_trials)
+            self.current_rolls = np.empty(0, dtype=np.uint8)
+            self.current_statistics = None
+            self.show_plot(self.current_trials)
+            return
+        self.show_plot(None)
+            
+        statistics_only: bool = (
+            self.view_mode.GetString(self.view_mode.GetSelection()) == ViewMode.STATISTICS.value
+        )
+        plans: List[DicePlan] = []
+        for notation in dice_notations:
+            plan = compile_dice_expression(notation, DICE_STREAM_MAX_DICE) if statistics_only else None
+            plans.append(plan if plan is not None and plan.streamable else compile_dice_expression(notation))
+        # Plans fitting in one batch are cheaper in the fused draw than streamed on their own
+        streamed: List[bool] = [
+            statistics_only and plan.streamable and plan.dice_count > self.engine.batch_size for plan in plans
+        ]
+        results = iter(roll_plans(
+            [plan for plan, stream in zip(plans, streamed) if not stream], self.engine
+        ))
+        
+        stream_rows: List[Tuple[int, str, DicePlan]] = []
+        for i, (notation, plan) in enumerate(zip(dice_notations, plans)):
+            if streamed[i]:
+                stream_rows.append((i, notation, plan))
+                self.grid.SetCellValue(i, DICE_GRID_COLUMNS['NOTATION'], notation)
+                self.current_rolls = np.empty(0, dtype=np.uint8)
+                self.current_statistics = None
+                continue
+            result = next(results)
+            self.current_rolls = result.values
+            self.current_statistics = None
+            self.update_display(result.values, i)
+            self.update_result_columns(
+                i, notation, plan, result.total, result.mean, result.minimum, result.maximum
+            )
+        if stream_rows:
+            self.start_worker(stream_rows)
+
+    def update_result_columns(
+        self,
+        row: int,
+        notation: str,
+        plan: DicePlan,
+        total: Union[int, float],
+        average: float,
+        minimum: float,
+        maximum: float
+    ) -> None:
+        """Fill the summary columns of a rolled notation, formatted when painted.
+        
+        Args:
+            row: Grid row of the notation
+            notation: Dice notation as typed
+            plan: Compiled dice expression
+            total: Total of the roll
+            average: Mean roll
+            minimum: Lowest roll
+            maximum: Highest roll
+        """
+        self.results_table.set_row(row, {
+            DICE_GRID_COLUMNS['NOTATION']: notation,
+            DICE_GRID_COLUMNS['TOTAL']: lambda: f"{total:.2f}",
+            DICE_GRID_COLUMNS['AVERAGE']: lambda: f"{average:.2f}",
+            DICE_GRID_COLUMNS['MINMAX']: lambda: f"Min: {minimum:.2f} | Max: {maximum:.2f}",
+            DICE_GRID_COLUMNS['EXPECTED']: lambda: self.format_expectation(plan, total)
+        })
+
 def __del__(self) -> None:
     """Cleanup resources when the frame is destroyed."""
     if hasattr(self, 'grid') and self.grid:
@@ -0,0 +1,240 @@
+from typing import Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+import torch
+from .constants import COIN_DECODE_CHUNK, COIN_ENGINE_BATCH_SIZE
+from .roll_formatter import format_labels
+
+class AliasTable:
+    """Walker/Vose alias table for sampling k weighted outcomes in constant time.
+
+    The table is built once per distribution. Each sample then costs one
+    uniform draw: its integer part picks a column, its fractional part is
+    compared with the column threshold to choose between the column's own
+    outcome and its alias. Sampling is a handful of vectorized tensor
+    operations, whatever the number of outcomes.
+
+    Attributes:
+        probabilities (np.ndarray): Normalized outcome probabilities
+        thresholds (torch.Tensor): Per-column acceptance probabilities (float64)
+        aliases (torch.Tensor): Per-column alias outcomes (int64)
+        device (torch.device): Device used for sampling
+    """
+
+    def __init__(self, weights: Sequence[float], device: torch.device) -> None:
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim != 1 or len(weights) == 0:
+            raise ValueError("At least one outcome weight is required")
+        if not np.all(np.isfinite(weights)) or np.any(weights < 0):
+            raise ValueError("Outcome weights must be finite and non-negative")
+        total: float = float(weights.sum())
+        if total <= 0:
+            raise ValueError("At least one outcome weight must be positive")
+
+        self.device: torch.device = device
+        self.probabilities: np.ndarray = weights / total
+
+        # Vose's method: pair each under-full column with an over-full donor
+        size: int = len(weights)
+        scaled: np.ndarray = self.probabilities * size
+        thresholds: np.ndarray = np.ones(size, dtype=np.float64)
+        aliases: np.ndarray = np.arange(size, dtype=np.int64)
+        small: List[int] = [i for i in range(size) if scaled[i] < 1.0]
+        large: List[int] = [i for i in range(size) if scaled[i] >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            thresholds[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Leftovers are full columns up to rounding error
+        for index in small + large:
+            thresholds[index] = 1.0
+
+        self.thresholds: torch.Tensor = torch.from_numpy(thresholds).to(device)
+        self.aliases: torch.Tensor = torch.from_numpy(aliases).to(device)
+
+    def __len__(self) -> int:
+        return len(self.probabilities)
+
+    def sample(self, num_samples: int) -> torch.Tensor:
+        """Draw outcome indices from the distribution.
+
+        Args:
+            num_samples: Number of samples
+
+        Returns:
+            int64 tensor of outcome indices on the table's device
+        """
+        scaled = torch.rand(num_samples, dtype=torch.float64, device=self.device).mul_(len(self))
+        columns = scaled.long().clamp_(max=len(self) - 1)
+        accept = scaled.sub_(columns) < self.thresholds.index_select(0, columns)
+        return torch.where(accept, columns, self.aliases.index_select(0, columns))
+
+def parse_weights(text: str) -> Tuple[List[str], List[float]]:
+    """Parse weighted outcomes written as 'label:weight' entries separated by commas.
+
+    Entries without a label are named after their position ('1', '2', ...).
+
+    Args:
+        text: Outcome description, e.g. "Rouge:1, Vert:2, Bleu:3" or "1, 1, 2"
+
+    Returns:
+        Tuple of (outcome labels, outcome weights)
+
+    Raises:
+        ValueError: If an entry is empty or its weight is not a number
+    """
+    labels: List[str] = []
+    weights: List[float] = []
+    for position, entry in enumerate(text.split(','), start=1):
+        label, separator, weight = entry.rpartition(':')
+        label = label.strip() if separator else str(position)
+        try:
+            weights.append(float(weight))
+        except ValueError:
+            raise ValueError(f"Invalid outcome weight: {entry.strip()}") from None
+        if not label:
+            raise ValueError(f"Missing outcome label: {entry.strip()}")
+        labels.append(label)
+    return labels, weights
+
+class WeightedOutcomes:
+    """Results of a weighted k-outcome run.
+
+    Outcomes are kept as a compact index array (uint8 for up to 256
+    outcomes) next to their per-label totals. Counts-only runs keep the
+    totals alone. Exposes the counting interface of CoinBuffer (len, count,
+    decode, iteration over labels).
+
+    Attributes:
+        labels (List[str]): Outcome labels
+        probabilities (np.ndarray): Expected probability of each outcome
+        counts (np.ndarray): Number of draws of each outcome
+        indices (Optional[np.ndarray]): Outcome index of every draw, if kept
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        probabilities: np.ndarray,
+        counts: np.ndarray,
+        indices: Optional[np.ndarray] = None
+    ) -> None:
+        self.labels: List[str] = list(labels)
+        self.probabilities: np.ndarray = probabilities
+        self.counts: np.ndarray = counts
+        self.indices: Optional[np.ndarray] = indices
+
+    @classmethod
+    def from_indices(
+        cls,
+        labels: Sequence[str],
+        probabilities: np.ndarray,
+        indices: np.ndarray
+    ) -> 'WeightedOutcomes':
+        """Build results from outcome indices, counting them with a bincount."""
+        counts = np.bincount(indices, minlength=len(labels)).astype(np.int64)
+        return cls(labels, probabilities, counts, indices)
+
+    def count(self, value: str) -> int:
+        """Count occurrences of an outcome label, like list.count.
+
+        Labels may repeat (a custom die can carry the same face twice), so the
+        counts of every outcome with that label are added up.
+        """
+        return int(self.counts[np.asarray(self.labels, dtype=object) == value].sum())
+
+    def decode(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Return the labels of draws [start, stop)."""
+        if self.indices is None:
+            raise ValueError("Individual outcomes were not kept")
+        return np.asarray(self.labels, dtype=object)[self.indices[start:stop]].tolist()
+
+    def format_lines(self, start: int, stop: int, items_per_line: int) -> str:
+        """Format draws [start, stop) as lines of labels."""
+        if self.indices is None:
+            raise ValueError("Individual outcomes were not kept")
+        return format_labels(self.indices[start:stop], self.labels, items_per_line)
+
+    def __len__(self) -> int:
+        return int(self.counts.sum())
+
+    def __iter__(self) -> Iterator[str]:
+        for start in range(0, len(self), COIN_DECODE_CHUNK):
+            yield from self.decode(start, start + COIN_DECODE_CHUNK)
+
+    def __repr__(self) -> str:
+        return f"WeightedOutcomes(outcomes={len(self.labels)}, draws={len(self):,})"
+
+class WeightedOutcomeEngine:
+    """Draw weighted outcomes through an alias table, batch by batch.
+
+    Attributes:
+        labels (List[str]): Outcome labels
+        table (AliasTable): Alias table of the outcome weights
+        rng (np.random.Generator): Generator for counts-only runs
+    """
+
+    name: str = "alias"
+
+    def __init__(self, labels: Sequence[str], weights: Sequence[float], device: torch.device) -> None:
+        if len(labels) != len(weights):
+            raise ValueError("Each outcome needs exactly one weight")
+        self.labels: List[str] = list(labels)
+        self.table: AliasTable = AliasTable(weights, device)
+        self.rng: np.random.Generator = np.random.default_rng()
+
+    @property
+    def index_dtype(self) -> np.dtype:
+        """Smallest unsigned dtype able to hold every outcome index."""
+        return np.min_scalar_type(max(len(self.labels) - 1, 0))
+
+    def iter_batches(
+        self,
+        num_samples: int,
+        batch_size: int = COIN_ENGINE_BATCH_SIZE
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Draw outcomes batch by batch.
+
+        Args:
+            num_samples: Total number of draws
+            batch_size: Draws sampled per tensor operation
+
+        Yields:
+            Tuples of (compact outcome indices, number of draws of each outcome)
+        """
+        for start in range(0, num_samples, batch_size):
+            batch = self.table.sample(min(batch_size, num_samples - start))
+            counts = torch.bincount(batch, minlength=len(self.labels))
+            yield batch.cpu().numpy().astype(self.index_dtype), counts.cpu().numpy()
+
+    def sample(self, num_samples: int, batch_size: int = COIN_ENGINE_BATCH_SIZE) -> WeightedOutcomes:
+        """Draw outcomes, keeping every draw as a compact index array.
+
+        Args:
+            num_samples: Number of draws
+            batch_size: Draws sampled per tensor operation
+
+        Returns:
+            Drawn outcomes with their totals
+        """
+        indices: np.ndarray = np.empty(num_samples, dtype=self.index_dtype)
+        counts: np.ndarray = np.zeros(len(self.labels), dtype=np.int64)
+        start: int = 0
+        for batch, batch_counts in self.iter_batches(num_samples, batch_size):
+            indices[start:start + len(batch)] = batch
+            counts += batch_counts
+            start += len(batch)
+        return WeightedOutcomes(self.labels, self.table.probabilities, counts, indices)
+
+    def count(self, num_samples: int) -> WeightedOutcomes:
+        """Draw outcome totals only, from a single multinomial draw.
+
+        Args:
+            num_samples: Number of draws
+
+        Returns:
+            Outcome totals, without individual draws
+        """
+        counts = self.rng.multinomial(num_samples, self.table.probabilities).astype(np.int64)
+        return WeightedOutcomes(self.labels, self.table.probabilities, counts)
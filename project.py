@@ -1,4 +1,6 @@
 from coins_and_dices.__main__ import main
+from coins_and_dices.dice_distribution import plan_distribution
+from coins_and_dices.dice_expression import compile_dice_expression
 from datetime import datetime
 
 def track_game_history(game_type, result, metadata=None):
@@ -24,16 +26,32 @@ def calculate_odds(event_type, parameters):
     Calculate probability for specific game events
     Parameters:
         event_type (str): Type of probability to calculate ('dice' or 'coin')
-        parameters (dict): Event-specific parameters
+        parameters (dict): Event-specific parameters. For standard dice:
+            'target' (float): Total compared against
+            'sides' (float): Number of sides, 6 by default
+            'dice' (int): Number of dice summed, 1 by default
+            'notation' (str): Dice expression such as '2d6+3', replacing dice and sides
+            'comparison' (str): '<=' by default, or '>=', '>', '<', '=='
+        For coins:
+            'p' (float): Probability of 'Pile', 0.5 by default
+            'outcome' (str): Outcome to evaluate, 'Pile' by default
+            'weights' (dict): Weight of each outcome of a weighted draw, replacing the coin
     Returns:
         float: Probability of the specified event
     """
     if event_type == 'standard_dice':
-        target = parameters.get('target')
-        sides = parameters.get('sides', 6)
-        return target/sides
+        notation = parameters.get('notation') or f"{parameters.get('dice', 1)}d{parameters.get('sides', 6)}"
+        distribution = plan_distribution(compile_dice_expression(notation))
+        if distribution is None:
+            return 0.0
+        return distribution.probability(parameters.get('target'), parameters.get('comparison', '<='))
     elif event_type == 'coin':
-        return 0.5
+        weights = parameters.get('weights')
+        if weights:
+            total = sum(weights.values())
+            return weights.get(parameters.get('outcome'), 0) / total if total > 0 else 0.0
+        p = parameters.get('p', 0.5)
+        return 1 - p if parameters.get('outcome', 'Pile') == 'Face' else p
     return 0.0
 
 def generate_game_report(session_data):
@@ -1,13 +1,34 @@
 import torch
+import numpy as np
 from coins_and_dices.constants import *
 from coins_and_dices.custom_dice_frame import CustomDiceFrame
 from coins_and_dices.game_history import GameHistory
 from coins_and_dices.runebound_frame import DiceButtonHandler, FaceButtonHandler, RuneboundFrame
 from coins_and_dices.standard_dice_frame import StandardDiceFrame
+from coins_and_dices.dice_engine import DiceEngine, dice_dtype, sum_rolls
+from coins_and_dices.dice_expression import compile_dice_expression, roll_plans
+from coins_and_dices.dice_distribution import plan_distribution, plan_moments
+from coins_and_dices.dice_statistics import RollAccumulator, roll_statistics
+from coins_and_dices.dice_trials import DiceTrialsEngine
+from coins_and_dices.progressive_renderer import ProgressiveRenderer
+from coins_and_dices.roll_formatter import format_labels, format_numbers
 import wx
 import pytest
 from coins_and_dices.coin_frame import CoinFrame, ViewMode
+from coins_and_dices.coin_buffer import CoinBuffer
+from coins_and_dices.coin_analysis import analyze_runs
+from coins_and_dices.coin_walk import analyze_walk
+from coins_and_dices.coin_convergence import analyze_convergence
+from coins_and_dices.coin_patterns import find_pattern, parse_pattern
+from coins_and_dices.coin_trials import CoinTrialsEngine, TrialCounts, binomial_pmf
+from coins_and_dices.coin_worker import CoinFlipWorker, FlipCollector, TrialsCollector, WeightedCollector
+from coins_and_dices.coin_engine import COIN_ENGINES, BiasedCoinEngine, BinomialCoinEngine, CoinCounts, PackedCoinEngine
+from coins_and_dices.weighted_sampler import AliasTable, WeightedOutcomeEngine, WeightedOutcomes, parse_weights
 from datetime import datetime
+import queue
+import time
+import statistics
+import math
 from project import (
     track_game_history,
     calculate_odds,
@@ -138,6 +159,22 @@ def test_dice_gpu_operations(standard_dice_frame):
     assert len(float_roll) == 10
     assert all(isinstance(result, float) for result in float_roll)
 
+def test_exact_integer_dice(standard_dice_frame):
+    """Test integer dice are sampled exactly into the smallest dtype"""
+    assert dice_dtype(6).itemsize == 1
+    assert dice_dtype(1000).itemsize == 2
+    assert dice_dtype(int(MAX_SIDES)).itemsize == 4
+    
+    engine = DiceEngine(torch.device('cpu'), batch_size=1000)
+    rolls = engine.roll(30_000, 3)
+    assert rolls.dtype.itemsize == 1
+    assert sorted(set(rolls.tolist())) == [1, 2, 3]
+    huge = standard_dice_frame.roll_dice_gpu(1000, MAX_SIDES)
+    assert 1 <= huge.min() and huge.max() <= MAX_SIDES
+    # Totals accumulate in int64, far beyond the faces' dtype
+    assert sum_rolls(engine.roll(2000, 1)) == 2000
+    assert sum_rolls(huge) == sum(huge.tolist())
+
 def test_dice_view_modes(standard_dice_frame):
     """Test different view modes for dice results display"""
     test_rolls = [3, 4, 5, 6, 2, 1] * 10  # 60 rolls
@@ -168,6 +205,194 @@ def test_dice_view_modes(standard_dice_frame):
     assert 'Average:' in stats_display
     assert 'Median:' in stats_display
 
+def test_histogram_dice_statistics(standard_dice_frame):
+    """Test histogram statistics match the statistics module, exactly or within a bin"""
+    rolls = [3, 4, 4, 6, 2, 1, 4, 5]
+    stats = roll_statistics(rolls, torch.device('cpu'))
+    assert stats.mean == pytest.approx(statistics.mean(rolls))
+    assert stats.median == statistics.median(rolls)
+    assert stats.std == pytest.approx(statistics.stdev(rolls))
+    assert (stats.mode, stats.mode_count) == (4, 3)
+    assert stats.quantiles[0.25] == 2 and stats.quantiles[0.75] == 4
+    
+    # Wide ranges use selection: median and quantiles stay exact
+    wide = [1, 500_000_000, 1_000_000_000, 7, 999_999_999, 123_456_789]
+    selected = roll_statistics(wide, torch.device('cpu'), max_bins=1000)
+    assert selected.mean == pytest.approx(statistics.mean(wide))
+    assert selected.median == statistics.median(wide)
+    assert selected.quantiles[0.25] == 7 and selected.quantiles[0.99] == 1_000_000_000
+    assert roll_statistics([2.5, 0.5, 1.5, 9.0], torch.device('cpu')).median == 2.0
+
+def test_streaming_dice_statistics(standard_dice_frame):
+    """Test streamed batches give the same statistics as the kept rolls"""
+    device = torch.device('cpu')
+    plan = compile_dice_expression("50000d20")
+    rolls = []
+    accumulator = RollAccumulator(device)
+    for batch, score in plan.stream_batches(DiceEngine(device, batch_size=4096)):
+        rolls.append(batch.clone())
+        accumulator.update(batch, score)
+    total = plan.constant + accumulator.total
+    rolls = torch.cat(rolls).numpy()
+    streamed, kept = accumulator.result(), roll_statistics(rolls, device)
+    assert total == accumulator.total == int(rolls.sum(dtype='int64'))
+    assert streamed.mean == pytest.approx(kept.mean) and streamed.std == pytest.approx(kept.std)
+    assert (streamed.median, streamed.quantiles) == (kept.median, kept.quantiles)
+    
+    # Signs and success thresholds are scored on the device
+    signed = compile_dice_expression("5d1>=1-3d1+2")
+    assert signed.stream(DiceEngine(device), RollAccumulator(device, max_bins=2)) == 4
+    
+    # Values past max_bins keep the exact moments only
+    wide = RollAccumulator(device, max_bins=10)
+    wide.update(torch.tensor([1, 2, 3]))
+    wide.update(torch.tensor([40, 50]))
+    assert wide.result().median is None and wide.result().std == pytest.approx(statistics.stdev([1, 2, 3, 40, 50]))
+    
+    # Totals and the histogram range are read back at sync points, negative or fractional rolls included
+    lazy = RollAccumulator(device, max_bins=10, sync_batches=3)
+    lazy.update(torch.tensor([1, 2]))
+    lazy.update(torch.tensor([-4]))
+    assert lazy.total == -1 and lazy.result().median is None
+    halves = RollAccumulator(device, max_bins=10)
+    halves.update(torch.tensor([1.0, 2.0, 2.0]))
+    assert halves.result().median == 2.0
+    halves.update(torch.tensor([0.5]))
+    assert halves.total == 5.5 and halves.result().median is None
+
+def test_background_dice_stream(standard_dice_frame):
+    """Test streamed statistics run on the worker and fill their rows on the UI timer"""
+    count = DICE_BATCH_SIZE * 2 + 1
+    standard_dice_frame.view_mode.SetSelection(2)  # STATISTICS mode
+    standard_dice_frame.dice_input.SetValue(f"{count}d6>=4 2d6")
+    standard_dice_frame.on_roll_dice(wx.CommandEvent(wx.EVT_BUTTON.typeId))
+    assert standard_dice_frame.collector is not None
+    assert standard_dice_frame.cancel_btn.IsEnabled() and not standard_dice_frame.roll_btn.IsEnabled()
+    assert len(standard_dice_frame.current_rolls) == 2
+    
+    while standard_dice_frame.collector is not None:
+        standard_dice_frame.on_drain_timer(None)
+    
+    details = standard_dice_frame.grid.GetCellValue(0, DICE_GRID_COLUMNS['DETAILS'])
+    assert f"Total Rolls: {count:,}" in details
+    assert 0 < float(standard_dice_frame.grid.GetCellValue(0, DICE_GRID_COLUMNS['TOTAL'])) < count
+    assert standard_dice_frame.progress_gauge.GetValue() == COIN_PROGRESS_RANGE
+    assert standard_dice_frame.roll_btn.IsEnabled() and not standard_dice_frame.cancel_btn.IsEnabled()
+
+def test_fused_dice_rolls(standard_dice_frame):
+    """Test fused multi-notation rolls keep per-notation faces and summaries"""
+    engine = DiceEngine(torch.device('cpu'), batch_size=50)
+    notations = ["2d6", "30d8", "1d1e9", "4d6kh3", "40d20", "2d1.5", "3d4+2"]
+    results = roll_plans([compile_dice_expression(notation) for notation in notations], engine)
+    assert [len(result.values) for result in results] == [2, 30, 1, 3, 40, 2, 3]
+    for notation, result in zip(notations, results):
+        sides = float(notation.split("d")[1].split("k")[0].split("+")[0])
+        assert 1 <= result.minimum == result.values.min() <= result.maximum == result.values.max() <= math.ceil(sides)
+        assert result.mean == pytest.approx(result.values.mean())
+    assert results[6].total == int(results[6].values.sum()) + 2
+    
+    # Every face of mixed dice drawn together is reachable
+    faces = engine.sample_faces(torch.tensor([3, 5] * 5000))
+    assert set(faces[::2].tolist()) == {1, 2, 3} and set(faces[1::2].tolist()) == {1, 2, 3, 4, 5}
+
+def test_keep_dice_distribution(standard_dice_frame):
+    """Test keep-highest/lowest trials and their exact order-statistic distribution"""
+    advantage = plan_distribution(compile_dice_expression("2d20kh1"))
+    disadvantage = plan_distribution(compile_dice_expression("2d20kl1"))
+    for target in range(1, 21):
+        assert advantage.probability(target, '>=') == pytest.approx(1 - ((target - 1) / 20) ** 2)
+        assert disadvantage.probability(target, '>=') == pytest.approx(((21 - target) / 20) ** 2)
+    
+    plan = compile_dice_expression("4d6kh3")
+    distribution = plan_distribution(plan)
+    assert distribution.mean == pytest.approx(15869 / 1296)
+    assert distribution.probability(18, '==') == pytest.approx(21 / 1296)
+    assert plan_moments(plan)[0] == pytest.approx(distribution.mean)
+    
+    totals = plan.roll_totals(DiceEngine(torch.device('cpu'), batch_size=4096), 100_000)
+    assert len(totals) == 100_000 and 3 <= totals.min() and totals.max() <= 18
+    assert (totals >= 15).mean() == pytest.approx(distribution.probability(15, '>='), abs=0.01)
+
+def test_dice_trials(standard_dice_frame):
+    """Test repeated dice trials build a histogram of totals close to the exact distribution"""
+    engine = DiceTrialsEngine(torch.device('cpu'))
+    results = engine.run(compile_dice_expression("3d6"), 200_000)
+    assert (results.offset, len(results.histogram), results.histogram.sum()) == (3, 16, 200_000)
+    assert results.mean == pytest.approx(10.5, abs=0.05)
+    assert abs(results.histogram - results.expected).max() < 0.01 * 200_000
+    
+    # Negative totals shift the histogram; fractional totals cannot be counted
+    mixed = engine.run(compile_dice_expression("1d4-1d6"), 10_000)
+    assert -5 <= mixed.minimum <= mixed.offset + len(mixed.histogram) - 1 <= 3
+    assert mixed.sum == int((mixed.totals * mixed.histogram).sum())
+    with pytest.raises(ValueError):
+        engine.run(compile_dice_expression("2d1.5"), 10)
+
+def test_roll_formatter(standard_dice_frame):
+    """Test the vectorized formatter reads exactly like joining values one by one"""
+    def join(values, per_line, fmt=str):
+        return "\n".join(' → '.join(map(fmt, values[i:i + per_line])) for i in range(0, len(values), per_line))
+    
+    for values in (
+        torch.randint(1, 7, (1000,), dtype=torch.uint8),
+        torch.randint(-10**12, 10**12, (1000,)),
+        torch.tensor([0, 9, 10, 99, 100, 10**9, -1, -10**15])
+    ):
+        values = values.numpy()
+        assert format_numbers(values, 7) == join(values.tolist(), 7)
+    floats = (torch.rand(1000, dtype=torch.float64) * 2000 - 1000).floor().numpy() + 0.25
+    assert format_numbers(floats, 30) == join(floats.tolist(), 30, lambda x: f"{x:.2f}")
+    assert format_numbers(floats[:0], 30) == ""
+    
+    codes = torch.randint(0, 3, (100,), dtype=torch.uint8).numpy()
+    labels = ['Rouge', 'Vert', 'Bleu']
+    assert format_labels(codes, labels, 12) == join([labels[code] for code in codes.tolist()], 12)
+    buffer = CoinBuffer.from_bits(codes % 2)
+    assert buffer.format_lines(3, 50, 12) == join(buffer.decode(3, 50), 12)
+
+def test_dice_rolls_renderer(standard_dice_frame):
+    """Test Full mode rolls are rendered on timer ticks without dropping any batch"""
+    standard_dice_frame.grid.AppendRows(2)
+    rolls = standard_dice_frame.roll_dice_gpu(50_000, 6)
+    standard_dice_frame.display_results_progressively(rolls, 0)
+    assert standard_dice_frame.rolls_renderer.is_running()
+    
+    # Another row is queued behind the first one instead of completing it
+    standard_dice_frame.display_results_progressively(rolls[:RENDER_SYNC_LIMIT + 1], 1)
+    assert standard_dice_frame.rolls_renderer.is_running()
+    assert standard_dice_frame.grid.GetCellValue(1, DICE_GRID_COLUMNS['DETAILS']) == ''
+    standard_dice_frame.rolls_renderer.finish()
+    assert standard_dice_frame.grid.GetCellValue(0, DICE_GRID_COLUMNS['DETAILS']) == \
+        standard_dice_frame.format_rolls_display(rolls)
+    details = standard_dice_frame.grid.GetCellValue(1, DICE_GRID_COLUMNS['DETAILS'])
+    assert len(details.replace('\n', ' → ').split(' → ')) == RENDER_SYNC_LIMIT + 1
+    assert not standard_dice_frame.rolls_renderer.is_running()
+
+def test_dice_results_table(standard_dice_frame):
+    """Test result rows are formatted on demand, once, and only when read"""
+    table = standard_dice_frame.results_table
+    calls = []
+    
+    def details():
+        calls.append(1)
+        return "1 → 2"
+    
+    standard_dice_frame.grid.AppendRows(3)
+    table.set_row(2, {DICE_GRID_COLUMNS['NOTATION']: "2d6", DICE_GRID_COLUMNS['DETAILS']: details})
+    assert calls == []
+    assert standard_dice_frame.grid.GetCellValue(2, DICE_GRID_COLUMNS['DETAILS']) == "1 → 2"
+    assert standard_dice_frame.grid.GetCellValue(2, DICE_GRID_COLUMNS['DETAILS']) == "1 → 2"
+    assert calls == [1]
+    
+    # Rolling thousands of notations fills every row without formatting them
+    standard_dice_frame.view_mode.SetSelection(0)
+    standard_dice_frame.dice_input.SetValue(" ".join(f"{i % 9 + 1}d{i % 97 + 2}" for i in range(5000)))
+    standard_dice_frame.on_roll_dice(None)
+    assert standard_dice_frame.grid.GetNumberRows() == 5000
+    assert callable(table.rows[4999][DICE_GRID_COLUMNS['EXPECTED']])
+    assert standard_dice_frame.grid.GetCellValue(4999, DICE_GRID_COLUMNS['NOTATION']) == "5d54"
+    assert standard_dice_frame.grid.GetCellValue(4999, DICE_GRID_COLUMNS['DETAILS']).count('→') == 4
+
 def test_validate_dice_input(standard_dice_frame):
     """Test dice notation validation including scientific notation"""
     # Existing valid cases
@@ -195,6 +420,44 @@ def test_parse_dice_notation(standard_dice_frame):
     assert standard_dice_frame.parse_dice_notation("d20") is None
     assert standard_dice_frame.parse_dice_notation("2d") is None
 
+def test_dice_expression(standard_dice_frame):
+    """Test compiled dice expressions with modifiers, keeps and success counts"""
+    assert compile_dice_expression("4d6kh3") is compile_dice_expression("4d6kh3")  # Cached plan
+    engine = DiceEngine(torch.device('cpu'))
+    
+    assert compile_dice_expression("3d1+2").roll(engine).total == 5
+    assert compile_dice_expression("2d1-1d1+4").roll(engine).total == 5
+    kept = compile_dice_expression("4d1kh2").roll(engine)
+    assert len(kept.values) == 2 and kept.total == 2
+    assert compile_dice_expression("5d1>=1").roll(engine).total == 5
+    exploded = compile_dice_expression("50d2!").roll(engine)
+    assert len(exploded.values) == 50 and exploded.total == sum(exploded.values.tolist())
+    
+    with pytest.raises(ValueError):
+        compile_dice_expression("2d6kh3")
+    assert standard_dice_frame.validate_dice_notation("2d8+1d4+2")
+    assert not standard_dice_frame.validate_dice_notation("1d1!")
+    assert standard_dice_frame.parse_dice_notation("2d6+1") is None
+
+def test_exact_dice_distribution(standard_dice_frame):
+    """Test exact sum distributions of mixed dice against closed forms"""
+    three_d6 = plan_distribution(compile_dice_expression("3d6"))
+    assert (three_d6.offset, len(three_d6)) == (3, 16)
+    assert three_d6.probability(18, '>=') == pytest.approx(1 / 216)
+    assert three_d6.probability(10, '<=') == pytest.approx(0.5)
+    
+    # Large enough for the FFT path
+    large = plan_distribution(compile_dice_expression("1000d20+5"))
+    assert large.pmf.sum() == pytest.approx(1.0)
+    assert large.mean == pytest.approx(10_505.0)
+    assert large.variance == pytest.approx(1000 * (20 ** 2 - 1) / 12)
+    mixed = compile_dice_expression("2d6-1d4+3")
+    assert plan_moments(mixed) == pytest.approx((plan_distribution(mixed).mean, plan_distribution(mixed).variance))
+    
+    standard_dice_frame.dice_input.SetValue("3d6")
+    standard_dice_frame.on_roll_dice(wx.CommandEvent(wx.EVT_BUTTON.typeId))
+    assert 'Expected: 10.50' in standard_dice_frame.grid.GetCellValue(0, DICE_GRID_COLUMNS['EXPECTED'])
+
 def test_roll_dice(standard_dice_frame):
     """Test dice rolling functionality"""
     # Test single die
@@ -301,6 +564,24 @@ def test_custom_dice_gpu_operations(custom_dice_frame):
     assert len(large_results) == 1000
     assert all(result in test_dice['values'] for result in large_results)
 
+def test_custom_dice_compact_indices(custom_dice_frame):
+    """Test custom dice keep compact face indices and resolve labels only for display"""
+    custom_dice_frame.custom_dices['test_dice'] = {'faces': 3, 'values': ['A', 'B', 'C']}
+    results = custom_dice_frame.roll_custom_dice('test_dice', 100_000)
+    assert isinstance(results, WeightedOutcomes) and results.indices.dtype == 'uint8'
+    assert int(results.indices.max()) <= 2
+    assert results.count('A') == pytest.approx(100_000 / 3, rel=0.05)
+    assert results.format_lines(0, 5, 1) == "\n".join(results.decode(0, 5))
+    
+    custom_dice_frame.custom_dices['wide_dice'] = {'faces': 300, 'values': [str(i) for i in range(300)]}
+    assert custom_dice_frame.roll_custom_dice('wide_dice', 10).indices.dtype == 'uint16'
+    
+    # Repeated faces count every index carrying the label
+    indices = np.array([0, 1, 1, 2], dtype=np.uint8)
+    repeated = WeightedOutcomes.from_indices(['A', 'A', 'B'], np.full(3, 1 / 3), indices)
+    assert (repeated.count('A'), repeated.count('B'), repeated.count('C')) == (3, 1, 0)
+    assert repeated.count('A') == repeated.decode().count('A')
+
 def test_virtual_display_mode(custom_dice_frame):
     """Test virtual display mode for large result sets"""
     test_results = ['A', 'B', 'C'] * 1000  # 3000 results
@@ -462,6 +743,58 @@ def test_progressive_display(coin_frame):
     assert 'First' in virtual_display
     assert '[... ' in virtual_display and ' flips ...]' in virtual_display
 
+def test_progressive_sequence_renderer(coin_frame):
+    """Test large sequences are rendered block by block without losing lines"""
+    results = CoinBuffer.from_bits([1, 0] * RENDER_SYNC_LIMIT)
+    coin_frame.handle_sequence_display(results, 0)
+    assert coin_frame.sequence_renderer.is_running()
+
+    coin_frame.sequence_renderer.finish()
+    assert not coin_frame.sequence_renderer.is_running()
+    lines = coin_frame.grid.GetCellValue(0, GRID_COLUMNS['DETAILS']).split('\n')
+    assert len(lines) == -(-len(results) // ITEMS_PER_LINE)
+    assert lines[0] == ' → '.join(['Pile', 'Face'] * (ITEMS_PER_LINE // 2))
+
+def test_renderer_spaces_out_slow_redraws(coin_frame):
+    """Test redraws slower than a frame are spaced out and skip the frames they overran"""
+    renderer = ProgressiveRenderer(coin_frame, budget=0.001)
+    drawn = []
+    
+    def blocks():
+        for i in range(300):
+            time.sleep(0.0002)
+            yield str(i)
+    
+    def draw(text):
+        drawn.append(text)
+        time.sleep(0.005)
+    
+    renderer.start(blocks(), draw)
+    ticks = 0
+    while renderer.is_running():
+        renderer._on_tick(None)
+        ticks += 1
+    assert drawn[-1] == '\n'.join(str(i) for i in range(300))
+    assert len(drawn) < ticks / 2
+
+def test_virtual_sequence_table(coin_frame):
+    """Test large Full-mode sequences are browsable through the virtual table"""
+    results = CoinBuffer.from_bits([1, 0, 0] * 10_000)
+    coin_frame.view_mode.SetSelection(0)  # FULL mode
+    coin_frame.update_display(results, 0)
+    wx.Yield()
+    
+    table = coin_frame.sequence_table
+    assert coin_frame.sequence_grid.IsShown()
+    assert table.GetNumberRows() == 30_000 // ITEMS_PER_LINE
+    assert table.GetValue(0, 0) == ' → '.join(['Pile', 'Face', 'Face'] * (ITEMS_PER_LINE // 3))
+    assert 'Total flips: 30,000' in coin_frame.grid.GetCellValue(0, GRID_COLUMNS['DETAILS'])
+    
+    # Other modes hide the sequence view
+    coin_frame.view_mode.SetSelection(1)  # SAMPLE mode
+    coin_frame.update_display(results, 0)
+    assert not coin_frame.sequence_grid.IsShown()
+
 def test_statistical_summary(coin_frame):
     """Test statistical summary generation and display"""
     test_results = ['Pile'] * 60 + ['Face'] * 40  # 60% Pile, 40% Face
@@ -475,6 +808,115 @@ def test_statistical_summary(coin_frame):
     assert '40.00%' in summary  # Face percentage
     assert 'Ratio Pile/Face: 1.500' in summary
 
+def test_coin_buffer_packing():
+    """Test bit-packed coin results behave like a list of labels"""
+    flips = ['Pile', 'Face', 'Pile', 'Pile', 'Face', 'Face', 'Pile', 'Face', 'Pile', 'Face', 'Face']
+    buffer = CoinBuffer.from_sequence(flips)
+    
+    assert len(buffer) == len(flips)
+    assert list(buffer) == flips
+    assert buffer.count('Pile') == flips.count('Pile')
+    assert buffer.count('Face') == flips.count('Face')
+    assert buffer[3] == flips[3] and buffer[-1] == flips[-1]
+    assert list(buffer[3:10]) == flips[3:10]
+    assert buffer.decode(8) == flips[8:]
+    assert buffer.nbytes == 2
+    
+    # Large buffers use one bit per flip
+    results = CoinBuffer.from_bits([1, 0] * 500_000)
+    assert results.nbytes == 125_000
+    assert results.piles == 500_000
+
+def test_coin_engines():
+    """Test every coin engine returns packed flips with exact pile counts"""
+    device = torch.device('cpu')
+    for engine_class in COIN_ENGINES.values():
+        engine = engine_class(device)
+        for num_coins in [1, 7, 64, 65, 100_003]:
+            results = engine.flip(num_coins)
+            assert len(results) == num_coins
+            assert results.piles == int(results.bits().sum())
+    
+    # 64 flips per random word should stay fair
+    results = PackedCoinEngine(device).flip(1_000_000)
+    assert abs(results.piles / len(results) - 0.5) < 0.01
+
+def test_run_length_analysis(coin_frame):
+    """Test run-length statistics, including runs crossing chunk boundaries"""
+    flips = ['Pile'] * 3 + ['Face'] + ['Pile'] * 5 + ['Face'] * 2 + ['Pile']
+    runs = analyze_runs(CoinBuffer.from_sequence(flips), chunk_size=4)
+    
+    assert runs.runs == 5
+    assert runs.longest('Pile') == 5
+    assert runs.longest('Face') == 2
+    assert list(runs.histograms['Pile'][1:]) == [1, 0, 1, 0, 1]
+    assert list(runs.histograms['Face'][1:]) == [1, 1]
+    # 9 Piles, 3 Faces: 2 * 9 * 3 / 12 + 1 expected runs
+    assert runs.expected_runs == 5.5
+    
+    summary = coin_frame.generate_statistical_summary(flips)
+    assert '--- Runs ---' in summary
+    assert 'Longest Pile run: 5' in summary
+
+def test_random_walk_analysis(coin_frame):
+    """Test random-walk statistics carry the position across chunk boundaries"""
+    # Positions: 1 2 1 0 -1 -2 -1 0 1 2 3
+    flips = ['Pile', 'Pile', 'Face', 'Face', 'Face', 'Face', 'Pile', 'Pile', 'Pile', 'Pile', 'Pile']
+    walk = analyze_walk(CoinBuffer.from_sequence(flips), levels=[3, -2, -5], chunk_size=4)
+    
+    assert walk.steps == 11
+    assert walk.position == 3
+    assert (walk.maximum, walk.maximum_step) == (3, 11)
+    assert (walk.minimum, walk.minimum_step) == (-2, 6)
+    assert walk.returns_to_zero == 2
+    assert walk.first_passages == {3: 11, -2: 6, -5: None}
+    assert walk.path[0] == 0 and walk.path[-1] == 3
+    
+    coin_frame.view_mode.SetSelection(3)  # RANDOM WALK mode
+    coin_frame.update_display(flips, 0)
+    walk_display = coin_frame.grid.GetCellValue(0, GRID_COLUMNS['DETAILS'])
+    assert 'Final position: +3' in walk_display
+    assert 'Returns to zero: 2' in walk_display
+
+def test_convergence_series(coin_frame):
+    """Test the downsampled running proportion keeps bucket extremes across chunks"""
+    # Running proportions: 1 1/2 2/3 3/4 3/5 1/2 4/7
+    flips = ['Pile', 'Face', 'Pile', 'Pile', 'Face', 'Face', 'Pile']
+    series = analyze_convergence(CoinBuffer.from_sequence(flips), points=3, chunk_size=2)
+    
+    assert list(series.steps) == [3, 6, 7]
+    assert list(series.proportion) == pytest.approx([2/3, 1/2, 4/7])
+    assert list(series.low) == pytest.approx([1/2, 1/2, 4/7])
+    assert list(series.high) == pytest.approx([1, 3/4, 4/7])
+    assert (series.total, series.piles) == (7, 4)
+    
+    coin_frame.view_mode.SetSelection(4)  # CONVERGENCE mode
+    coin_frame.update_display(flips, 0)
+    assert coin_frame.plot_panel.IsShown()
+    assert 'Final proportion: 0.571429' in coin_frame.grid.GetCellValue(0, GRID_COLUMNS['DETAILS'])
+
+def test_pattern_search(coin_frame):
+    """Test pattern counts across chunk boundaries, with and without overlaps"""
+    assert list(parse_pattern('P{3}f')) == [1, 1, 1, 0]
+    with pytest.raises(ValueError):
+        parse_pattern('PXF')
+    
+    results = CoinBuffer.from_sequence(['Pile'] * 5 + ['Face'] + ['Pile'] * 3)
+    overlapping = find_pattern(results, parse_pattern('PP'), chunk_size=2)
+    assert overlapping.count == 6
+    assert list(overlapping.positions) == [0, 1, 2, 3, 6, 7]
+    non_overlapping = find_pattern(results, parse_pattern('PP'), overlapping=False, chunk_size=2)
+    assert non_overlapping.count == 3
+    assert list(non_overlapping.positions) == [0, 2, 6]
+    # Fair coin, 'PP' has borders 2 and 1: 9 / (4 + 2) expected restarts
+    assert non_overlapping.expected == 1.5
+    
+    coin_frame.current_results = results
+    coin_frame.pattern_input.SetValue('PPF')
+    coin_frame.on_search_pattern(wx.CommandEvent(wx.EVT_BUTTON.typeId))
+    assert 'Overlapping matches: 1' in coin_frame.pattern_result.GetValue()
+    assert 'Positions: 4' in coin_frame.pattern_result.GetValue()
+
 def test_handle_flip_coins_enhanced(coin_frame):
     """Test enhanced coin flip handling with metadata tracking and GPU processing"""
     coin_frame.coin_input.SetValue(50)
@@ -498,6 +940,170 @@ def test_handle_flip_coins_enhanced(coin_frame):
     faces = int(total_text.split('\n')[1].split(': ')[1])
     assert piles + faces == 50
 
+def test_counts_only_engine():
+    """Test the binomial engine handles huge runs without generating flips"""
+    engine = BinomialCoinEngine(torch.device('cpu'))
+    assert not hasattr(engine, 'iter_batches') and not hasattr(engine, 'flip')
+    counts = engine.count(10**12)
+    assert len(counts) == 10**12
+    assert counts.piles + counts.faces == 10**12
+    assert abs(counts.piles / 10**12 - 0.5) < 1e-4
+
+def test_weighted_sampling():
+    """Test biased coin words and alias-table sampling of weighted outcomes"""
+    device = torch.device('cpu')
+    table = AliasTable([1, 2, 3, 0, 4], device)
+    frequencies = torch.bincount(table.sample(1_000_000), minlength=5).double() / 1_000_000
+    assert torch.allclose(frequencies, torch.tensor([0.1, 0.2, 0.3, 0.0, 0.4], dtype=torch.float64), atol=0.005)
+    
+    results = BiasedCoinEngine(device, p=0.8).flip(100_003)
+    assert results.piles == int(results.bits().sum())
+    assert abs(results.piles / len(results) - 0.8) < 0.01
+    for p in (0.0, 0.3, 1.0):
+        assert abs(BiasedCoinEngine(device, p).count(1_000_000).piles / 1_000_000 - p) < 0.005
+    
+    labels, weights = parse_weights("Rouge:1, Vert:3")
+    outcomes = WeightedOutcomeEngine(labels, weights, device).sample(1000)
+    assert labels == ['Rouge', 'Vert'] and weights == [1.0, 3.0]
+    assert outcomes.indices.dtype.itemsize == 1  # Compact indices
+    assert outcomes.count('Rouge') + outcomes.count('Vert') == len(outcomes) == 1000
+    assert set(outcomes.decode(0, 10)) <= {'Rouge', 'Vert'}
+    with pytest.raises(ValueError):
+        parse_weights("Rouge:un")
+
+def test_weighted_outcomes_display(coin_frame):
+    """Test the coin frame draws weighted outcomes and compares them to their odds"""
+    coin_frame.view_mode.SetSelection(2)  # STATISTICS mode
+    coin_frame.coin_input.SetValue(500)
+    coin_frame.weights_input.SetValue("A:1, B:1, C:2")
+    coin_frame.handle_flip_coins(wx.CommandEvent(wx.EVT_BUTTON.typeId))
+    
+    assert isinstance(coin_frame.current_results, WeightedOutcomes)
+    assert coin_frame.grid.GetCellValue(0, GRID_COLUMNS['NOTATION']) == "500 tirages"
+    summary = coin_frame.grid.GetCellValue(0, GRID_COLUMNS['DETAILS'])
+    assert 'Total Draws: 500' in summary
+    assert 'expected 50.00%' in summary
+    assert 'Chi-square:' in summary
+
+def test_coin_trials():
+    """Test k coins × T trials reduce to a histogram matching the binomial PMF"""
+    device = torch.device('cpu')
+    for p in [0.5, 0.3]:
+        for coins in [20, 65]:
+            results = CoinTrialsEngine(device, p).run(coins, 100_000, batch_flips=1 << 16)
+            assert len(results.histogram) == coins + 1
+            assert results.histogram.sum() == 100_000
+            assert results.piles + results.faces == coins * 100_000
+            assert abs(results.mean - coins * p) < 0.05 * coins * p
+    
+    pmf = binomial_pmf(4, 0.5)
+    assert list(pmf * 16) == pytest.approx([1, 4, 6, 4, 1])
+
+def test_coin_trials_display(coin_frame):
+    """Test repetitions switch the coin frame to a plotted trials histogram"""
+    coin_frame.coin_input.SetValue(20)
+    coin_frame.trials_input.SetValue(10_000)
+    coin_frame.handle_flip_coins(wx.CommandEvent(wx.EVT_BUTTON.typeId))
+    
+    assert isinstance(coin_frame.current_results, TrialCounts)
+    assert coin_frame.grid.GetCellValue(0, GRID_COLUMNS['NOTATION']) == "20 pièces × 10,000"
+    assert coin_frame.plot_panel.IsShown()
+    assert 'Trials: 10,000 × 20 coins' in coin_frame.grid.GetCellValue(0, GRID_COLUMNS['DETAILS'])
+
+def test_statistics_mode_uses_counts(coin_frame):
+    """Test statistics mode switches to the counts-only engine"""
+    coin_frame.view_mode.SetSelection(2)  # STATISTICS mode
+    coin_frame.coin_input.SetValue(1000)
+    coin_frame.coin_scale.SetSelection(COIN_SCALES.index(1_000_000))
+    coin_frame.handle_flip_coins(wx.CommandEvent(wx.EVT_BUTTON.typeId))
+    
+    assert isinstance(coin_frame.current_results, CoinCounts)
+    assert len(coin_frame.current_results) == 10**9
+    assert 'Total Flips: 1,000,000,000' in coin_frame.grid.GetCellValue(0, GRID_COLUMNS['DETAILS'])
+    event = GameHistory.get_instance().get_history()[-1]
+    assert event['metadata']['counts_only']
+
+def test_flip_worker_cancel():
+    """Test the background worker analyses batches, posts summaries and stops on cancel"""
+    result_queue = queue.Queue(maxsize=COIN_WORKER_QUEUE_SIZE)
+    collector = FlipCollector(10**9, keep_flips=False, analyze_runs=True)
+    summaries = []
+    collector.summary = lambda: summaries.append(FlipCollector.summary(collector)) or summaries[-1]
+    worker = CoinFlipWorker(PackedCoinEngine(torch.device('cpu')), collector, result_queue, batch_size=1 << 16)
+    worker.start()
+    
+    kind, payload = result_queue.get(timeout=5)
+    assert kind == 'progress'
+    assert isinstance(payload, CoinCounts) and 0 < len(payload) < 10**9
+    
+    # Summaries are skipped, not even built, while the consumer falls behind
+    time.sleep(0.2)
+    assert result_queue.full() and worker.is_alive()
+    assert len(summaries) <= COIN_WORKER_QUEUE_SIZE + 1 < collector.flips_done >> 16
+    worker.cancel()
+    
+    messages = [result_queue.get(timeout=5)]
+    while messages[-1][0] != 'done':
+        messages.append(result_queue.get(timeout=5))
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert messages[-1] == ('done', True)
+    
+    kind, (results, runs, walk, convergence) = messages[-2]
+    assert kind == 'result'
+    assert isinstance(results, CoinCounts) and 0 < len(results) < 10**9
+    assert runs.total == len(results)
+    assert walk is None and convergence is None
+
+def test_background_flip_run(coin_frame):
+    """Test large runs go through the worker and finish on the UI timer"""
+    num_coins = COIN_WORKER_THRESHOLD + 1000
+    coin_frame.view_mode.SetSelection(1)  # SAMPLE mode
+    coin_frame.coin_input.SetValue(num_coins)
+    coin_frame.handle_flip_coins(wx.CommandEvent(wx.EVT_BUTTON.typeId))
+    assert coin_frame.collector is not None
+    assert coin_frame.cancel_btn.IsEnabled()
+    
+    while coin_frame.collector is not None:
+        coin_frame.on_drain_timer(None)
+    
+    assert len(coin_frame.current_results) == num_coins
+    assert coin_frame.progress_gauge.GetValue() == COIN_PROGRESS_RANGE
+    assert not coin_frame.cancel_btn.IsEnabled()
+
+def test_background_trials_run(coin_frame):
+    """Test large trial runs go through the worker instead of blocking the UI"""
+    trials = COIN_WORKER_THRESHOLD // 100 + 1
+    coin_frame.coin_input.SetValue(100)
+    coin_frame.trials_input.SetValue(trials)
+    coin_frame.handle_flip_coins(wx.CommandEvent(wx.EVT_BUTTON.typeId))
+    assert isinstance(coin_frame.collector, TrialsCollector)
+    
+    while coin_frame.collector is not None:
+        coin_frame.on_drain_timer(None)
+    
+    assert isinstance(coin_frame.current_results, TrialCounts)
+    assert coin_frame.current_results.trials == trials
+    assert coin_frame.current_results.histogram.sum() == trials
+    assert coin_frame.progress_gauge.GetValue() == COIN_PROGRESS_RANGE
+
+def test_background_weighted_run(coin_frame):
+    """Test large weighted draws go through the worker and keep every draw"""
+    num_draws = COIN_WORKER_THRESHOLD + 1000
+    coin_frame.view_mode.SetSelection(1)  # SAMPLE mode
+    coin_frame.coin_input.SetValue(num_draws)
+    coin_frame.weights_input.SetValue("A:1, B:1, C:2")
+    coin_frame.handle_flip_coins(wx.CommandEvent(wx.EVT_BUTTON.typeId))
+    assert isinstance(coin_frame.collector, WeightedCollector)
+    
+    while coin_frame.collector is not None:
+        coin_frame.on_drain_timer(None)
+    
+    results = coin_frame.current_results
+    assert isinstance(results, WeightedOutcomes) and len(results) == len(results.indices) == num_draws
+    assert results.counts.tolist() == np.bincount(results.indices, minlength=3).tolist()
+    assert coin_frame.progress_gauge.GetValue() == COIN_PROGRESS_RANGE
+
 def test_coin_input_limits(coin_frame):
     """Test spin control limits"""
     coin_frame.coin_input.SetValue(COIN_MIN_COUNT)
@@ -628,8 +1234,13 @@ def test_history_statistics():
 def test_calculate_odds():
     # Test standard dice odds
     assert calculate_odds('standard_dice', {'target': 1, 'sides': 6}) == 1/6
+    assert calculate_odds('standard_dice', {'target': 7, 'dice': 2, 'comparison': '=='}) == pytest.approx(1/6)
+    assert calculate_odds('standard_dice', {'notation': '3d6', 'target': 18, 'comparison': '>='}) == pytest.approx(1/216)
     # Test coin odds
     assert calculate_odds('coin', {}) == 0.5
+    assert calculate_odds('coin', {'p': 0.7}) == 0.7
+    assert abs(calculate_odds('coin', {'p': 0.7, 'outcome': 'Face'}) - 0.3) < 1e-12
+    assert calculate_odds('coin', {'weights': {'Rouge': 1, 'Vert': 3}, 'outcome': 'Vert'}) == 0.75
     # Test invalid game type
     assert calculate_odds('invalid_type', {}) == 0.0
 